@@ -1,9 +1,21 @@
+from pathlib import Path
+
 from django.conf import settings
 
 
 def pytest_configure():
     templates = [
-        {"BACKEND": "django.template.backends.django.DjangoTemplates", "DIRS": [],}
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [str(Path(__file__).parent / "tests")],
+        }
     ]
 
-    settings.configure(TEMPLATES=templates, ROOT_URLCONF="django_unicorn.urls")
+    settings.configure(
+        TEMPLATES=templates,
+        ROOT_URLCONF="django_unicorn.urls",
+        INSTALLED_APPS=["tests"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+    )
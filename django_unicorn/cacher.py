@@ -0,0 +1,556 @@
+import hashlib
+import logging
+import pickle
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Type
+
+import orjson
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db.models import QuerySet
+from django.utils.module_loading import import_string
+
+from .settings import get_setting
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CONSTRUCTED_VIEWS_CACHE_BACKEND = "django_unicorn.cacher.LRUCache"
+
+
+class LRUCache:
+    """
+    In-memory cache that evicts the least recently used entries.
+
+    Args:
+        param max_entries: Maximum number of entries. `None` for no limit.
+        param ttl: Seconds an entry can go unused before it expires. `None` for no limit.
+        param max_memory: Approximate maximum memory in bytes used by the entries.
+            `None` for no limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1000,
+        ttl: Optional[float] = None,
+        max_memory: Optional[int] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_memory = max_memory
+
+        # key -> (value, last accessed timestamp, approximate size)
+        self._entries: OrderedDict = OrderedDict()
+        self._memory = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = {"max_entries": 0, "ttl": 0, "max_memory": 0}
+
+    def get(self, key: str, default=None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            (value, last_accessed, size) = entry
+            now = time.monotonic()
+
+            if self._is_expired(last_accessed, now):
+                self._remove(key, "ttl")
+                self.misses += 1
+                return default
+
+            self._entries[key] = (value, now, size)
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            size = self._get_size(value) if self.max_memory else 0
+            self._entries[key] = (value, time.monotonic(), size)
+            self._memory += size
+
+            self._evict()
+
+    def pop(self, key: str, default=None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+
+            value = self._entries[key][0]
+            self._remove(key)
+
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            return entry is not None and not self._is_expired(
+                entry[1], time.monotonic()
+            )
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, default=self)
+
+        if value is self:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistics that help with sizing the cache.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory": self._memory,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": dict(self.evictions),
+            }
+
+    def _is_expired(self, last_accessed: float, now: float) -> bool:
+        return self.ttl is not None and now - last_accessed > self.ttl
+
+    def _remove(self, key: str, reason: Optional[str] = None) -> None:
+        (_, _, size) = self._entries.pop(key)
+        self._memory -= size
+
+        if reason:
+            self.evictions[reason] += 1
+
+    def _evict(self) -> None:
+        """
+        Removes expired entries and then the least recently used entries until the
+        cache is within its limits. The least recently used entries are at the front.
+        """
+        if self.ttl is not None:
+            now = time.monotonic()
+
+            for (key, (_, last_accessed, _)) in list(self._entries.items()):
+                if not self._is_expired(last_accessed, now):
+                    break
+
+                self._remove(key, "ttl")
+
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)), "max_entries")
+
+        if self.max_memory is not None:
+            while self._memory > self.max_memory and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)), "max_memory")
+
+    @staticmethod
+    def _get_size(value: Any) -> int:
+        """
+        Approximates the memory used by a value. Only looks at the value's attributes
+        and not any further, so it is cheap enough to call on every insert.
+        """
+        size = sys.getsizeof(value)
+
+        for attribute_value in getattr(value, "__dict__", {}).values():
+            size += sys.getsizeof(attribute_value)
+
+        return size
+
+
+def create_constructed_views_cache():
+    """
+    Creates the cache for constructed components based on the `CONSTRUCTED_VIEWS_CACHE`
+    setting, e.g.
+
+    UNICORN = {
+        "CONSTRUCTED_VIEWS_CACHE": {
+            "BACKEND": "django_unicorn.cacher.LRUCache",
+            "MAX_ENTRIES": 1000,
+            "TTL": 60 * 60,
+            "MAX_MEMORY": 50 * 1024 * 1024,
+        }
+    }
+
+    The backend gets the other keys as lower-cased keyword arguments.
+    """
+    config = get_setting("CONSTRUCTED_VIEWS_CACHE", {})
+    backend = config.get("BACKEND", DEFAULT_CONSTRUCTED_VIEWS_CACHE_BACKEND)
+    options = {
+        key.lower(): value for (key, value) in config.items() if key != "BACKEND"
+    }
+
+    return import_string(backend)(**options)
+
+
+# Bump when the format of the stored component state changes
+STATE_FORMAT_VERSION = 1
+
+# Attributes that are specific to a request or get re-created when a component is constructed
+STATE_EXCLUDED_ATTRIBUTES = (
+    "request",
+    "args",
+    "kwargs",
+    "_methods_cache",
+    "_attribute_names_cache",
+    "_hook_methods_cache",
+    "_attributes_snapshot",
+    "_are_snapshot_properties_stale",
+    "_form_cache",
+)
+
+# Module cache of component class -> layout version
+layout_versions_cache = {}
+
+
+def get_state_cache() -> Optional[BaseCache]:
+    """
+    Gets the Django cache used to share component state between processes based on the
+    `STATE_CACHE` setting, e.g. `UNICORN = {"STATE_CACHE": "default"}`.
+
+    Returns:
+        The cache or `None` if sharing component state is not enabled.
+    """
+    cache_alias = get_setting("STATE_CACHE")
+
+    if not cache_alias:
+        return None
+
+    return caches[cache_alias]
+
+
+def get_layout_version(component_class: Type) -> str:
+    """
+    Gets a version for the layout of a component class, so that state stored by a
+    different version of the class (e.g. before a deploy) doesn't get loaded.
+    """
+    if component_class in layout_versions_cache:
+        return layout_versions_cache[component_class]
+
+    names = set()
+
+    for klass in component_class.__mro__:
+        if klass.__module__.startswith("django."):
+            continue
+
+        names.update(klass.__dict__.keys())
+
+    layout = [
+        str(STATE_FORMAT_VERSION),
+        str(get_setting("STATE_VERSION", "")),
+        component_class.__module__,
+        component_class.__qualname__,
+    ]
+    layout.extend(sorted(names))
+
+    layout_version = hashlib.md5("|".join(layout).encode()).hexdigest()[:8]
+    layout_versions_cache[component_class] = layout_version
+
+    return layout_version
+
+
+def _get_state_key(component_name: str, component_id: str) -> str:
+    return f"unicorn:state:{component_name}:{component_id}"
+
+
+class StoredQuerySet:
+    """
+    Unevaluated queryset in stored component state. Pickling a queryset fetches all of
+    its rows, so only the query and the options that are needed to re-create the
+    queryset get pickled.
+    """
+
+    def __init__(self, queryset: QuerySet):
+        self.queryset_class = queryset.__class__
+        self.model = queryset.model
+        self.query = queryset.query
+        self.db = queryset._db
+        self.hints = queryset._hints
+        self.prefetch_related_lookups = queryset._prefetch_related_lookups
+        self.iterable_class = queryset._iterable_class
+        self.fields = queryset._fields
+
+    def to_queryset(self) -> QuerySet:
+        queryset = self.queryset_class(
+            model=self.model, query=self.query, using=self.db, hints=self.hints
+        )
+        queryset._prefetch_related_lookups = self.prefetch_related_lookups
+        queryset._iterable_class = self.iterable_class
+        queryset._fields = self.fields
+
+        return queryset
+
+
+def serialize_state(state: Dict[str, Any]) -> bytes:
+    """
+    Pickles and compresses component state. Attributes that can't be pickled get skipped.
+    Querysets that weren't evaluated get stored as their query instead of their rows.
+    """
+    state = {
+        name: StoredQuerySet(value)
+        if isinstance(value, QuerySet) and value._result_cache is None
+        else value
+        for (name, value) in state.items()
+    }
+
+    try:
+        pickled_state = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        picklable_state = {}
+
+        for (name, value) in state.items():
+            try:
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                picklable_state[name] = value
+            except (pickle.PicklingError, TypeError, AttributeError):
+                logger.warning(f"'{name}' attribute could not be pickled")
+
+        pickled_state = pickle.dumps(picklable_state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return zlib.compress(pickled_state)
+
+
+def deserialize_state(serialized_state: bytes) -> Dict[str, Any]:
+    state = pickle.loads(zlib.decompress(serialized_state))
+
+    return {
+        name: value.to_queryset() if isinstance(value, StoredQuerySet) else value
+        for (name, value) in state.items()
+    }
+
+
+def set_component_state(component) -> None:
+    """
+    Stores the public and private attributes of a component in the state cache.
+    """
+    cache = get_state_cache()
+
+    if cache is None:
+        return
+
+    state = {
+        name: value
+        for (name, value) in component.__dict__.items()
+        if name not in STATE_EXCLUDED_ATTRIBUTES
+    }
+
+    stored_state = (
+        get_layout_version(component.__class__),
+        serialize_state(state),
+    )
+    cache.set(
+        _get_state_key(component.component_name, component.component_id),
+        stored_state,
+        timeout=get_setting("STATE_CACHE_TIMEOUT", DEFAULT_TIMEOUT),
+    )
+
+
+def get_component_state(
+    component_class: Type, component_name: str, component_id: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Gets the attributes of a component from the state cache.
+
+    Returns:
+        Dictionary of attributes or `None` if there isn't any usable stored state.
+    """
+    cache = get_state_cache()
+
+    if cache is None:
+        return None
+
+    stored_state = cache.get(_get_state_key(component_name, component_id))
+
+    if stored_state is None:
+        return None
+
+    (layout_version, serialized_state) = stored_state
+
+    if layout_version != get_layout_version(component_class):
+        return None
+
+    try:
+        return deserialize_state(serialized_state)
+    except Exception as e:
+        logger.warning(f"Stored state for '{component_name}' could not be loaded: {e}")
+
+    return None
+
+
+def get_data_cache() -> BaseCache:
+    """
+    Gets the Django cache that holds the frontend data of components when the
+    `SERVER_STATE` setting is enabled. Uses the `STATE_CACHE` alias if it is set.
+    """
+    return caches[get_setting("STATE_CACHE") or DEFAULT_CACHE_ALIAS]
+
+
+def _get_data_key(component_id: str) -> str:
+    return f"unicorn:data:{component_id}"
+
+
+def set_frontend_data(
+    component_id: str, frontend_context_variables: str, checksum: str
+) -> None:
+    """
+    Stores the frontend data of a component, so that clients only have to send the
+    checksum of the data they have instead of the data itself.
+    """
+    get_data_cache().set(
+        _get_data_key(component_id),
+        (checksum, frontend_context_variables),
+        timeout=get_setting("STATE_CACHE_TIMEOUT", DEFAULT_TIMEOUT),
+    )
+
+
+def get_frontend_data(component_id: str, checksum: str) -> Optional[Dict[str, Any]]:
+    """
+    Gets the stored frontend data of a component.
+
+    Returns:
+        The data or `None` if it is missing or doesn't match the checksum the client has.
+    """
+    stored_data = get_data_cache().get(_get_data_key(component_id))
+
+    if stored_data is None:
+        return None
+
+    (stored_checksum, frontend_context_variables) = stored_data
+
+    if stored_checksum != checksum:
+        return None
+
+    return orjson.loads(frontend_context_variables)
+
+
+def _get_render_key(component_id: str) -> str:
+    return f"unicorn:render:{component_id}"
+
+
+def set_last_render(
+    component_id: str, checksum: str, rendered_component: str, keyed_elements=None
+) -> None:
+    """
+    Stores the last rendered HTML of a component, so the next render can be diffed
+    against it when the `DOM_DIFF` setting is enabled.
+
+    Args:
+        param component_id: Id of the component.
+        param checksum: Checksum of the data the component was rendered with.
+        param rendered_component: The rendered HTML.
+        param keyed_elements: The parsed keyed elements of the HTML, if available.
+    """
+    get_data_cache().set(
+        _get_render_key(component_id),
+        (checksum, rendered_component, keyed_elements),
+        timeout=get_setting("STATE_CACHE_TIMEOUT", DEFAULT_TIMEOUT),
+    )
+
+
+def get_last_render(component_id: str, checksum: str) -> Optional[Tuple]:
+    """
+    Gets the last rendered HTML of a component.
+
+    Returns:
+        Tuple of the HTML and its parsed keyed elements (which can be `None`) or `None`
+        if the last render is unknown or was for different data than the client has.
+    """
+    stored_render = get_data_cache().get(_get_render_key(component_id))
+
+    if stored_render is None:
+        return None
+
+    (stored_checksum, rendered_component, keyed_elements) = stored_render
+
+    if stored_checksum != checksum:
+        return None
+
+    return (rendered_component, keyed_elements)
+
+
+class SingleFlight:
+    """
+    Makes concurrent calls with the same key share one computation within the process.
+    The result also gets re-used for calls that happen within `ttl` seconds after it
+    was computed.
+    """
+
+    class Call:
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.exception = None
+            self.expires = None
+
+    def __init__(self):
+        self._calls: Dict[Any, "SingleFlight.Call"] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, ttl: float = 0) -> Any:
+        """
+        Calls `func` or waits for the in-flight call with the same key to finish.
+
+        Returns:
+            The result of `func`. Re-raises the exception if `func` raised one.
+        """
+        with self._lock:
+            self._remove_expired()
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if is_leader:
+                call = SingleFlight.Call()
+                self._calls[key] = call
+
+        if is_leader:
+            try:
+                call.result = func()
+            except Exception as e:
+                call.exception = e
+            finally:
+                with self._lock:
+                    call.expires = time.monotonic() + ttl
+
+                    if call.exception or ttl <= 0:
+                        self._calls.pop(key, None)
+
+                call.event.set()
+        else:
+            call.event.wait()
+
+        if call.exception:
+            raise call.exception
+
+        return call.result
+
+    def _remove_expired(self) -> None:
+        now = time.monotonic()
+
+        for (key, call) in list(self._calls.items()):
+            if call.expires is not None and call.expires <= now:
+                del self._calls[key]
@@ -0,0 +1,107 @@
+import ast
+import copy
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+
+# Maximum number of parsed call strings to keep around
+CALL_METHOD_NAME_CACHE_SIZE = 1024
+
+# Parsed values of these types can be shared between calls without copying them
+IMMUTABLE_TYPES = (str, int, float, complex, bool, type(None), bytes)
+
+
+def parse_arg(arg: str) -> Any:
+    """
+    Parses an argument into a Python literal, e.g. a string, number, boolean, list or
+    dictionary.
+
+    Returns:
+        The parsed value or `None` if the argument is not a literal.
+    """
+    try:
+        return _copy_value(_parse_arg(arg.strip()))
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return None
+
+
+def parse_call_method_name(
+    call_method_name: str,
+) -> Tuple[str, List[Any], Dict[str, Any]]:
+    """
+    Parses the method name from the request payload into the method name and the
+    arguments to pass to it. Parsed calls are cached, so repeating the same call
+    (e.g. clicking the same button) doesn't parse it again.
+
+    Args:
+        param call_method_name: String representation of a method name with parameters,
+            e.g. "set_name('Bob')" or "select(42, force=True)".
+
+    Returns:
+        Tuple of method_name, a list of arguments and a dictionary of keyword arguments.
+        Arguments that are not literals are `None`.
+    """
+    (method_name, args, kwargs) = _parse_call_method_name(call_method_name)
+
+    return (
+        method_name,
+        [_copy_value(arg) for arg in args],
+        {key: _copy_value(value) for (key, value) in kwargs},
+    )
+
+
+@lru_cache(maxsize=CALL_METHOD_NAME_CACHE_SIZE)
+def _parse_arg(arg: str) -> Any:
+    return ast.literal_eval(arg)
+
+
+@lru_cache(maxsize=CALL_METHOD_NAME_CACHE_SIZE)
+def _parse_call_method_name(
+    call_method_name: str,
+) -> Tuple[str, Tuple[Any, ...], Tuple[Tuple[str, Any], ...]]:
+    call_method_name = call_method_name.strip()
+
+    if "(" not in call_method_name or not call_method_name.endswith(")"):
+        return (call_method_name, (), ())
+
+    method_name = call_method_name[: call_method_name.index("(")]
+
+    try:
+        tree = ast.parse(call_method_name, mode="eval")
+    except (SyntaxError, ValueError, MemoryError, RecursionError):
+        return (method_name, (), ())
+
+    call = tree.body
+
+    if not isinstance(call, ast.Call):
+        return (method_name, (), ())
+
+    if isinstance(call.func, ast.Name):
+        method_name = call.func.id
+
+    args = tuple(_literal_eval(arg) for arg in call.args)
+    kwargs = tuple(
+        (keyword.arg, _literal_eval(keyword.value))
+        for keyword in call.keywords
+        if keyword.arg is not None
+    )
+
+    return (method_name, args, kwargs)
+
+
+def _literal_eval(node: ast.AST) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Copies mutable values, so a method that changes its arguments doesn't change the
+    cached ones.
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+
+    return copy.deepcopy(value)
@@ -1,8 +1,10 @@
-import hmac
+import copy
 import importlib
 import inspect
 import logging
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Type, Union
+from weakref import WeakKeyDictionary
 
 import orjson
 import shortuuid
@@ -10,19 +12,54 @@ from bs4 import BeautifulSoup
 from bs4.element import Tag
 from bs4.formatter import HTMLFormatter
 from django.conf import settings
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import NON_FIELD_ERRORS, ImproperlyConfigured
+from django.db import connection
 from django.db.models import Model, QuerySet
+from django.forms.utils import ErrorDict
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import Template
 from django.template.response import TemplateResponse
+from django.utils.decorators import classonlymethod
+from django.utils.functional import SimpleLazyObject
 from django.utils.safestring import mark_safe
 from django.views.generic.base import TemplateView
 
+from .cacher import (
+    LRUCache,
+    create_constructed_views_cache,
+    get_component_state,
+    set_component_state,
+    set_frontend_data,
+    set_last_render,
+)
+from .serializer import (
+    JsonSerializer,
+    QueryCounter,
+    get_model_plan,
+    model_fields_to_dict,
+    queryset_fields_to_list,
+)
+from .settings import get_setting
+from .utils import (
+    add_root_placeholders,
+    fill_root_placeholders,
+    generate_checksum,
+    generate_fingerprint,
+    inject_root_attributes,
+)
+
 
 logger = logging.getLogger(__name__)
 
 
 # Module cache to reduce initialization costs
 views_cache = {}
-constructed_views_cache = {}
+# Bounded, so long-running processes don't keep every component ever constructed
+constructed_views_cache = SimpleLazyObject(create_constructed_views_cache)
+compiled_templates_cache = {}
+component_metadata_cache: WeakKeyDictionary = WeakKeyDictionary()
+
+INIT_SCRIPT_TEMPLATE = "if (typeof Unicorn === 'undefined') {{ console.error('Unicorn is missing. Do you need {{% load unicorn %}} or {{% unicorn-scripts %}}?') }} else {{ Unicorn.componentInit({init}); }}"
 
 
 class UnicornField:
@@ -35,10 +72,47 @@ class UnicornField:
         return self.__dict__
 
 
+def _hydrate_model(obj: Model, data: Dict[str, Any]) -> None:
+    """
+    Sets the concrete fields of a model from a dictionary. Foreign keys are set by their
+    `attname`, because they are serialized as primary keys. Related objects that get
+    serialized with `Meta.serialize_related` are read-only, so their keys are skipped.
+    """
+    attnames = get_model_plan(obj.__class__).attnames
+
+    for (name, value) in data.items():
+        attname = attnames.get(name)
+
+        if attname and getattr(obj, attname) != value:
+            setattr(obj, attname, value)
+
+
+def _hydrate_field(field: Union[UnicornField, Model], data: Dict[str, Any]) -> None:
+    """
+    Sets the (possibly nested) attributes of a UnicornField or Model from a dictionary.
+    """
+    if isinstance(field, Model):
+        _hydrate_model(field, data)
+        return
+
+    for (name, value) in data.items():
+        if hasattr(field, name):
+            nested_field = getattr(field, name)
+
+            if isinstance(nested_field, (UnicornField, Model)):
+                _hydrate_field(nested_field, value)
+            elif nested_field != value:
+                setattr(field, name, value)
+
+
 class ComponentNotFoundError(Exception):
     pass
 
 
+class PayloadSizeError(Exception):
+    pass
+
+
 class UnsortedAttributes(HTMLFormatter):
     """
     Prevent beautifulsoup from re-ordering attributes.
@@ -90,6 +164,60 @@ class UnicornTemplateResponse(TemplateResponse):
         self.component_name = component_name
         self.frontend_context_variables = frontend_context_variables
         self.init_js = init_js
+        self.has_root_placeholders = False
+        self.checksum = None
+        self.fingerprint = None
+
+    def resolve_template(self, template):
+        template = super().resolve_template(template)
+
+        if not self.component_id:
+            return template
+
+        compiled_template = UnicornTemplateResponse._compile_template(template)
+
+        if compiled_template:
+            self.has_root_placeholders = True
+            return compiled_template
+
+        return template
+
+    @staticmethod
+    def _compile_template(template) -> Optional[DjangoTemplate]:
+        """
+        Compiles a copy of the component template with placeholders for the root element's
+        attributes and the init script. Compiled templates are cached by their source, so
+        changes to a template (e.g. in development) get picked up automatically.
+
+        Returns:
+            The compiled template or `None` if the root element can't be found statically.
+        """
+        if not isinstance(template, DjangoTemplate):
+            return None
+
+        source = template.template.source
+        key = (template.template.engine, source)
+
+        if key in compiled_templates_cache:
+            return compiled_templates_cache[key]
+
+        source_with_placeholders = add_root_placeholders(source)
+        compiled_template = None
+
+        if source_with_placeholders is not None:
+            compiled_template = DjangoTemplate(
+                Template(
+                    source_with_placeholders,
+                    origin=template.template.origin,
+                    name=template.template.name,
+                    engine=template.template.engine,
+                ),
+                template.backend,
+            )
+
+        compiled_templates_cache[key] = compiled_template
+
+        return compiled_template
 
     def render(self):
         response = super().render()
@@ -99,36 +227,80 @@ class UnicornTemplateResponse(TemplateResponse):
 
         content = response.content.decode("utf-8")
 
-        checksum = hmac.new(
-            str.encode(settings.SECRET_KEY),
-            str.encode(str(self.frontend_context_variables)),
-            digestmod="sha256",
-        ).hexdigest()
-        checksum = shortuuid.uuid(checksum)[:8]
-
-        soup = BeautifulSoup(content, features="html.parser")
-        root_element = UnicornTemplateResponse._get_root_element(soup)
-        root_element["unicorn:id"] = self.component_id
-        root_element["unicorn:name"] = self.component_name
-        root_element["unicorn:checksum"] = checksum
+        self.fingerprint = generate_fingerprint(
+            content, str(self.frontend_context_variables)
+        )
+        self.checksum = generate_checksum(
+            str.encode(str(self.frontend_context_variables))
+        )
+        root_attributes = {
+            "unicorn:id": self.component_id,
+            "unicorn:name": self.component_name,
+            "unicorn:checksum": self.checksum,
+        }
+        init_script = ""
 
         if self.init_js:
-            script_tag = soup.new_tag("script")
-            init = {
-                "id": self.component_id,
-                "name": self.component_name,
-                "data": orjson.loads(self.frontend_context_variables),
-            }
-            init = orjson.dumps(init).decode("utf-8")
-            script_tag.string = f"if (typeof Unicorn === 'undefined') {{ console.error('Unicorn is missing. Do you need {{% load unicorn %}} or {{% unicorn-scripts %}}?') }} else {{ Unicorn.componentInit({init}); }}"
-            root_element.insert_after(script_tag)
+            init_script = self._get_init_script()
+
+        if self.has_root_placeholders:
+            rendered_template = fill_root_placeholders(
+                content, root_attributes, after_root=init_script
+            )
+        else:
+            rendered_template = inject_root_attributes(
+                content, root_attributes, after_root=init_script
+            )
+
+        if rendered_template is None:
+            # Fall back to parsing the component for markup the injector can't handle
+            rendered_template = UnicornTemplateResponse._soupify(
+                content, root_attributes, init_script
+            )
 
-        rendered_template = UnicornTemplateResponse._desoupify(soup)
         rendered_template = mark_safe(rendered_template)
 
         response.content = rendered_template
         return response
 
+    def _get_init_script(self) -> str:
+        """
+        Gets the script tag that initializes the component on the client.
+        """
+        init = {
+            "id": self.component_id,
+            "name": self.component_name,
+            "data": orjson.loads(self.frontend_context_variables),
+            "fingerprint": self.fingerprint,
+        }
+
+        if get_setting("SERVER_STATE", False):
+            init["serverState"] = True
+
+        init = orjson.dumps(init).decode("utf-8")
+
+        return f"<script>{INIT_SCRIPT_TEMPLATE.format(init=init)}</script>"
+
+    @staticmethod
+    def _soupify(
+        content: str, root_attributes: Dict[str, str], init_script: str
+    ) -> str:
+        """
+        Adds the root attributes and init script by parsing the component with
+        BeautifulSoup. Slower, but handles any markup that `html.parser` understands.
+        """
+        soup = BeautifulSoup(content, features="html.parser")
+        root_element = UnicornTemplateResponse._get_root_element(soup)
+
+        for (name, value) in root_attributes.items():
+            root_element[name] = value
+
+        if init_script:
+            script_soup = BeautifulSoup(init_script, features="html.parser")
+            root_element.insert_after(script_soup.script)
+
+        return UnicornTemplateResponse._desoupify(soup)
+
     @staticmethod
     def _get_root_element(soup: BeautifulSoup) -> Tag:
         """
@@ -151,15 +323,203 @@ class UnicornTemplateResponse(TemplateResponse):
         return soup.encode(formatter=UnsortedAttributes()).decode("utf-8")
 
 
+# Ignore some standard attributes from TemplateView
+PROTECTED_NAMES = frozenset(
+    {
+        "render",
+        "request",
+        "args",
+        "kwargs",
+        "content_type",
+        "extra_context",
+        "http_method_names",
+        "template_engine",
+        "template_name",
+        "dispatch",
+        "id",
+        "get",
+        "get_context_data",
+        "get_template_names",
+        "render_to_response",
+        "http_method_not_allowed",
+        "options",
+        "setup",
+        "fill",
+        # Component methods
+        "component_id",
+        "component_name",
+        "mount",
+        "hydrate",
+        "updating",
+        "update",
+        "calling",
+        "called",
+        "validate",
+        "get_frontend_context_variables",
+        "errors",
+        "updated",
+    }
+)
+
+
+# Maximum number of compiled `syncInput` property paths per component class; the paths
+# come from requests, so they can't be trusted to be a small set
+PROPERTY_PATHS_MAX_ENTRIES = 256
+
+# Seconds that the result of coalesced requests gets re-used for
+COALESCE_TTL = 1
+
+
+class ComponentMetadata:
+    """
+    Names of the public attributes, methods and hooks of a component class.
+
+    Computed once per class by introspecting the class instead of an instance, so
+    properties don't get evaluated. Cached with a weak reference to the class, so a
+    class that gets re-created (e.g. when its module is reloaded) gets new metadata.
+    """
+
+    def __init__(self, component_class: Type):
+        self.excludes = frozenset()
+
+        if hasattr(component_class, "Meta") and hasattr(
+            component_class.Meta, "exclude"
+        ):
+            self.excludes = frozenset(component_class.Meta.exclude)
+
+        # Compiled property paths of `syncInput` actions, see `views.PropertyPath`
+        self.property_paths = LRUCache(max_entries=PROPERTY_PATHS_MAX_ENTRIES)
+
+        meta = getattr(component_class, "Meta", None)
+        self.incremental_validation = getattr(meta, "incremental_validation", False)
+        self.clean_dependencies = getattr(meta, "clean_dependencies", None)
+        self.collapse_actions = getattr(meta, "collapse_actions", True)
+        self.coalesce_requests = getattr(meta, "coalesce_requests", False)
+        self.coalesce_ttl = getattr(meta, "coalesce_ttl", COALESCE_TTL)
+        self.serialize_related = getattr(meta, "serialize_related", False)
+        self.fields = getattr(meta, "fields", {})
+        self.select_related = getattr(meta, "select_related", {})
+        self.prefetch_related = getattr(meta, "prefetch_related", {})
+
+        # Attributes that are in the template context, but don't get sent to the client
+        self.javascript_excludes = frozenset(getattr(meta, "javascript_exclude", ()))
+
+        # `None` falls back to the `SERIALIZATION_DEPTH` and `PAYLOAD_SIZE_BUDGET` settings
+        self.serialization_depth = getattr(meta, "serialization_depth", None)
+        self.payload_size_budget = getattr(meta, "payload_size_budget", None)
+
+        # Every name that is not public, except for the ones starting with an underscore
+        self.non_public_names = PROTECTED_NAMES | self.excludes
+
+        members = inspect.getmembers(component_class)
+
+        # The raw class attributes to tell what kind of method a member is; cheaper
+        # than calling `inspect.getattr_static` for every member
+        static_members = {}
+
+        for klass in reversed(component_class.__mro__):
+            static_members.update(vars(klass))
+
+        self.attribute_names = [
+            name
+            for (name, value) in members
+            if not callable(value) and self.is_public(name)
+        ]
+        self.hook_method_names = self.get_hook_method_names(
+            component_class, self.attribute_names
+        )
+        self.non_public_names = self.non_public_names | self.hook_method_names
+
+        # Attributes that get computed every time they are accessed, e.g. properties
+        self.property_names = frozenset(
+            name
+            for name in self.attribute_names
+            if hasattr(type(static_members.get(name)), "__get__")
+        )
+
+        self.method_names = [
+            name
+            for (name, value) in members
+            if self.is_public(name)
+            and ComponentMetadata._is_method(value, static_members.get(name))
+        ]
+
+    @staticmethod
+    def get(component_class: Type) -> "ComponentMetadata":
+        """
+        Gets the metadata for a component class from the cache or computes it.
+        """
+        metadata = component_metadata_cache.get(component_class)
+
+        if metadata is None:
+            metadata = ComponentMetadata(component_class)
+            component_metadata_cache[component_class] = metadata
+
+        return metadata
+
+    def is_public(self, name: str) -> bool:
+        return not (name.startswith("_") or name in self.non_public_names)
+
+    @staticmethod
+    def get_hook_method_names(obj, attribute_names: List[str]) -> FrozenSet[str]:
+        """
+        Gets the names of the `updating_*` and `updated_*` hooks that are defined for
+        the attributes.
+        """
+        hook_method_names = []
+
+        for attribute_name in attribute_names:
+            updating_function_name = f"updating_{attribute_name}"
+            updated_function_name = f"updated_{attribute_name}"
+            hook_function_names = [updating_function_name, updated_function_name]
+
+            for function_name in hook_function_names:
+                if hasattr(obj, function_name):
+                    hook_method_names.append(function_name)
+
+        return frozenset(hook_method_names)
+
+    @staticmethod
+    def _is_method(value: Any, static_value: Any) -> bool:
+        """
+        Whether the member would be a bound method on an instance of the class, i.e. a
+        regular method or a classmethod, but not a staticmethod or a `classonlymethod`
+        like `as_view`.
+        """
+        if inspect.ismethod(value):
+            return not isinstance(static_value, classonlymethod)
+
+        return inspect.isfunction(value) and not isinstance(static_value, staticmethod)
+
+
+# Attributes that keep track of the attributes snapshot, so setting them can't make it stale
+SNAPSHOT_ATTRIBUTE_NAMES = (
+    "_attributes_snapshot",
+    "_are_snapshot_properties_stale",
+    "_form_cache",
+)
+
+
 class UnicornView(TemplateView):
     response_class = UnicornTemplateResponse
     component_name = ""
     request = None
 
+    # Fingerprint of the last render
+    _fingerprint = None
+
     # Caches to reduce the amount of time introspecting the class
     _methods_cache = None
     _attribute_name_cache = None
-    _hook_methods_cache: List[str] = []
+    _hook_methods_cache: FrozenSet[str] = frozenset()
+
+    # Attributes shared by serialization, validation and rendering while a message is
+    # processed; `None` when there is no snapshot
+    _attributes_snapshot: Optional[Dict[str, Any]] = None
+    _are_snapshot_properties_stale = False
+
+    # The last bound form and the data it was bound with while there is a snapshot
+    _form_cache = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -173,6 +533,7 @@ class UnicornView(TemplateView):
             self.setup(kwargs["request"])
 
         self.errors = {}
+        self._validation_cache = {}
         self._set_default_template_name()
         self._set_caches()
 
@@ -197,6 +558,7 @@ class UnicornView(TemplateView):
         """
         Setup some initial "caches" to prevent Python from having to introspect
         a component UnicornView for methods and properties multiple times.
+        Most of the work only happens once per class in `ComponentMetadata`.
         """
         self._attribute_names_cache = self._attribute_names()
         self._set_hook_methods_cache()
@@ -246,22 +608,39 @@ class UnicornView(TemplateView):
         Args:
             param init_js: Whether or not to include the Javascript required to initialize the component.
         """
-        frontend_context_variables = self.get_frontend_context_variables()
-
-        response = self.render_to_response(
-            context=self.get_context_data(),
-            component_name=self.component_name,
-            component_id=self.component_id,
-            frontend_context_variables=frontend_context_variables,
-            init_js=init_js,
-        )
+        with self._attributes_snapshot_scope():
+            frontend_context_variables = self.get_frontend_context_variables()
+
+            response = self.render_to_response(
+                context=self.get_context_data(),
+                component_name=self.component_name,
+                component_id=self.component_id,
+                frontend_context_variables=frontend_context_variables,
+                init_js=init_js,
+            )
 
         # render_to_response() could only return a HttpResponse, so check for render()
         if hasattr(response, "render"):
             response.render()
+            self._fingerprint = response.fingerprint
+
+            if get_setting("SERVER_STATE", False):
+                # Keep the data on the server so clients can send the checksum instead
+                set_frontend_data(
+                    self.component_id, frontend_context_variables, response.checksum
+                )
 
         rendered_component = response.content.decode("utf-8")
 
+        if init_js and get_setting("DOM_DIFF", False):
+            # Messages get diffed against the last render, starting with the initial one
+            set_last_render(self.component_id, response.checksum, rendered_component)
+
+        if init_js:
+            # Share the state from mounting (if enabled) so the first message doesn't
+            # have to mount again in another process
+            set_component_state(self)
+
         return rendered_component
 
     def get_frontend_context_variables(self) -> str:
@@ -269,57 +648,49 @@ class UnicornView(TemplateView):
         Get publicly available properties and output them in a string-encoded JSON object.
         """
 
-        def _get_model_json(obj):
-            """
-            Serializes Django models.
+        metadata = self._get_metadata()
 
-            Tried to use the Django serializer, but it failed for some field types.
-            """
-            model_field_names = [field.name for field in obj._meta.get_fields()]
-
-            model_json = {}
-            for field_name in model_field_names:
-                model_json[field_name] = getattr(obj, field_name)
+        serialization_depth = metadata.serialization_depth
 
-            return model_json
+        if serialization_depth is None:
+            serialization_depth = get_setting("SERIALIZATION_DEPTH")
 
-        def _json_serializer(obj):
-            """
-            Handle the objects that the `orjson` deserializer can't handle automatically.
+        json_serializer = JsonSerializer(
+            include_related=metadata.serialize_related, max_depth=serialization_depth,
+        )
 
-            The types handled by `orjson` by default: dataclass, datetime, enum, float, int, numpy, str, uuid.
-            The types handled in this class: Django Model, Django QuerySet, any object with `to_json` method.
+        javascript_excludes = metadata.javascript_excludes
+        attributes = self._attributes()
 
-            TODO: Investigate other ways to serialize objects automatically.
-            e.g. using DRF serializer: https://www.django-rest-framework.org/api-guide/serializers/#serializing-objects
-            """
-            if isinstance(obj, Model):
-                return _get_model_json(obj)
-            elif isinstance(obj, QuerySet):
-                queryset_json = []
+        # Attributes in `Meta.javascript_exclude` don't get serialized; the server always
+        # has them, so they only make the data that gets sent back and forth bigger
+        frontend_context_variables = {
+            name: value
+            for (name, value) in attributes.items()
+            if name not in javascript_excludes
+        }
 
-                for model in obj:
-                    model_json = _get_model_json(model)
-                    queryset_json.append(model_json)
+        # Only serialize the fields in `Meta.fields` for models and querysets
+        for (attribute_name, field_names) in metadata.fields.items():
+            # Skip names that aren't serialized, e.g. because they are excluded
+            if attribute_name not in frontend_context_variables:
+                continue
 
-                return queryset_json
-            elif hasattr(obj, "to_json"):
-                return obj.to_json()
+            value = attributes.get(attribute_name)
 
-            raise TypeError
+            if isinstance(value, QuerySet):
+                value = queryset_fields_to_list(value, field_names)
+            elif isinstance(value, Model):
+                value = model_fields_to_dict(value, field_names)
 
-        frontend_context_variables = {}
-        attributes = self._attributes()
-        frontend_context_variables.update(attributes)
+            frontend_context_variables[attribute_name] = value
 
         # Add cleaned values to `frontend_content_variables` based on the widget in form's fields
         form = self._get_form(attributes)
 
         if form:
-            form.is_valid()
-
             for key in attributes.keys():
-                if key in form.fields:
+                if key in form.fields and key not in javascript_excludes:
                     field = form.fields[key]
 
                     if key in form.cleaned_data:
@@ -327,22 +698,229 @@ class UnicornView(TemplateView):
                         value = field.widget.format_value(cleaned_value)
                         frontend_context_variables[key] = value
 
-        encoded_frontend_context_variables = orjson.dumps(
-            frontend_context_variables, default=_json_serializer,
-        ).decode("utf-8")
+        if settings.DEBUG:
+            query_counter = QueryCounter()
+
+            with connection.execute_wrapper(query_counter):
+                encoded_frontend_context_variables = orjson.dumps(
+                    frontend_context_variables, default=json_serializer,
+                ).decode("utf-8")
+
+            self._report_serialization_queries(attributes, query_counter.count)
+        else:
+            encoded_frontend_context_variables = orjson.dumps(
+                frontend_context_variables, default=json_serializer,
+            ).decode("utf-8")
+
+        payload_size_budget = metadata.payload_size_budget
+
+        if payload_size_budget is None:
+            payload_size_budget = get_setting("PAYLOAD_SIZE_BUDGET")
+
+        if (
+            payload_size_budget is not None
+            and len(encoded_frontend_context_variables) > payload_size_budget
+        ):
+            self._report_payload_size(
+                frontend_context_variables,
+                json_serializer,
+                len(encoded_frontend_context_variables),
+                payload_size_budget,
+            )
 
         return encoded_frontend_context_variables
 
+    def _apply_related_lookups(self, attributes: Dict[str, Any]) -> None:
+        """
+        Applies `Meta.select_related` and `Meta.prefetch_related` to the querysets in the
+        attributes, so rendering and serializing them doesn't run a query per row. The
+        attributes get updated instead of the component, so querysets that come from a
+        property get optimized too. Querysets that were already evaluated are left alone.
+        """
+        metadata = self._get_metadata()
+
+        if not metadata.select_related and not metadata.prefetch_related:
+            return
+
+        for attribute_name in {**metadata.select_related, **metadata.prefetch_related}:
+            queryset = attributes.get(attribute_name)
+
+            if (
+                not isinstance(queryset, QuerySet)
+                or queryset._result_cache is not None
+                or getattr(queryset, "_are_related_lookups_applied", False)
+            ):
+                continue
+
+            if attribute_name in metadata.select_related:
+                queryset = queryset.select_related(
+                    *metadata.select_related[attribute_name]
+                )
+
+            if attribute_name in metadata.prefetch_related:
+                queryset = queryset.prefetch_related(
+                    *metadata.prefetch_related[attribute_name]
+                )
+
+            queryset._are_related_lookups_applied = True
+            attributes[attribute_name] = queryset
+
+    def _report_serialization_queries(
+        self, attributes: Dict[str, Any], query_count: int
+    ) -> None:
+        """
+        Reports the number of queries that serializing the component ran. More queries
+        than there are querysets usually means related objects get loaded for every
+        row, which `Meta.fields` can prevent.
+        """
+        if not query_count:
+            return
+
+        queryset_count = len(
+            [value for value in attributes.values() if isinstance(value, QuerySet)]
+        )
+        message = f"Serializing the '{self.component_name}' component ran {query_count} queries"
+
+        if query_count > queryset_count:
+            logger.warning(
+                f"{message} for {queryset_count} querysets. Set `Meta.fields` to only serialize the fields that are needed."
+            )
+        else:
+            logger.debug(message)
+
+    def _report_payload_size(
+        self,
+        frontend_context_variables: Dict[str, Any],
+        json_serializer: JsonSerializer,
+        payload_size: int,
+        payload_size_budget: int,
+    ) -> None:
+        """
+        Reports that the serialized data of the component is bigger than its budget
+        (`Meta.payload_size_budget` or the `PAYLOAD_SIZE_BUDGET` setting) along with the
+        attributes that take up the most space. Raises `PayloadSizeError` in `DEBUG`,
+        otherwise logs a warning.
+        """
+        attribute_sizes = {
+            name: len(orjson.dumps(value, default=json_serializer))
+            for (name, value) in frontend_context_variables.items()
+        }
+        largest_attribute_names = sorted(
+            attribute_sizes, key=attribute_sizes.get, reverse=True
+        )[:3]
+        largest_attributes = ", ".join(
+            [
+                f"'{name}' ({attribute_sizes[name]} bytes, {attribute_sizes[name] * 100 // payload_size}%)"
+                for name in largest_attribute_names
+            ]
+        )
+
+        message = f"The data of the '{self.component_name}' component is {payload_size} bytes, which is over its budget of {payload_size_budget} bytes. Largest attributes: {largest_attributes}. Set `Meta.fields`, `Meta.javascript_exclude` or `Meta.serialization_depth` to serialize less."
+
+        if settings.DEBUG:
+            raise PayloadSizeError(message)
+
+        logger.warning(message)
+
     def _get_form(self, data):
+        """
+        Gets a validated form bound to the data. While there is an attributes snapshot,
+        the form gets re-used until the data for one of its fields changes.
+        """
         if hasattr(self, "form_class"):
+            form_data = None
+            field_names = getattr(self.form_class, "base_fields", None)
+
+            if self._attributes_snapshot is not None and field_names is not None:
+                form_data = {name: data.get(name) for name in field_names}
+
+                if self._form_cache and self._form_cache[0] == form_data:
+                    return self._form_cache[1]
+
             try:
                 form = self.form_class(data)
-                form.is_valid()
+
+                if self._get_metadata().incremental_validation:
+                    self._validate_incrementally(form, data)
+                else:
+                    form.is_valid()
+
+                if form_data is not None:
+                    # Copy the data so changes to mutable values invalidate the form
+                    self._form_cache = (copy.deepcopy(form_data), form)
 
                 return form
             except Exception as e:
                 logger.exception(e)
 
+    def _validate_incrementally(self, form, data: Dict) -> None:
+        """
+        Validates the form by only cleaning the fields whose values changed since they
+        were last validated. The results for the other fields are cached in
+        `_validation_cache`, which is kept with the component between messages.
+
+        The form's `clean()` only runs again when one of the fields in
+        `Meta.clean_dependencies` changed, or any field if that is not set.
+        """
+        cache = self._validation_cache
+        fields = form.fields
+        changed_fields = {
+            name: field
+            for (name, field) in fields.items()
+            if name not in cache or cache[name]["value"] != data.get(name)
+        }
+
+        form.cleaned_data = {}
+        form._errors = ErrorDict()
+
+        for name in fields:
+            if name not in changed_fields:
+                form.cleaned_data.update(cache[name]["cleaned_data"])
+
+        # Only clean the changed fields; `clean_<field>` can still use the others
+        form.fields = changed_fields
+        form._clean_fields()
+        form.fields = fields
+
+        for name in changed_fields:
+            cache[name] = {
+                # Copy the value so changes to mutable values get validated
+                "value": copy.deepcopy(data.get(name)),
+                "cleaned_data": {name: form.cleaned_data[name]}
+                if name in form.cleaned_data
+                else {},
+                "errors": form._errors.get(name),
+            }
+
+        dependencies = self._get_metadata().clean_dependencies or list(fields)
+        dependency_values = {name: data.get(name) for name in dependencies}
+        clean_result = cache.get(NON_FIELD_ERRORS)
+
+        if clean_result is None or clean_result["value"] != dependency_values:
+            form._errors = ErrorDict()
+            form._clean_form()
+            form._post_clean()
+
+            clean_result = {
+                "value": copy.deepcopy(dependency_values),
+                "errors": form._errors,
+            }
+            cache[NON_FIELD_ERRORS] = clean_result
+
+        errors = ErrorDict()
+
+        for name in fields:
+            if cache[name]["errors"]:
+                errors[name] = copy.copy(cache[name]["errors"])
+
+        for (name, error_list) in clean_result["errors"].items():
+            if name in errors:
+                errors[name].extend(error_list)
+            else:
+                errors[name] = copy.copy(error_list)
+
+        form._errors = errors
+
     def get_context_data(self, **kwargs):
         """
         Overrides the standard `get_context_data` to add in publicly available
@@ -399,22 +977,102 @@ class UnicornView(TemplateView):
 
         return self.errors
 
-    def _attribute_names(self):
+    def _attribute_names(self) -> List[str]:
         """
         Gets publicly available attribute names. Cached in `_attribute_names_cache`.
         """
-        non_callables = [
-            member[0] for member in inspect.getmembers(self, lambda x: not callable(x))
+        metadata = self._get_metadata()
+
+        # Attributes that were set on the instance while it was constructed, e.g. kwargs
+        instance_attribute_names = [
+            name
+            for (name, value) in self.__dict__.items()
+            if name not in metadata.attribute_names
+            and not callable(value)
+            and self._is_public(name)
         ]
-        attribute_names = [name for name in non_callables if self._is_public(name)]
 
-        return attribute_names
+        if not instance_attribute_names:
+            return metadata.attribute_names
+
+        return sorted(metadata.attribute_names + instance_attribute_names)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        snapshot = self._attributes_snapshot
+
+        if snapshot is not None and name not in SNAPSHOT_ATTRIBUTE_NAMES:
+            if name in snapshot:
+                snapshot[name] = value
+
+            # Properties could depend on any attribute
+            self._mark_attributes_snapshot_stale()
+
+    def _start_attributes_snapshot(self) -> None:
+        """
+        Takes a snapshot of the public attributes that `_attributes()` returns until
+        `_stop_attributes_snapshot()` is called, so every property only gets evaluated
+        once instead of every time the attributes are needed. Setting an attribute
+        updates the snapshot.
+        """
+        self._attributes_snapshot = self._get_attributes()
+        self._are_snapshot_properties_stale = False
+
+    def _stop_attributes_snapshot(self) -> None:
+        self._attributes_snapshot = None
+        self._are_snapshot_properties_stale = False
+        self._form_cache = None
+
+    def _mark_attributes_snapshot_stale(self) -> None:
+        """
+        Re-evaluates the properties in the snapshot the next time the attributes are
+        needed. Should be called when the component could have changed without setting
+        an attribute, e.g. after calling a method.
+        """
+        if self._attributes_snapshot is not None:
+            self._are_snapshot_properties_stale = True
+
+    @contextmanager
+    def _attributes_snapshot_scope(self):
+        """
+        Uses a snapshot of the attributes in the block, unless one is already taken.
+        """
+        if self._attributes_snapshot is not None:
+            yield
+            return
+
+        self._start_attributes_snapshot()
+
+        try:
+            yield
+        finally:
+            self._stop_attributes_snapshot()
 
     def _attributes(self) -> Dict[str, Any]:
         """
         Get publicly available attributes and their values from the component.
         """
+        snapshot = self._attributes_snapshot
+
+        if snapshot is None:
+            attributes = self._get_attributes()
+            self._apply_related_lookups(attributes)
+
+            return attributes
+
+        if self._are_snapshot_properties_stale:
+            for property_name in self._get_metadata().property_names:
+                snapshot[property_name] = getattr(self, property_name)
 
+            self._are_snapshot_properties_stale = False
+
+        # The snapshot keeps the optimized querysets, so they only get evaluated once
+        self._apply_related_lookups(snapshot)
+
+        return snapshot.copy()
+
+    def _get_attributes(self) -> Dict[str, Any]:
         attribute_names = self._attribute_names_cache
         attributes = {}
 
@@ -425,12 +1083,13 @@ class UnicornView(TemplateView):
 
     def _set_property(self, name, value):
         # Get the correct value type by using the form if it is available
-        data = self._attributes()
-        data[name] = value
-        form = self._get_form(data)
+        if hasattr(self, "form_class"):
+            data = self._attributes()
+            data[name] = value
+            form = self._get_form(data)
 
-        if form and name in form.fields and name in form.cleaned_data:
-            value = form.cleaned_data[name]
+            if form and name in form.fields and name in form.cleaned_data:
+                value = form.cleaned_data[name]
 
         updating_function_name = f"updating_{name}"
         if hasattr(self, updating_function_name):
@@ -448,87 +1107,131 @@ class UnicornView(TemplateView):
                 f"'{name}' attribute on '{self.component_name}' component could not be set. Is it a @property without a setter?"
             )
 
+    def _hydrate_many(self, data: Dict[str, Any]) -> None:
+        """
+        Sets the attributes from the request data in one pass. Values that equal the
+        attribute's current value are skipped, the form (if there is one) is only built
+        once for all changed values and only the hooks that are defined get called.
+
+        Args:
+            param data: Dictionary of attribute names to values, e.g. from a request.
+        """
+        attributes = self._attributes()
+        changed_data = {}
+
+        for (name, value) in data.items():
+            if name in attributes:
+                if attributes[name] != value:
+                    changed_data[name] = value
+            elif hasattr(self, name):
+                changed_data[name] = value
+
+        if not changed_data:
+            return
+
+        # Get the correct value types by using the form if it is available
+        cleaned_data = {}
+
+        if hasattr(self, "form_class"):
+            form = self._get_form({**attributes, **changed_data})
+
+            if form:
+                cleaned_data = {
+                    name: form.cleaned_data[name]
+                    for name in changed_data
+                    if name in form.fields and name in form.cleaned_data
+                }
+
+        for (name, value) in changed_data.items():
+            field = attributes[name] if name in attributes else getattr(self, name)
+
+            # UnicornField and Models are always a dictionary (can be nested)
+            if isinstance(field, (UnicornField, Model)):
+                _hydrate_field(field, value)
+                continue
+
+            if name in cleaned_data:
+                value = cleaned_data[name]
+
+            updating_function_name = f"updating_{name}"
+            if updating_function_name in self._hook_methods_cache:
+                getattr(self, updating_function_name)(value)
+
+            try:
+                setattr(self, name, value)
+
+                updated_function_name = f"updated_{name}"
+
+                if updated_function_name in self._hook_methods_cache:
+                    getattr(self, updated_function_name)(value)
+            except AttributeError:
+                logger.error(
+                    f"'{name}' attribute on '{self.component_name}' component could not be set. Is it a @property without a setter?"
+                )
+
     def _methods(self) -> Dict[str, Callable]:
         """
         Get publicly available method names and their functions from the component.
         Cached in `_methods_cache`.
         """
 
-        if self._methods_cache:
+        if self._methods_cache is not None:
             return self._methods_cache
 
-        member_methods = inspect.getmembers(self, inspect.ismethod)
-        public_methods = [
-            method for method in member_methods if self._is_public(method[0])
-        ]
-        methods = {k: v for (k, v) in public_methods}
+        methods = {
+            name: getattr(self, name) for name in self._get_metadata().method_names
+        }
         self._methods_cache = methods
 
         return methods
 
     def _set_hook_methods_cache(self) -> None:
-        self._hook_methods_cache = []
+        metadata = self._get_metadata()
+        self._hook_methods_cache = metadata.hook_method_names
 
-        for attribute_name in self._attribute_names_cache:
-            updating_function_name = f"updating_{attribute_name}"
-            updated_function_name = f"updated_{attribute_name}"
-            hook_function_names = [updating_function_name, updated_function_name]
+        if self._attribute_names_cache is not metadata.attribute_names:
+            # Also look for hooks of attributes that were set on the instance
+            self._hook_methods_cache = metadata.get_hook_method_names(
+                self, self._attribute_names_cache
+            )
 
-            for function_name in hook_function_names:
-                if hasattr(self, function_name):
-                    self._hook_methods_cache.append(function_name)
+    def _get_metadata(self) -> "ComponentMetadata":
+        return ComponentMetadata.get(self.__class__)
 
     def _is_public(self, name: str) -> bool:
         """
         Determines if the name should be sent in the context.
         """
-
-        # Ignore some standard attributes from TemplateView
-        protected_names = (
-            "render",
-            "request",
-            "args",
-            "kwargs",
-            "content_type",
-            "extra_context",
-            "http_method_names",
-            "template_engine",
-            "template_name",
-            "dispatch",
-            "id",
-            "get",
-            "get_context_data",
-            "get_template_names",
-            "render_to_response",
-            "http_method_not_allowed",
-            "options",
-            "setup",
-            "fill",
-            # Component methods
-            "component_id",
-            "component_name",
-            "mount",
-            "hydrate",
-            "updating",
-            "update",
-            "calling",
-            "called",
-            "validate",
-            "get_frontend_context_variables",
-            "errors",
-            "updated",
+        return (
+            self._get_metadata().is_public(name)
+            and name not in self._hook_methods_cache
         )
-        excludes = []
 
-        if hasattr(self, "Meta") and hasattr(self.Meta, "exclude"):
-            excludes = self.Meta.exclude
+    @staticmethod
+    def _restore(
+        component_class: Type["UnicornView"], component_name: str, component_id: str
+    ) -> Optional["UnicornView"]:
+        """
+        Re-constructs a component from the state shared between processes, if enabled.
+        Restored components don't get mounted again.
+
+        Returns:
+            Restored `UnicornView` component or `None` if there is no stored state.
+        """
+        state = get_component_state(component_class, component_name, component_id)
 
-        return not (
-            name.startswith("_")
-            or name in protected_names
-            or name in self._hook_methods_cache
-            or name in excludes
+        if state is None:
+            return None
+
+        component = component_class(
+            component_name=component_name, component_id=component_id
         )
+        component.__dict__.update(state)
+
+        key = f"{component_name}-{component_id}"
+        constructed_views_cache[key] = component
+
+        return component
 
     @staticmethod
     def create(
@@ -549,15 +1252,29 @@ class UnicornView(TemplateView):
         """
         if component_id and use_cache:
             key = f"{component_name}-{component_id}"
+            cached_component = constructed_views_cache.get(key)
 
-            if key in constructed_views_cache:
-                return constructed_views_cache[key]
+            if cached_component is not None:
+                return cached_component
 
         if component_name in views_cache:
+            if component_id and use_cache:
+                component = UnicornView._restore(
+                    views_cache[component_name], component_name, component_id
+                )
+
+                if component:
+                    return component
+
             component = views_cache[component_name](
                 component_name=component_name, component_id=component_id
             )
 
+            if component._get_metadata().javascript_excludes:
+                # The client doesn't send the attributes in `Meta.javascript_exclude`
+                # back, so they have to be set up by mounting again
+                component.mount()
+
             if not use_cache:
                 #  Re-initializes custom classes so that `reset` magic method will "clear" them as expected
                 _attributes = component._attributes()
@@ -622,11 +1339,19 @@ class UnicornView(TemplateView):
         for (class_name, module_name) in locations:
             try:
                 component_class = _get_component_class(module_name, class_name)
-                component = component_class(
-                    component_name=component_name, id=component_id
-                )
-                component.mount()
-                component.hydrate()
+                component = None
+
+                if component_id and use_cache:
+                    component = UnicornView._restore(
+                        component_class, component_name, component_id
+                    )
+
+                if not component:
+                    component = component_class(
+                        component_name=component_name, id=component_id
+                    )
+                    component.mount()
+                    component.hydrate()
 
                 views_cache[component_name] = component_class
 
@@ -0,0 +1,265 @@
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db.models import Model, QuerySet
+
+from .settings import get_setting
+
+
+# Number of rows that get fetched from the database at a time for `Meta.fields`
+DEFAULT_QUERYSET_CHUNK_SIZE = 2000
+
+
+class QueryCounter:
+    """
+    Database execute wrapper that counts the queries that get run, e.g.
+    `with connection.execute_wrapper(query_counter):`.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+
+        return execute(sql, params, many, context)
+
+
+# Module cache of (model class, include related) -> `ModelPlan`
+model_plans_cache: Dict[Tuple[Type[Model], bool], "ModelPlan"] = {}
+
+
+class ModelPlan:
+    """
+    What gets serialized for the instances of a model. Concrete fields are serialized by
+    their `attname`, e.g. `author_id` for a foreign key, so serializing never queries a
+    related object. Many-to-many fields and reverse relations are only serialized (as
+    primary keys) when related objects are included.
+
+    Args:
+        param model: The model class.
+        param include_related: Whether to serialize many-to-many fields and reverse
+            relations.
+    """
+
+    def __init__(self, model: Type[Model], include_related: bool = False):
+        opts = model._meta
+
+        self.field_names = tuple(field.attname for field in opts.concrete_fields)
+
+        # Name or attname of concrete fields -> attname, e.g. `Meta.fields` serializes a
+        # foreign key by its name
+        self.attnames = {}
+
+        for field in opts.concrete_fields:
+            self.attnames[field.name] = field.attname
+            self.attnames[field.attname] = field.attname
+        self._get_field_values = attrgetter(*self.field_names)
+        self._has_single_field = len(self.field_names) == 1
+
+        # Accessor names of relations to multiple objects and to a single object
+        self.many_names: Tuple[str, ...] = ()
+        self.one_names: Tuple[str, ...] = ()
+
+        if include_related:
+            many_names = [field.name for field in opts.many_to_many]
+            one_names = []
+
+            for relation in opts.related_objects:
+                accessor_name = relation.get_accessor_name()
+
+                if not accessor_name:
+                    # Hidden relation, e.g. `related_name="+"`
+                    continue
+
+                if relation.multiple:
+                    many_names.append(accessor_name)
+                else:
+                    one_names.append(accessor_name)
+
+            self.many_names = tuple(many_names)
+            self.one_names = tuple(one_names)
+
+        self.has_related = bool(self.many_names or self.one_names)
+
+    def to_dict(self, obj: Model) -> Dict[str, Any]:
+        field_values = self._get_field_values(obj)
+
+        if self._has_single_field:
+            field_values = (field_values,)
+
+        model_json = dict(zip(self.field_names, field_values))
+
+        if not self.has_related:
+            return model_json
+
+        for name in self.many_names:
+            # Uses prefetched objects if there are any
+            related_objs = getattr(obj, name).all()
+            model_json[name] = [related_obj.pk for related_obj in related_objs]
+
+        for name in self.one_names:
+            try:
+                model_json[name] = getattr(obj, name).pk
+            except ObjectDoesNotExist:
+                model_json[name] = None
+
+        return model_json
+
+
+def get_model_plan(model: Type[Model], include_related: bool = False) -> ModelPlan:
+    """
+    Gets the cached serialization plan for a model class or creates it.
+    """
+    key = (model, include_related)
+    model_plan = model_plans_cache.get(key)
+
+    if model_plan is None:
+        model_plan = ModelPlan(model, include_related=include_related)
+        model_plans_cache[key] = model_plan
+
+    return model_plan
+
+
+def model_to_dict(obj: Model, include_related: bool = False) -> Dict[str, Any]:
+    """
+    Serializes a model instance into a dictionary.
+    """
+    return get_model_plan(obj.__class__, include_related).to_dict(obj)
+
+
+def queryset_to_list(
+    queryset: QuerySet, include_related: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Serializes the model instances of a queryset into a list of dictionaries.
+    """
+    model_plan = get_model_plan(queryset.model, include_related)
+
+    return [model_plan.to_dict(obj) for obj in queryset]
+
+
+def get_attnames(
+    model: Type[Model], field_names: Sequence[str]
+) -> Optional[Tuple[str, ...]]:
+    """
+    Gets the `attname` of each concrete field, e.g. `author_id` for `author`.
+
+    Returns:
+        Tuple of attnames or `None` if one of the names is not a concrete field, e.g. a
+        lookup like `author__name`.
+    """
+    attnames = []
+
+    for field_name in field_names:
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+
+        if not field.concrete or field.many_to_many:
+            return None
+
+        attnames.append(field.attname)
+
+    return tuple(attnames)
+
+
+def model_fields_to_dict(obj: Model, field_names: Sequence[str]) -> Dict[str, Any]:
+    """
+    Serializes only the fields of a model instance, using the field names as keys like
+    `QuerySet.values()` does.
+    """
+    attnames = get_attnames(obj.__class__, field_names)
+    assert attnames is not None, f"Only concrete fields can be serialized: {field_names}"
+
+    return {
+        field_name: getattr(obj, attname)
+        for (field_name, attname) in zip(field_names, attnames)
+    }
+
+
+def queryset_fields_to_list(
+    queryset: QuerySet, field_names: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    Serializes only the fields of the rows in a queryset. The projection happens in SQL
+    with `values()` and the rows get streamed in chunks (`QUERYSET_CHUNK_SIZE` setting),
+    so only the columns that are needed get loaded. Querysets that were already
+    evaluated, e.g. by the template, get serialized from their rows without a query.
+    """
+    if queryset._result_cache is not None:
+        attnames = get_attnames(queryset.model, field_names)
+
+        if attnames is not None:
+            get_values = attrgetter(*attnames)
+
+            if len(attnames) == 1:
+                return [{field_names[0]: get_values(obj)} for obj in queryset]
+
+            return [dict(zip(field_names, get_values(obj))) for obj in queryset]
+
+    chunk_size = get_setting("QUERYSET_CHUNK_SIZE", DEFAULT_QUERYSET_CHUNK_SIZE)
+
+    return list(queryset.values(*field_names).iterator(chunk_size=chunk_size))
+
+
+class JsonSerializer:
+    """
+    Handles the objects that `orjson` can't serialize automatically, i.e. Django models,
+    Django querysets and any object with a `to_json` method. Used as the `default` of
+    `orjson.dumps`.
+
+    The value returned by `to_json` gets serialized eagerly, so the depth of the objects
+    nested in it is known: the attributes of a component are at depth 0 and models that
+    are nested deeper than `max_depth` get reduced to their primary key.
+
+    Args:
+        param include_related: Whether to serialize many-to-many fields and reverse
+            relations of models.
+        param max_depth: Depth after which models get serialized as their primary key.
+            `None` for no limit.
+    """
+
+    def __init__(self, include_related: bool = False, max_depth: Optional[int] = None):
+        self.include_related = include_related
+        self.max_depth = max_depth
+
+    def __call__(self, obj: Any) -> Any:
+        return self.serialize(obj, 0)
+
+    def serialize(self, obj: Any, depth: int) -> Any:
+        if isinstance(obj, Model):
+            if self._is_too_deep(depth):
+                return obj.pk
+
+            return model_to_dict(obj, include_related=self.include_related)
+        elif isinstance(obj, QuerySet):
+            if self._is_too_deep(depth):
+                if obj._result_cache is None:
+                    return list(obj.values_list("pk", flat=True))
+
+                return [related_obj.pk for related_obj in obj]
+
+            return queryset_to_list(obj, include_related=self.include_related)
+        elif hasattr(obj, "to_json"):
+            return self._serialize_nested(obj.to_json(), depth + 1)
+
+        raise TypeError
+
+    def _serialize_nested(self, value: Any, depth: int) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: self._serialize_nested(nested_value, depth)
+                for (key, nested_value) in value.items()
+            }
+        elif isinstance(value, (list, tuple)):
+            return [self._serialize_nested(nested_value, depth) for nested_value in value]
+        elif isinstance(value, (Model, QuerySet)) or hasattr(value, "to_json"):
+            return self.serialize(value, depth)
+
+        return value
+
+    def _is_too_deep(self, depth: int) -> bool:
+        return self.max_depth is not None and depth > self.max_depth
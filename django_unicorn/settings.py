@@ -0,0 +1,19 @@
+from django.conf import settings
+
+
+def get_settings() -> dict:
+    """
+    Gets the `UNICORN` dictionary from the Django settings.
+    """
+    return getattr(settings, "UNICORN", {})
+
+
+def get_setting(name: str, default=None):
+    """
+    Gets a setting from the `UNICORN` dictionary in the Django settings.
+
+    Args:
+        param name: Name of the setting, e.g. "CONSTRUCTED_VIEWS_CACHE".
+        param default: Value to use if the setting is not set.
+    """
+    return get_settings().get(name, default)
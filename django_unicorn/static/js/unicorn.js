@@ -4,6 +4,15 @@ const Unicorn = (() => {
   const csrfTokenHeaderName = "X-CSRFToken";
   const components = {};
 
+  // Messages of multiple components that get sent together; see `postMessage`
+  let messageBatch = [];
+  // The one timer that sends the batch when the window is over
+  let messageBatchTimeout = null;
+  // Keep in sync with `MESSAGE_BATCH_MAX_SIZE` in views.py
+  const MESSAGE_BATCH_MAX_SIZE = 20;
+  // Same as the default debounce time of a message
+  const MESSAGE_BATCH_WAIT = 250;
+
   /**
    * Initializes the Unicorn object.
    */
@@ -129,6 +138,48 @@ const Unicorn = (() => {
     };
   }
 
+  /**
+   * Applies RFC 6902-style JSON patch operations (add, remove, replace) to data.
+   * Returns the patched data, which is a new object if the whole document gets replaced.
+   */
+  function applyPatch(data, patch) {
+    patch.forEach((operation) => {
+      if (operation.path === "") {
+        data = operation.value;
+        return;
+      }
+
+      const keys = operation.path
+        .split("/")
+        .slice(1)
+        .map((key) => key.replace(/~1/g, "/").replace(/~0/g, "~"));
+      const lastKey = keys.pop();
+      let parent = data;
+
+      keys.forEach((key) => {
+        parent = parent[key];
+      });
+
+      if (Array.isArray(parent)) {
+        const idx = lastKey === "-" ? parent.length : parseInt(lastKey, 10);
+
+        if (operation.op === "add") {
+          parent.splice(idx, 0, operation.value);
+        } else if (operation.op === "remove") {
+          parent.splice(idx, 1);
+        } else {
+          parent[idx] = operation.value;
+        }
+      } else if (operation.op === "remove") {
+        delete parent[lastKey];
+      } else {
+        parent[lastKey] = operation.value;
+      }
+    });
+
+    return data;
+  }
+
   /**
    * Traverses the DOM looking for child elements.
    */
@@ -346,6 +397,10 @@ const Unicorn = (() => {
       }
 
       this.data = args.data;
+      this.serverState = !!args.serverState;
+      this.includeData = false;
+      this.includeFullData = false;
+      this.fingerprint = args.fingerprint;
       this.syncUrl = `${messageUrl}/${this.name}`;
 
       this.root = undefined;
@@ -604,29 +659,21 @@ const Unicorn = (() => {
 
         const body = {
           id: _component.id,
-          data: _component.data,
           checksum: _component.checksum,
           actionQueue: _component.currentActionQueue,
+          fingerprint: _component.fingerprint,
         };
 
-        const headers = {
-          Accept: "application/json",
-          "X-Requested-With": "XMLHttpRequest",
-        };
-        headers[csrfTokenHeaderName] = getCsrfToken();
-
-        fetch(_component.syncUrl, {
-          method: "POST",
-          headers,
-          body: JSON.stringify(body),
-        })
-          .then((response) => {
-            if (response.ok) {
-              return response.json();
-            }
+        // The server keeps the data for server state components, so only send it when asked
+        if (!_component.serverState || _component.includeData) {
+          body.data = _component.data;
+        }
 
-            throw Error(`Error when getting response: ${response.statusText} (${response.status})`);
-          })
+        if (_component.includeFullData) {
+          body.fullData = true;
+        }
+
+        postMessage(_component, body)
           .then((responseJson) => {
             if (!responseJson) {
               return;
@@ -637,6 +684,41 @@ const Unicorn = (() => {
               throw Error(responseJson.error);
             }
 
+            if (responseJson.resync) {
+              // The server is missing the data, so send the same actions again with the data
+              _component.actionQueue = _component.currentActionQueue.concat(_component.actionQueue);
+              _component.currentActionQueue = null;
+              _component.includeData = true;
+              _sendMessage(_component);
+
+              return;
+            }
+
+            _component.includeData = false;
+            _component.includeFullData = false;
+
+            if (responseJson.patch && responseJson.baseChecksum !== _component.checksum) {
+              // The data changed since the message was sent (e.g. by the response of another
+              // message), so the patch doesn't apply to it; refresh to get all of the data instead
+              _component.currentActionQueue = null;
+              _component.actionQueue.push({ type: "callMethod", payload: { name: "refresh" } });
+              _component.includeFullData = true;
+              _sendMessage(_component);
+
+              return;
+            }
+
+            if (responseJson.unchanged) {
+              // Nothing changed on the server, so there is nothing to merge
+              _component.currentActionQueue = null;
+
+              if (callback && typeof callback === "function") {
+                callback(true, null);
+              }
+
+              return;
+            }
+
             // Remove any unicorn validation messages before trying to merge with morphdom
             _component.modelEls.forEach((element) => {
               // Re-initialize element to make sure it is up to date
@@ -644,9 +726,15 @@ const Unicorn = (() => {
               element.removeErrors();
             });
 
-            // Get the data from the response
-            _component.data = responseJson.data || {};
+            // Get the data from the response, which is either a patch or all of the data
+            if (responseJson.patch) {
+              _component.data = applyPatch(_component.data, responseJson.patch);
+            } else {
+              _component.data = responseJson.data || {};
+            }
+
             _component.errors = responseJson.errors || {};
+            _component.fingerprint = responseJson.fingerprint;
             const rerenderedComponent = responseJson.dom;
 
             const morphdomOptions = {
@@ -672,8 +760,31 @@ const Unicorn = (() => {
               },
             };
 
-            // eslint-disable-next-line no-undef
-            morphdom(_component.root, rerenderedComponent, morphdomOptions);
+            if (responseJson.domPatches) {
+              // Only the keyed elements that changed were sent, so morph each of them
+              const keyedElements = {};
+
+              walk(_component.root, (el) => {
+                const key = el.getAttribute("unicorn:key") || el.id;
+
+                // Keep the outermost element for a key, which comes first in the walk
+                if (key && !keyedElements[key]) {
+                  keyedElements[key] = el;
+                }
+              });
+
+              responseJson.domPatches.forEach((domPatch) => {
+                if (keyedElements[domPatch.key]) {
+                  // eslint-disable-next-line no-undef
+                  morphdom(keyedElements[domPatch.key], domPatch.dom, morphdomOptions);
+                }
+              });
+
+              _component.root.setAttribute("unicorn:checksum", responseJson.checksum);
+            } else {
+              // eslint-disable-next-line no-undef
+              morphdom(_component.root, rerenderedComponent, morphdomOptions);
+            }
 
             // Refresh the checksum based on the new data
             _component.refreshChecksum();
@@ -729,6 +840,86 @@ const Unicorn = (() => {
     }
   }
 
+  /**
+   * Posts a message body to the url and returns the parsed JSON response.
+   */
+  function fetchMessage(url, body) {
+    const headers = {
+      Accept: "application/json",
+      "X-Requested-With": "XMLHttpRequest",
+    };
+    headers[csrfTokenHeaderName] = getCsrfToken();
+
+    return fetch(url, {
+      method: "POST",
+      headers,
+      body: JSON.stringify(body),
+    }).then((response) => {
+      if (response.ok) {
+        return response.json();
+      }
+
+      throw Error(`Error when getting response: ${response.statusText} (${response.status})`);
+    });
+  }
+
+  /**
+   * Sends the messages in the batch. A single message gets posted to its component's url,
+   * multiple messages get posted together to the batch url.
+   */
+  function sendMessageBatch() {
+    const batch = messageBatch;
+    messageBatch = [];
+
+    // The batch could be sent before the window is over, so the timer isn't needed anymore
+    clearTimeout(messageBatchTimeout);
+    messageBatchTimeout = null;
+
+    if (batch.length === 0) {
+      return;
+    }
+
+    if (batch.length === 1) {
+      fetchMessage(batch[0].component.syncUrl, batch[0].body).then(batch[0].resolve, batch[0].reject);
+
+      return;
+    }
+
+    const body = batch.map((message) => Object.assign({ name: message.component.name }, message.body));
+
+    fetchMessage(messageUrl, body)
+      .then((responseJson) => {
+        if (!Array.isArray(responseJson)) {
+          throw Error((responseJson && responseJson.error) || "Invalid batch response");
+        }
+
+        batch.forEach((message, idx) => message.resolve(responseJson[idx]));
+      })
+      .catch((err) => {
+        batch.forEach((message) => message.reject(err));
+      });
+  }
+
+  /**
+   * Posts the message body for a component. The first message starts a window the length of
+   * the default debounce time; all messages that get posted during it are sent in one request.
+   * The batch gets sent right away when it has `MESSAGE_BATCH_MAX_SIZE` messages.
+   * @param {Object} component The component that sends the message.
+   * @param {Object} body The message body.
+   * @returns {Promise} Resolves with the response for the component.
+   */
+  function postMessage(component, body) {
+    return new Promise((resolve, reject) => {
+      messageBatch.push({ component, body, resolve, reject });
+
+      if (messageBatch.length >= MESSAGE_BATCH_MAX_SIZE) {
+        sendMessageBatch();
+      } else if (messageBatchTimeout === null) {
+        messageBatchTimeout = setTimeout(sendMessageBatch, MESSAGE_BATCH_WAIT);
+      }
+    });
+  }
+
   /**
    * Initializes the component.
    */
@@ -1 +1 @@
-"use strict";var _createClass=function(){function i(e,t){for(var n=0;n<t.length;n++){var i=t[n];i.enumerable=i.enumerable||!1,i.configurable=!0,"value"in i&&(i.writable=!0),Object.defineProperty(e,i.key,i)}}return function(e,t,n){return t&&i(e.prototype,t),n&&i(e,n),e}}();function _classCallCheck(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}var Unicorn=function(){var e={},n="",o={};function i(e,t){return-1<e.indexOf(t)}function r(e){return void 0===e||0===Object.keys(e).length&&e.constructor===Object}function a(r,a,s){var l=this,u=void 0;return void 0===s&&(s=!0),function(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];var i=l,o=s&&!u;clearTimeout(u),u=setTimeout(function(){u=null,s||r.apply(i,t)},a),o&&r.apply(i,t)}}e.init=function(e){n=e};var s=(_createClass(t,[{key:"init",value:function(){var e,t,n=this;i(this.name,"unicorn:")&&(this.isUnicorn=!0,i(this.name,"unicorn:model")?this.isModel=!0:i(this.name,"unicorn:poll")?this.isPoll=!0:"unicorn:key"===this.name?this.isKey=!0:i(this.name,"unicorn:error:")?this.isError=!0:"id"!==(e=this.name.replace("unicorn:",""))&&"name"!==e&&"checksum"!==e&&(this.eventType=e),t=this.name,this.eventType&&(t=this.eventType),t.split(".").slice(1).forEach(function(e){var t=e.split("-");n.modifiers[t[0]]=!(1<t.length)||t[1]}))}}]),t);function t(e){_classCallCheck(this,t),this.attribute=e,this.name=this.attribute.name,this.value=this.attribute.value,this.isUnicorn=!1,this.isModel=!1,this.isPoll=!1,this.isKey=!1,this.isError=!1,this.modifiers={},this.eventType=null,this.init()}var l=(_createClass(u,[{key:"init",value:function(){if(this.id=this.el.id,this.isUnicorn=!1,this.attributes=[],this.value=this.getValue(),this.model={},this.poll={},this.action={},this.key=void 0,this.errors=[],this.el.attributes)for(var e=0;e<this.el.attributes.length;e++){var t,n=new s(this.el.attributes[e]);this.attributes.push(n),n.isUnicorn&&(this.isUnicorn=!0),n.isModel?(this.model.name=n.value,this.model.eventType=n.modifiers.lazy?"blur":"input",this.model.isLazy=!!n.modifiers.lazy,this.model.debounceTime=n.modifiers.debounce&&parseInt(n.modifiers.debounce,10)||-1):n.isPoll?(this.poll.method=n.value?n.value:"refresh",this.poll.timing=parseInt(Object.keys(n.modifiers)[0],10)||2e3):n.eventType&&(this.action.name=n.value,this.action.eventType=n.eventType,n.modifiers&&(this.action.key=Object.keys(n.modifiers)[0]),this.action.key&&(this.action.eventType=this.action.eventType.replace("."+this.action.key,""))),n.isKey&&(this.key=n.value),n.isError&&(t=n.name.replace("unicorn:name:",""),this.errors.push({code:t,message:n.value}))}}},{key:"focus",value:function(){this.el.focus()}},{key:"getValue",value:function(){var e=this.el.value;if(this.el.type)if("checkbox"===this.el.type.toLowerCase())e=this.el.checked;else if("select-multiple"===this.el.type.toLowerCase()){e=[];for(var t=0;t<this.el.selectedOptions.length;t++)e.push(this.el.selectedOptions[t].value)}return e}},{key:"setValue",value:function(e){"radio"===this.el.type.toLowerCase()?this.el.value===e&&(this.el.checked=!0):"checkbox"===this.el.type.toLowerCase()?this.el.checked=e:this.el.value=e}},{key:"addError",value:function(e){this.errors.push(e),this.el.setAttribute("unicorn:error:"+e.code,e.message)}},{key:"removeErrors",value:function(){var t=this;this.errors.forEach(function(e){t.el.removeAttribute(e.code)}),this.errors=[]}}]),u);function u(e){_classCallCheck(this,u),this.el=e,this.init()}var c=(_createClass(d,[{key:"init",value:function(){var e,t;if(this.root=(e='[unicorn\\:id="'+this.id+'"]',void 0===t&&(t=document),t.querySelector(e)),!this.root)throw Error("No id found");this.refreshChecksum()}},{key:"addActionEventListener",value:function(e){var i=this;document.addEventListener(e,function(t){var n=new l(t.target);n&&n.isUnicorn&&!r(n.action)&&i.actionEvents[e].forEach(function(e){!n.el.isSameNode(e.el)||e.action.key&&e.action.key!==t.key.match(/[A-Z]{2,}(?=[A-Z][a-z]+[0-9]*|\b)|[A-Z]?[a-z]+[0-9]*|[A-Z]|[0-9]+/g).map(function(e){return e.toLowerCase()}).join("-")||i.callMethod(e.action.name)})})}},{key:"addModelEventListener",value:function(n,e){var i=this;n.el.addEventListener(e,function(){var e={type:"syncInput",payload:{name:n.model.name,value:n.getValue()}};i.actionQueue.push(e),i.sendMessage(n.model.debounceTime,function(e,t){t?console.error(t):e?i.setModelValues(n):i.setModelValues()})})}},{key:"refreshEventListeners",value:function(){var n=this;this.actionEvents={},function(e,t){for(var n=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,null,!1);n.nextNode();)t(n.currentNode)}(this.root,function(e){var t;e.isSameNode(n.root)||(t=new l(e)).isUnicorn&&(r(t.model)||0===n.modelEls.filter(function(e){return e.el.isSameNode(t.el)}).length&&(n.modelEls.push(t),n.addModelEventListener(t,t.model.eventType)),r(t.action)||(n.actionEvents[t.action.eventType]?n.actionEvents[t.action.eventType].push(t):(n.actionEvents[t.action.eventType]=[t],0===n.attachedEventTypes.filter(function(e){return e===t.action.eventType}).length&&(n.attachedEventTypes.push(t.action.eventType),n.addActionEventListener(t.action.eventType)))))})}},{key:"callMethod",value:function(e,n){var i=this,t={type:"callMethod",payload:{name:e,params:[]}};this.actionQueue.push(t),this.sendMessage(-1,function(e,t){t&&"function"==typeof n?n(t):t?console.error(t):i.setModelValues()})}},{key:"initPolling",value:function(){var e=this,t=new l(this.root);t.isUnicorn&&!r(t.poll)&&(this.poll=t.poll,this.poll.timer=null,document.addEventListener("visibilitychange",function(){document.hidden?e.poll.timer&&clearInterval(e.poll.timer):e.startPolling()},!1),this.startPolling())}},{key:"startPolling",value:function(){function e(e){e&&console.error(e),this.poll.timer&&clearInterval(this.poll.timer)}this.poll.timer=null,this.callMethod(this.poll.method,e),this.poll.timer=setInterval(this.callMethod.bind(this),this.poll.timing,this.poll.method,e)}},{key:"refreshChecksum",value:function(){this.checksum=this.root.getAttribute("unicorn:checksum")}},{key:"setValue",value:function(e){for(var t=e.model.name.split("."),n=this.data,i=0;i<t.length;i++){var o=t[i];Object.prototype.hasOwnProperty.call(n,o)&&(i===t.length-1?e.setValue(n[o]):n=n[o])}}},{key:"setModelValues",value:function(n){var i=this,o=!1;r(n=n||{})||n.model.isLazy||["id","key"].forEach(function(t){i.modelEls.forEach(function(e){o||n[t]&&n[t]===e[t]&&(e.focus(),o=!0)})}),this.modelEls.forEach(function(e){e.id===n.id&&e.key===n.key||i.setValue(e)})}},{key:"sendMessage",value:function(e,o){function t(i){var e,t;0!==i.actionQueue.length&&i.currentActionQueue!==i.actionQueue&&(i.currentActionQueue=i.actionQueue,i.actionQueue=[],e={id:i.id,data:i.data,checksum:i.checksum,actionQueue:i.currentActionQueue},(t={Accept:"application/json","X-Requested-With":"XMLHttpRequest"})["X-CSRFToken"]=function(){var e=document.getElementsByName("csrfmiddlewaretoken");if(e)return e[0].getAttribute("value");throw Error("CSRF token is missing. Do you need to add {% csrf_token %}?")}(),fetch(i.syncUrl,{method:"POST",headers:t,body:JSON.stringify(e)}).then(function(e){if(e.ok)return e.json();throw Error("Error when getting response: "+e.statusText+" ("+e.status+")")}).then(function(e){if(e){if(e.error)throw Error(e.error);i.modelEls.forEach(function(e){e.init(),e.removeErrors()}),i.data=e.data||{},i.errors=e.errors||{};var t=e.dom;morphdom(i.root,t,{childrenOnly:!1,getNodeKey:function(e){if(e.attributes){var t=e.getAttribute("unicorn:key")||e.id;if(t)return t}},onBeforeElUpdated:function(e,t){if(e.isEqualNode(t))return!1}}),i.refreshChecksum(),i.refreshEventListeners(),i.modelEls.forEach(function(n){Object.keys(i.errors).forEach(function(e){var t;n.model.name===e&&(t=i.errors[e][0],n.addError(t))})});var n=!1;i.currentActionQueue.forEach(function(e){"callMethod"===e.type&&(n=!0)}),i.currentActionQueue=null,o&&"function"==typeof o&&o(!n,null)}}).catch(function(e){i.actionQueue=[],i.currentActionQueue=null,o&&"function"==typeof o&&o(null,e)}))}a(t,-1===e?250:e,!1)(this)}}]),d);function d(e){var t;_classCallCheck(this,d),this.id=e.id,this.name=e.name,i(this.name,".")&&(t=this.name.split("."),this.name=t[t.length-2]),this.data=e.data,this.syncUrl=n+"/"+this.name,this.root=void 0,this.modelEls=[],this.errors={},this.poll={},this.actionQueue=[],this.currentActionQueue=null,this.actionEvents={},this.attachedEventTypes=[],this.init(),this.refreshEventListeners(),this.initPolling()}return e.componentInit=function(e){var t=new c(e);t.init(),(o[t.id]=t).setModelValues()},e.call=function(n,e){var i=void 0;if(Object.keys(o).forEach(function(e){var t;void 0!==i||(t=o[e]).name===n&&(i=t)}),!i)throw Error("No component found for: ",n);i.callMethod(e,function(e){console.error(e)})},e}(),_typeof="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};!function(e,t){"object"===("undefined"==typeof exports?"undefined":_typeof(exports))&&"undefined"!=typeof module?module.exports=t():"function"==typeof define&&define.amd?define(t):(e=e||self).morphdom=t()}(void 0,function(){var a;var S="http://www.w3.org/1999/xhtml",M="undefined"==typeof document?void 0:document,s=!!M&&"content"in M.createElement("template"),l=!!M&&M.createRange&&"createContextualFragment"in M.createRange();function w(e){return e=e.trim(),s?(n=e,(i=M.createElement("template")).innerHTML=n,i.content.childNodes[0]):l?(t=e,a||(a=M.createRange()).selectNode(M.body),a.createContextualFragment(t).childNodes[0]):(o=e,(r=M.createElement("body")).innerHTML=o,r.childNodes[0]);var t,n,i,o,r}function L(e,t){var n,i,o=e.nodeName,r=t.nodeName;return o===r||(n=o.charCodeAt(0),i=r.charCodeAt(0),n<=90&&97<=i?o===r.toUpperCase():i<=90&&97<=n&&r===o.toUpperCase())}function o(e,t,n){e[n]!==t[n]&&(e[n]=t[n],e[n]?e.setAttribute(n,""):e.removeAttribute(n))}var O,U={OPTION:function(e,t){var n,i=e.parentNode;i&&("OPTGROUP"===(n=i.nodeName.toUpperCase())&&(n=(i=i.parentNode)&&i.nodeName.toUpperCase()),"SELECT"!==n||i.hasAttribute("multiple")||(e.hasAttribute("selected")&&!t.selected&&(e.setAttribute("selected","selected"),e.removeAttribute("selected")),i.selectedIndex=-1)),o(e,t,"selected")},INPUT:function(e,t){o(e,t,"checked"),o(e,t,"disabled"),e.value!==t.value&&(e.value=t.value),t.hasAttribute("value")||e.removeAttribute("value")},TEXTAREA:function(e,t){var n=t.value;e.value!==n&&(e.value=n);var i=e.firstChild;if(i){var o=i.nodeValue;if(o==n||!n&&o==e.placeholder)return;i.nodeValue=n}},SELECT:function(e,t){if(!t.hasAttribute("multiple")){for(var n,i,o=-1,r=0,a=e.firstChild;a;)if("OPTGROUP"===(i=a.nodeName&&a.nodeName.toUpperCase()))a=(n=a).firstChild;else{if("OPTION"===i){if(a.hasAttribute("selected")){o=r;break}r++}!(a=a.nextSibling)&&n&&(a=n.nextSibling,n=null)}e.selectedIndex=o}}};function x(){}function V(e){if(e)return e.getAttribute&&e.getAttribute("id")||e.id}return O=function(e,t){var n,i,o,r,a=t.attributes;if(11!==t.nodeType&&11!==e.nodeType){for(var s=a.length-1;0<=s;s--)i=(n=a[s]).name,o=n.namespaceURI,r=n.value,o?(i=n.localName||i,e.getAttributeNS(o,i)!==r&&("xmlns"===n.prefix&&(i=n.name),e.setAttributeNS(o,i,r))):e.getAttribute(i)!==r&&e.setAttribute(i,r);for(var l=e.attributes,u=l.length-1;0<=u;u--)i=(n=l[u]).name,(o=n.namespaceURI)?(i=n.localName||i,t.hasAttributeNS(o,i)||e.removeAttributeNS(o,i)):t.hasAttribute(i)||e.removeAttribute(i)}},function(e,t,n){var i;n=n||{},"string"==typeof t&&("#document"===e.nodeName||"HTML"===e.nodeName||"BODY"===e.nodeName?(i=t,(t=M.createElement("html")).innerHTML=i):t=w(t));var f=n.getNodeKey||V,v=n.onBeforeNodeAdded||x,m=n.onNodeAdded||x,o=n.onBeforeElUpdated||x,r=n.onElUpdated||x,a=n.onBeforeNodeDiscarded||x,s=n.onNodeDiscarded||x,l=n.onBeforeElChildrenUpdated||x,u=!0===n.childrenOnly,p=Object.create(null),c=[];function y(e){c.push(e)}function b(e,t,n){!1!==a(e)&&(t&&t.removeChild(e),s(e),function e(t,n){if(1===t.nodeType)for(var i=t.firstChild;i;){var o=void 0;n&&(o=f(i))?y(o):(s(i),i.firstChild&&e(i,n)),i=i.nextSibling}}(e,n))}function E(e,t,n){var i=f(t);if(i&&delete p[i],!n){if(!1===o(e,t))return;if(O(e,t),r(e),!1===l(e,t))return}"TEXTAREA"!==e.nodeName?function(e,t){var n,i,o,r,a,s,l=t.firstChild,u=e.firstChild;e:for(;l;){for(r=l.nextSibling,n=f(l);u;){if(o=u.nextSibling,l.isSameNode&&l.isSameNode(u)){l=r,u=o;continue e}i=f(u);var c=u.nodeType,d=void 0;if(c===l.nodeType&&(1===c?(n?n!==i&&((a=p[n])&&o!==a?(e.insertBefore(a,u),i?y(i):b(u,e,!0),u=a):d=!1):i&&(d=!1),(d=!1!==d&&L(u,l))&&E(u,l)):3!==c&&8!=c||(d=!0,u.nodeValue!==l.nodeValue&&(u.nodeValue=l.nodeValue))),d){l=r,u=o;continue e}i?y(i):b(u,e,!0),u=o}n&&(a=p[n])&&L(a,l)?(e.appendChild(a),E(a,l)):!1!==(s=v(l))&&(s&&(l=s),l.actualize&&(l=l.actualize(e.ownerDocument||M)),e.appendChild(l),function e(t){m(t);for(var n=t.firstChild;n;){var i,o=n.nextSibling,r=f(n);r&&(i=p[r])&&L(n,i)?(n.parentNode.replaceChild(i,n),E(i,n)):e(n),n=o}}(l)),l=r,u=o}!function(e,t,n){for(;t;){var i=t.nextSibling;(n=f(t))?y(n):b(t,e,!0),t=i}}(e,u,i);var h=U[e.nodeName];h&&h(e,t)}(e,t):e.innerHTML!=t.innerHTML&&U.TEXTAREA(e,t)}!function e(t){if(1===t.nodeType||11===t.nodeType)for(var n=t.firstChild;n;){var i=f(n);i&&(p[i]=n),e(n),n=n.nextSibling}}(e);var d,h,g=e,k=g.nodeType,T=t.nodeType;if(!u)if(1===k)1===T?L(e,t)||(s(e),g=function(e,t){for(var n=e.firstChild;n;){var i=n.nextSibling;t.appendChild(n),n=i}return t}(e,(d=t.nodeName,(h=t.namespaceURI)&&h!==S?M.createElementNS(h,d):M.createElement(d)))):g=t;else if(3===k||8===k){if(T===k)return g.nodeValue!==t.nodeValue&&(g.nodeValue=t.nodeValue),g;g=t}if(g===t)s(e);else{if(t.isSameNode&&t.isSameNode(g))return;if(E(g,t,u),c)for(var N=0,C=c.length;N<C;N++){var A=p[c[N]];A&&b(A,A.parentNode,!1)}}return!u&&g!==e&&e.parentNode&&(g.actualize&&(g=g.actualize(e.ownerDocument||M)),e.parentNode.replaceChild(g,e)),g}});
\ No newline at end of file
+"use strict";var _createClass=function(){function a(e,d){for(var c=0; c<d.length; c++){var b=d[c];b.enumerable=b.enumerable||false;b.configurable=true;if("value"in b)b.writable=true;Object.defineProperty(e,b.key,b);}}return function(b,d,c){if(d)a(b.prototype,d);if(c)a(b,c);return b;};}();function _classCallCheck(a,b){if(!(a instanceof b)){throw new TypeError("Cannot call a class as a function");}}var Unicorn=function(){var c={};var h="";var t="X-CSRFToken";var l={};var e=[];var d=null;var v=20;var u=250;c.init=function(a){h=a;};function b(a,c){return a.indexOf(c)>-1;}function a(b){return typeof b==="undefined"||Object.keys(b).length===0&&b.constructor===Object;}function r(b,a){if(a===undefined){a=document;}return a.querySelector(b);}function p(){var a=document.getElementsByName("csrfmiddlewaretoken");if(a){return a[0].getAttribute("value");}throw Error("CSRF token is missing. Do you need to add {% csrf_token %}?");}function n(a){return a.match(/[A-Z]{2,}(?=[A-Z][a-z]+[0-9]*|\b)|[A-Z]?[a-z]+[0-9]*|[A-Z]|[0-9]+/g).map(function(a){return a.toLowerCase();}).join("-");}function k(c,d,b){var e=this;var a=void 0;if(typeof b==="undefined"){b=true;}return function(){for(var j=arguments.length,h=Array(j),f=0; f<j; f++){h[f]=arguments[f];}var i=e;var g=function g(){a=null;if(!b){c.apply(i,h);}};var k=b&&!a;clearTimeout(a);a=setTimeout(g,d);if(k){c.apply(i,h);}};}var i=[];function s(e,d){var c=void 0;var b=function b(){var d=void 0;c=false;if(i.length){d=i.shift();a(d);}};var a=function a(f){c=true;e(f);setTimeout(b,d);};return function(b){if(c){i.push(b);}else{a(b);}};}function q(a,b){b.forEach(function(c){if(c.path===""){a=c.value;return;}var f=c.path.split("/").slice(1).map(function(a){return a.replace(/~1/g,"/").replace(/~0/g,"~");});var d=f.pop();var b=a;f.forEach(function(a){b=b[a];});if(Array.isArray(b)){var e=d==="-"?b.length:parseInt(d,10);if(c.op==="add"){b.splice(e,0,c.value);}else if(c.op==="remove"){b.splice(e,1);}else{b[e]=c.value;}}else if(c.op==="remove"){delete b[d];}else{b[d]=c.value;}});return a;}function f(b,c){var a=document.createTreeWalker(b,NodeFilter.SHOW_ELEMENT,null,false);while(a.nextNode()){c(a.currentNode);}}var x=function(){function a(b){_classCallCheck(this,a);this.attribute=b;this.name=this.attribute.name;this.value=this.attribute.value;this.isUnicorn=false;this.isModel=false;this.isPoll=false;this.isKey=false;this.isError=false;this.modifiers={};this.eventType=null;this.init();}_createClass(a,[{key:"init",value:function c(){var e=this;if(b(this.name,"unicorn:")){this.isUnicorn=true;if(b(this.name,"unicorn:model")){this.isModel=true;}else if(b(this.name,"unicorn:poll")){this.isPoll=true;}else if(this.name==="unicorn:key"){this.isKey=true;}else if(b(this.name,"unicorn:error:")){this.isError=true;}else{var a=this.name.replace("unicorn:","");if(a!=="id"&&a!=="name"&&a!=="checksum"){this.eventType=a;}}var d=this.name;if(this.eventType){d=this.eventType;}d.split(".").slice(1).forEach(function(b){var a=b.split("-");e.modifiers[a[0]]=a.length>1?a[1]:true;});}}}]);return a;}();var m=function(){function a(b){_classCallCheck(this,a);this.el=b;this.init();}_createClass(a,[{key:"init",value:function d(){this.id=this.el.id;this.isUnicorn=false;this.attributes=[];this.value=this.getValue();this.model={};this.poll={};this.action={};this.key=undefined;this.errors=[];if(!this.el.attributes){return;}for(var b=0; b<this.el.attributes.length; b++){var a=new x(this.el.attributes[b]);this.attributes.push(a);if(a.isUnicorn){this.isUnicorn=true;}if(a.isModel){this.model.name=a.value;this.model.eventType=a.modifiers.lazy?"blur":"input";this.model.isLazy=!!a.modifiers.lazy;this.model.debounceTime=a.modifiers.debounce?parseInt(a.modifiers.debounce,10)||-1:-1;}else if(a.isPoll){this.poll.method=a.value?a.value:"refresh";this.poll.timing=parseInt(Object.keys(a.modifiers)[0],10)||2000;}else if(a.eventType){this.action.name=a.value;this.action.eventType=a.eventType;if(a.modifiers){this.action.key=Object.keys(a.modifiers)[0];}if(this.action.key){this.action.eventType=this.action.eventType.replace("."+this.action.key,"");}}if(a.isKey){this.key=a.value;}if(a.isError){var c=a.name.replace("unicorn:name:","");this.errors.push({code:c,message:a.value});}}}},{key:"focus",value:function f(){this.el.focus();}},{key:"getValue",value:function e(){var a=this.el.value;if(this.el.type){if(this.el.type.toLowerCase()==="checkbox"){a=this.el.checked;}else if(this.el.type.toLowerCase()==="select-multiple"){a=[];for(var b=0; b<this.el.selectedOptions.length; b++){a.push(this.el.selectedOptions[b].value);}}}return a;}},{key:"setValue",value:function b(a){if(this.el.type.toLowerCase()==="radio"){if(this.el.value===a){this.el.checked=true;}}else if(this.el.type.toLowerCase()==="checkbox"){this.el.checked=a;}else{this.el.value=a;}}},{key:"addError",value:function g(a){this.errors.push(a);this.el.setAttribute("unicorn:error:"+a.code,a.message);}},{key:"removeErrors",value:function c(){var a=this;this.errors.forEach(function(b){a.el.removeAttribute(b.code);});this.errors=[];}}]);return a;}();var w=function(){function c(a){_classCallCheck(this,c);this.id=a.id;this.name=a.name;if(b(this.name,".")){var d=this.name.split(".");this.name=d[d.length-2];}this.data=a.data;this.serverState=!!a.serverState;this.includeData=false;this.includeFullData=false;this.fingerprint=a.fingerprint;this.syncUrl=h+"/"+this.name;this.root=undefined;this.modelEls=[];this.errors={};this.poll={};this.actionQueue=[];this.currentActionQueue=null;this.actionEvents={};this.attachedEventTypes=[];this.init();this.refreshEventListeners();this.initPolling();}_createClass(c,[{key:"init",value:function s(){this.root=r("[unicorn\\:id=\""+this.id+"\"]");if(!this.root){throw Error("No id found");}this.refreshChecksum();}},{key:"addActionEventListener",value:function v(c){var b=this;document.addEventListener(c,function(e){var d=new m(e.target);if(d&&d.isUnicorn&&!a(d.action)){b.actionEvents[c].forEach(function(a){if(d.el.isSameNode(a.el)){if(a.action.key){if(a.action.key===n(e.key)){b.callMethod(a.action.name);}}else{b.callMethod(a.action.name);}}});}});}},{key:"addModelEventListener",value:function u(a,c){var b=this;a.el.addEventListener(c,function(){var c={type:"syncInput",payload:{name:a.model.name,value:a.getValue()}};b.actionQueue.push(c);b.sendMessage(a.model.debounceTime,function(d,c){if(c){console.error(c);}else if(d){b.setModelValues(a);}else{b.setModelValues();}});});}},{key:"refreshEventListeners",value:function j(){var b=this;this.actionEvents={};f(this.root,function(d){if(d.isSameNode(b.root)){return;}var c=new m(d);if(c.isUnicorn){if(!a(c.model)){if(b.modelEls.filter(function(a){return a.el.isSameNode(c.el);}).length===0){b.modelEls.push(c);b.addModelEventListener(c,c.model.eventType);}}if(!a(c.action)){if(b.actionEvents[c.action.eventType]){b.actionEvents[c.action.eventType].push(c);}else{b.actionEvents[c.action.eventType]=[c];if(b.attachedEventTypes.filter(function(a){return a===c.action.eventType;}).length===0){b.attachedEventTypes.push(c.action.eventType);b.addActionEventListener(c.action.eventType);}}}}});}},{key:"callMethod",value:function t(b,a){var d=this;var c={type:"callMethod",payload:{name:b,params:[]}};this.actionQueue.push(c);this.sendMessage(-1,function(c,b){if(b&&typeof a==="function"){a(b);}else if(b){console.error(b);}else{d.setModelValues();}});}},{key:"initPolling",value:function p(){var c=this;var b=new m(this.root);if(b.isUnicorn&&!a(b.poll)){this.poll=b.poll;this.poll.timer=null;document.addEventListener("visibilitychange",function(){if(document.hidden){if(c.poll.timer){clearInterval(c.poll.timer);}}else{c.startPolling();}},false);this.startPolling();}}},{key:"startPolling",value:function d(){this.poll.timer=null;function a(b){if(b){console.error(b);}if(this.poll.timer){clearInterval(this.poll.timer);}}this.callMethod(this.poll.method,a);this.poll.timer=setInterval(this.callMethod.bind(this),this.poll.timing,this.poll.method,a);}},{key:"refreshChecksum",value:function l(){this.checksum=this.root.getAttribute("unicorn:checksum");}},{key:"setValue",value:function e(f){var c=f.model.name.split(".");var b=this.data;for(var a=0; a<c.length; a++){var d=c[a];if(Object.prototype.hasOwnProperty.call(b,d)){if(a===c.length-1){f.setValue(b[d]);}else{b=b[d];}}}}},{key:"setModelValues",value:function g(b){var d=this;b=b||{};var c=false;if(!a(b)&&!b.model.isLazy){["id","key"].forEach(function(a){d.modelEls.forEach(function(d){if(!c){if(b[a]&&b[a]===d[a]){d.focus();c=true;}}});});}this.modelEls.forEach(function(a){if(a.id!==b.id||a.key!==b.key){d.setValue(a);}});}},{key:"sendMessage",value:function i(c,a){function b(c){if(c.actionQueue.length===0){return;}if(c.currentActionQueue===c.actionQueue){return;}c.currentActionQueue=c.actionQueue;c.actionQueue=[];var d={id:c.id,checksum:c.checksum,actionQueue:c.currentActionQueue,fingerprint:c.fingerprint};if(!c.serverState||c.includeData){d.data=c.data;}if(c.includeFullData){d.fullData=true;}o(c,d).then(function(d){if(!d){return;}if(d.error){throw Error(d.error);}if(d.resync){c.actionQueue=c.currentActionQueue.concat(c.actionQueue);c.currentActionQueue=null;c.includeData=true;b(c);return;}c.includeData=false;c.includeFullData=false;if(d.patch&&d.baseChecksum!==c.checksum){c.currentActionQueue=null;c.actionQueue.push({type:"callMethod",payload:{name:"refresh"}});c.includeFullData=true;b(c);return;}if(d.unchanged){c.currentActionQueue=null;if(a&&typeof a==="function"){a(true,null);}return;}c.modelEls.forEach(function(a){a.init();a.removeErrors();});if(d.patch){c.data=q(c.data,d.patch);}else{c.data=d.data||{};}c.errors=d.errors||{};c.fingerprint=d.fingerprint;var i=d.dom;var g={childrenOnly:false,getNodeKey:function k(a){if(a.attributes){var b=a.getAttribute("unicorn:key")||a.id;if(b){return b;}}},onBeforeElUpdated:function j(b,a){if(b.isEqualNode(a)){return false;}}};if(d.domPatches){var e={};f(c.root,function(b){var a=b.getAttribute("unicorn:key")||b.id;if(a&&!e[a]){e[a]=b;}});d.domPatches.forEach(function(a){if(e[a.key]){morphdom(e[a.key],a.dom,g);}});c.root.setAttribute("unicorn:checksum",d.checksum);}else{morphdom(c.root,i,g);}c.refreshChecksum();c.refreshEventListeners();c.modelEls.forEach(function(a){Object.keys(c.errors).forEach(function(b){if(a.model.name===b){var d=c.errors[b][0];a.addError(d);}});});var h=false;c.currentActionQueue.forEach(function(a){if(a.type==="callMethod"){h=true;}});c.currentActionQueue=null;if(a&&typeof a==="function"){a(!h,null);}}).catch(function(b){c.actionQueue=[];c.currentActionQueue=null;if(a&&typeof a==="function"){a(null,b);}});}if(c===-1){k(b,250,false)(this);}else{k(b,c,false)(this);}}}]);return c;}();function j(b,c){var a={Accept:"application/json","X-Requested-With":"XMLHttpRequest"};a[t]=p();return fetch(b,{method:"POST",headers:a,body:JSON.stringify(c)}).then(function(a){if(a.ok){return a.json();}throw Error("Error when getting response: "+a.statusText+" ("+a.status+")");});}function g(){var a=e;e=[];clearTimeout(d);d=null;if(a.length===0){return;}if(a.length===1){j(a[0].component.syncUrl,a[0].body).then(a[0].resolve,a[0].reject);return;}var b=a.map(function(a){return Object.assign({name:a.component.name},a.body);});j(h,b).then(function(b){if(!Array.isArray(b)){throw Error(b&&b.error||"Invalid batch response");}a.forEach(function(a,c){return a.resolve(b[c]);});}).catch(function(b){a.forEach(function(a){return a.reject(b);});});}function o(a,b){return new Promise(function(c,f){e.push({component:a,body:b,resolve:c,reject:f});if(e.length>=v){g();}else if(d===null){d=setTimeout(g,u);}});}c.componentInit=function(b){var a=new w(b);a.init();l[a.id]=a;a.setModelValues();};c.call=function(b,c){var a=void 0;Object.keys(l).forEach(function(d){if(typeof a==="undefined"){var c=l[d];if(c.name===b){a=c;}}});if(!a){throw Error("No component found for: ",b);}a.callMethod(c,function(a){console.error(a);});};return c;}();
\ No newline at end of file
@@ -0,0 +1,37 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .components import UnicornView
+
+
+def assert_render_queries(
+    component: UnicornView, expected_count: int, init_js: bool = False
+) -> str:
+    """
+    Renders the component and asserts that rendering it ran the expected number of
+    queries, e.g. to make sure `Meta.select_related` and `Meta.prefetch_related` keep
+    a component from running a query per row.
+
+    Args:
+        param component: The component to render.
+        param expected_count: The number of queries that rendering should run.
+        param init_js: Whether or not to include the Javascript required to initialize
+            the component.
+
+    Returns:
+        The rendered component.
+    """
+    with CaptureQueriesContext(connection) as captured_queries:
+        rendered_component = component.render(init_js=init_js)
+
+    query_count = len(captured_queries)
+    queries = "\n".join(
+        f"{idx}. {query['sql']}"
+        for (idx, query) in enumerate(captured_queries.captured_queries, start=1)
+    )
+
+    assert (
+        query_count == expected_count
+    ), f"Rendering the '{component.component_name}' component ran {query_count} queries instead of {expected_count}:\n{queries}"
+
+    return rendered_component
@@ -0,0 +1,459 @@
+import hashlib
+import hmac
+import re
+from html import escape
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+
+import shortuuid
+from django.conf import settings
+
+
+# Whitespace and HTML comments that are allowed before the root element
+ROOT_PREFIX_RE = re.compile(r"\s*(?:<!--.*?-->\s*)*", re.DOTALL)
+
+# Opening `div` tag; quoted attribute values can contain `>`
+ROOT_START_TAG_RE = re.compile(
+    r"""<div(?=[\s/>])(?:"[^"]*"|'[^']*'|[^'">])*>""", re.IGNORECASE
+)
+
+# Unicorn attributes that get written into the root element
+ROOT_ATTRIBUTE_RE = re.compile(r"\sunicorn:(?:id|name|checksum)\s*=", re.IGNORECASE)
+
+ROOT_END_TAG = "</div>"
+
+# Opening or closing `div` tag, to find the tag that closes the root element
+DIV_TAG_RE = re.compile(
+    r"""<(/?)div(?=[\s/>])(?:"[^"]*"|'[^']*'|[^'">])*?(/?)>""", re.IGNORECASE
+)
+
+
+def generate_checksum(data: bytes) -> str:
+    """
+    Generates a short checksum of the data based on the `SECRET_KEY`.
+
+    Args:
+        param data: The data to sign.
+
+    Returns:
+        8 character checksum.
+    """
+    checksum = hmac.new(
+        str.encode(settings.SECRET_KEY), data, digestmod="sha256",
+    ).hexdigest()
+
+    return shortuuid.uuid(checksum)[:8]
+
+
+def generate_fingerprint(
+    rendered_template: str, frontend_context_variables: str
+) -> str:
+    """
+    Generates a stable hash of a render, i.e. the rendered template and the data.
+    Unlike the checksum it doesn't need to be signed, because it is only used to check
+    whether the client already has the same render.
+    """
+    fingerprint = hashlib.blake2b(digest_size=8)
+    fingerprint.update(str.encode(frontend_context_variables))
+    fingerprint.update(str.encode(rendered_template))
+
+    return fingerprint.hexdigest()
+
+
+def build_attributes(attributes: Dict[str, str]) -> str:
+    """
+    Builds a string of HTML attributes with escaped values, e.g. ` id="1" name="a"`.
+    """
+    return "".join(
+        f' {name}="{escape(str(value), quote=True)}"'
+        for (name, value) in attributes.items()
+    )
+
+
+def is_root_closed_at(content: str, start_idx: int, end_idx: int) -> bool:
+    """
+    Whether the root element is closed by the `div` end tag that ends at `end_idx`,
+    i.e. the `div` tags between the end of the root's start tag and there balance out.
+
+    Args:
+        param content: HTML or template source.
+        param start_idx: Index right after the start tag of the root element.
+        param end_idx: Index right after the end tag that should close the root element.
+    """
+    depth = 1
+
+    for match in DIV_TAG_RE.finditer(content, start_idx, end_idx):
+        (closing, self_closing) = match.groups()
+
+        if self_closing:
+            continue
+
+        depth += -1 if closing else 1
+
+        if depth == 0:
+            return match.end() == end_idx
+
+    return False
+
+
+def inject_root_attributes(
+    content: str, attributes: Dict[str, str], after_root: str = ""
+) -> Optional[str]:
+    """
+    Writes attributes into the root element of rendered HTML without parsing the whole
+    document. Only the opening tag of the root element is tokenized; everything else
+    gets copied through unchanged.
+
+    Args:
+        param content: Rendered HTML with a root `div`.
+        param attributes: Attributes to add to the root element.
+        param after_root: Markup to insert directly after the root element.
+
+    Returns:
+        The updated HTML or `None` if the markup is too unusual to handle, in which case
+        the caller should fall back to a real HTML parser.
+    """
+    prefix_match = ROOT_PREFIX_RE.match(content)
+    start_tag_match = ROOT_START_TAG_RE.match(content, prefix_match.end())
+
+    if not start_tag_match:
+        return None
+
+    start_tag = start_tag_match.group()
+
+    if ROOT_ATTRIBUTE_RE.search(start_tag):
+        # Existing attributes would need to be replaced instead of added
+        return None
+
+    insert_idx = start_tag_match.end() - 1
+
+    if start_tag.endswith("/>"):
+        insert_idx -= 1
+
+    rendered = "".join(
+        (content[:insert_idx], build_attributes(attributes), content[insert_idx:])
+    )
+
+    if after_root:
+        # Only handle the case where the root element wraps everything else
+        stripped = rendered.rstrip()
+        end_idx = len(stripped)
+        attributes_length = len(rendered) - len(content)
+
+        if not stripped.endswith(ROOT_END_TAG) or not is_root_closed_at(
+            rendered, start_tag_match.end() + attributes_length, end_idx
+        ):
+            return None
+
+        rendered = "".join((stripped, after_root, rendered[end_idx:]))
+
+    return rendered
+
+
+# Template constructs that are allowed before the root element in a component template
+TEMPLATE_ROOT_PREFIX_RE = re.compile(
+    r"(?:\s+|<!--.*?-->|\{#.*?#\}|\{%\s*load\s[^%]*%\}"
+    r"|\{%\s*comment\b[^%]*%\}.*?\{%\s*endcomment\s*%\})*",
+    re.DOTALL,
+)
+
+# Opening `div` tag in template source; attributes can contain template tags and variables
+TEMPLATE_ROOT_START_TAG_RE = re.compile(
+    r"""<div(?=[\s/>{])(?:"[^"]*"|'[^']*'|\{%.*?%\}|\{\{.*?\}\}|\{#.*?#\}|[^'">{]|\{(?![{%#]))*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+ROOT_ATTRIBUTES_PLACEHOLDER = " data-unicorn-root-attributes-placeholder"
+INIT_SCRIPT_PLACEHOLDER = "<!--unicorn-init-script-placeholder-->"
+
+
+def add_root_placeholders(source: str) -> Optional[str]:
+    """
+    Adds placeholders for the root attributes and the init script to the source of a
+    component template, so that rendering only has to fill in strings.
+
+    Args:
+        param source: Source of the component template.
+
+    Returns:
+        The template source with placeholders or `None` if the root element can't be
+        found statically, e.g. because it is rendered by a template tag.
+        Raises an Exception if the template can't have a root element at all.
+    """
+    prefix_match = TEMPLATE_ROOT_PREFIX_RE.match(source)
+    start_tag_match = TEMPLATE_ROOT_START_TAG_RE.match(source, prefix_match.end())
+
+    if not start_tag_match:
+        remaining_source = source[prefix_match.end() :]
+
+        if "<div" not in remaining_source.lower() and "{" not in remaining_source:
+            raise Exception("No root element found")
+
+        return None
+
+    start_tag = start_tag_match.group()
+    stripped_source = source.rstrip()
+
+    if ROOT_ATTRIBUTE_RE.search(start_tag) or not stripped_source.endswith(
+        ROOT_END_TAG
+    ):
+        return None
+
+    if not is_root_closed_at(
+        stripped_source, start_tag_match.end(), len(stripped_source)
+    ):
+        return None
+
+    insert_idx = start_tag_match.end() - 1
+
+    if start_tag.endswith("/>"):
+        insert_idx -= 1
+
+    return "".join(
+        (
+            source[:insert_idx],
+            ROOT_ATTRIBUTES_PLACEHOLDER,
+            stripped_source[insert_idx:],
+            INIT_SCRIPT_PLACEHOLDER,
+            source[len(stripped_source) :],
+        )
+    )
+
+
+def fill_root_placeholders(
+    content: str, attributes: Dict[str, str], after_root: str = ""
+) -> str:
+    """
+    Replaces the placeholders added by `add_root_placeholders` in rendered HTML.
+    """
+    content = content.replace(
+        ROOT_ATTRIBUTES_PLACEHOLDER, build_attributes(attributes), 1
+    )
+
+    return content.replace(INIT_SCRIPT_PLACEHOLDER, after_root, 1)
+
+
+def _escape_json_pointer(key) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def get_json_patch(old, new, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Gets RFC 6902-style JSON patch operations that turn `old` into `new`.
+
+    Dictionaries that gain keys or whose keys change order get replaced as a whole, so
+    the patched data serializes exactly like `new` (which the checksum depends on).
+
+    Args:
+        param old: JSON-compatible data the client has.
+        param new: Updated JSON-compatible data.
+        param path: JSON pointer of the data, used when recursing.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(new, dict):
+        if [key for key in old if key in new] != [key for key in new]:
+            return [{"op": "replace", "path": path, "value": new}]
+
+        patch = []
+
+        for (key, old_value) in old.items():
+            key_path = f"{path}/{_escape_json_pointer(key)}"
+
+            if key not in new:
+                patch.append({"op": "remove", "path": key_path})
+            else:
+                patch.extend(get_json_patch(old_value, new[key], key_path))
+
+        return patch
+
+    if isinstance(new, list):
+        patch = []
+
+        for (idx, (old_value, new_value)) in enumerate(zip(old, new)):
+            patch.extend(get_json_patch(old_value, new_value, f"{path}/{idx}"))
+
+        for idx in range(len(old) - 1, len(new) - 1, -1):
+            patch.append({"op": "remove", "path": f"{path}/{idx}"})
+
+        for new_value in new[len(old) :]:
+            patch.append({"op": "add", "path": f"{path}/-", "value": new_value})
+
+        return patch
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+
+    return []
+
+
+VOID_ELEMENTS = (
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+)
+
+ROOT_CHECKSUM_RE = re.compile(r'\sunicorn:checksum="[^"]*"')
+
+
+class KeyedElementsParser(HTMLParser):
+    """
+    Finds the root element and the outermost elements inside of it that have a
+    `unicorn:key` or `id` attribute, i.e. the same keys that morphdom uses.
+    """
+
+    def __init__(self, html: str):
+        super().__init__(convert_charrefs=False)
+
+        self.html = html
+        self.line_offsets = [0]
+
+        # `getpos()` only counts `\n` as a line break, unlike `str.splitlines`
+        for line in html.split("\n"):
+            self.line_offsets.append(self.line_offsets[-1] + len(line) + 1)
+
+        # Stack of (tag, start offset, key)
+        self.stack: List[Tuple[str, int, Optional[str]]] = []
+        self.root: Optional[Tuple[int, int]] = None
+        self.keyed_elements: List[Tuple[str, int, int]] = []
+        self.is_valid = True
+
+    def _get_offset(self) -> int:
+        (line, column) = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        if self.root:
+            # Ignore everything after the root element, e.g. the init script
+            return
+
+        start = self._get_offset()
+        attributes = dict(attrs)
+        key = attributes.get("unicorn:key") or attributes.get("id")
+
+        if tag in VOID_ELEMENTS:
+            self._close(tag, start, start + len(self.get_starttag_text()), key)
+        else:
+            self.stack.append((tag, start, key))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+        if tag not in VOID_ELEMENTS and not self.root:
+            (_, start, key) = self.stack.pop()
+            self._close(tag, start, start + len(self.get_starttag_text()), key)
+
+    def handle_endtag(self, tag):
+        if self.root:
+            return
+
+        tags = [element[0] for element in self.stack]
+
+        if tag not in tags:
+            self.is_valid = False
+            return
+
+        end = self.html.index(">", self._get_offset()) + 1
+
+        while self.stack:
+            (element_tag, start, key) = self.stack.pop()
+
+            if element_tag == tag:
+                self._close(tag, start, end, key)
+                break
+
+    def _close(self, tag, start, end, key):
+        if not self.stack:
+            self.root = (start, end)
+        elif key and not any(element[2] for element in self.stack[1:]):
+            # None of the ancestors inside the root are keyed, so this is an outermost one
+            self.keyed_elements.append((key, start, end))
+
+
+def parse_keyed_elements(html: str) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+    """
+    Splits the root element of rendered HTML into a skeleton and its outermost keyed
+    elements. The skeleton has the keyed elements and the root's checksum removed.
+
+    Returns:
+        Tuple of the skeleton and a list of (key, outer HTML) or `None` if the HTML
+        can't be parsed or has duplicate keys.
+    """
+    parser = KeyedElementsParser(html)
+
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        return None
+
+    if not parser.is_valid or not parser.root:
+        return None
+
+    keys = [keyed_element[0] for keyed_element in parser.keyed_elements]
+
+    if len(keys) != len(set(keys)):
+        return None
+
+    (root_start, root_end) = parser.root
+    skeleton_parts = []
+    keyed_elements = []
+    position = root_start
+
+    for (key, start, end) in parser.keyed_elements:
+        skeleton_parts.append(html[position:start])
+        skeleton_parts.append(f"\x00{key}\x00")
+        keyed_elements.append((key, html[start:end]))
+        position = end
+
+    skeleton_parts.append(html[position:root_end])
+    skeleton = ROOT_CHECKSUM_RE.sub("", "".join(skeleton_parts), count=1)
+
+    return (skeleton, keyed_elements)
+
+
+def get_dom_patches(
+    old_elements: Tuple[str, List[Tuple[str, str]]],
+    new_elements: Tuple[str, List[Tuple[str, str]]],
+) -> Optional[List[Dict[str, str]]]:
+    """
+    Gets the keyed elements that changed between two renders of a component.
+
+    Args:
+        param old_elements: Result of `parse_keyed_elements` for the previous render.
+        param new_elements: Result of `parse_keyed_elements` for the new render.
+
+    Returns:
+        List of `{"key": key, "dom": outer HTML}` or `None` if anything outside of the keyed
+        elements changed, in which case the whole component has to be sent.
+    """
+    (old_skeleton, old_keyed_elements) = old_elements
+    (new_skeleton, new_keyed_elements) = new_elements
+
+    if old_skeleton != new_skeleton:
+        return None
+
+    if [key for (key, _) in old_keyed_elements] != [
+        key for (key, _) in new_keyed_elements
+    ]:
+        return None
+
+    return [
+        {"key": key, "dom": new_dom}
+        for ((key, new_dom), (_, old_dom)) in zip(
+            new_keyed_elements, old_keyed_elements
+        )
+        if new_dom != old_dom
+    ]
@@ -1,17 +1,47 @@
-import hmac
+import copy
 from functools import wraps
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Type
 from django.forms.forms import Form
 
 import orjson
-import shortuuid
-from django.conf import settings
-from django.db.models import Model
 from django.http import HttpRequest, JsonResponse
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.http import require_POST
 
-from .components import UnicornField, UnicornView
+from .cacher import (
+    SingleFlight,
+    get_frontend_data,
+    get_last_render,
+    set_component_state,
+    set_frontend_data,
+    set_last_render,
+)
+from .call_method_parser import parse_arg, parse_call_method_name
+from .components import (
+    ComponentMetadata,
+    ComponentNotFoundError,
+    UnicornView,
+    views_cache,
+)
+from .settings import get_setting
+from .utils import (
+    generate_checksum,
+    get_dom_patches,
+    get_json_patch,
+    parse_keyed_elements,
+)
+
+
+# Maximum number of messages in one batch request; `unicorn.js` splits bigger batches
+MESSAGE_BATCH_MAX_SIZE = 20
+
+# In-flight and recently finished requests for components with `Meta.coalesce_requests`.
+# Requests get coalesced when they only call methods and have the same component name,
+# data checksum and action queue; everything else about them (e.g. the user, session,
+# headers or query parameters) is ignored and only the component instance (and stored
+# state) of the request that does the computation gets updated. So it is only for
+# components that render the same for everyone, e.g. a public status board.
+coalesced_requests = SingleFlight()
 
 
 class UnicornViewError(Exception):
@@ -30,27 +60,47 @@ def handle_error(view_func):
     return wraps(view_func)(wrapped_view)
 
 
-def _set_property_from_data(
-    component_or_field: Union[UnicornView, UnicornField, Model], name: str, value,
-) -> None:
+class PropertyPath:
     """
-    Sets properties on the component based on passed-in data.
+    A `syncInput` property name, e.g. "author.name", split into its parts and with the
+    nested property hooks that are defined on the component class. Compiled once per
+    component class and property name.
     """
 
-    if hasattr(component_or_field, name):
-        field = getattr(component_or_field, name)
+    def __init__(self, component_class: Type[UnicornView], property_name: str):
+        property_name_parts = property_name.split(".")
+        self.parent_names = property_name_parts[:-1]
+        self.name = property_name_parts[-1]
+
+        property_name_snake_case = property_name.replace(".", "_")
+        updating_function_name = f"updating_{property_name_snake_case}"
+        updated_function_name = f"updated_{property_name_snake_case}"
+
+        self.updating_function_name = (
+            updating_function_name
+            if hasattr(component_class, updating_function_name)
+            else None
+        )
+        self.updated_function_name = (
+            updated_function_name
+            if hasattr(component_class, updated_function_name)
+            else None
+        )
+
+    @staticmethod
+    def get(component: UnicornView, property_name: str) -> "PropertyPath":
+        """
+        Gets the compiled property path from the component class's bounded cache or
+        compiles it.
+        """
+        property_paths = component._get_metadata().property_paths
+        property_path = property_paths.get(property_name)
 
-        # UnicornField and Models are always a dictionary (can be nested)
-        if isinstance(field, UnicornField) or isinstance(field, Model):
-            for key in value.keys():
-                key_value = value[key]
-                _set_property_from_data(field, key, key_value)
-        else:
-            if hasattr(component_or_field, "_set_property"):
-                # Can assume that `component_or_field` is a component
-                component_or_field._set_property(name, value)
-            else:
-                setattr(component_or_field, name, value)
+        if property_path is None:
+            property_path = PropertyPath(component.__class__, property_name)
+            property_paths.set(property_name, property_path)
+
+        return property_path
 
 
 def _set_property_from_payload(
@@ -84,100 +134,51 @@ def _set_property_from_payload(
 
         The following code updates UnicornView.author.name based the payload's `author.name`.
         """
-        property_name_parts = property_name.split(".")
+        property_path = PropertyPath.get(component, property_name)
         component_or_field = component
         data_or_dict = data  # Could be an internal portion of data that gets set
 
-        for (idx, property_name_part) in enumerate(property_name_parts):
+        for property_name_part in property_path.parent_names:
             if hasattr(component_or_field, property_name_part):
-                if idx == len(property_name_parts) - 1:
-                    if hasattr(component_or_field, "_set_property"):
-                        # Can assume that `component_or_field` is a component
-                        component_or_field._set_property(
-                            property_name_part, property_value
-                        )
-                    else:
-                        # Handle calling the updating/updated method for nested properties
-                        property_name_snake_case = property_name.replace(".", "_")
-                        updating_function_name = f"updating_{property_name_snake_case}"
-                        updated_function_name = f"updated_{property_name_snake_case}"
-
-                        if hasattr(component, updating_function_name):
-                            getattr(component, updating_function_name)(property_value)
-
-                        setattr(component_or_field, property_name_part, property_value)
-
-                        if hasattr(component, updated_function_name):
-                            getattr(component, updated_function_name)(property_value)
-
-                    data_or_dict[property_name_part] = property_value
-                else:
-                    component_or_field = getattr(component_or_field, property_name_part)
-                    data_or_dict = data_or_dict.get(property_name_part, {})
+                component_or_field = getattr(component_or_field, property_name_part)
+                data_or_dict = data_or_dict.get(property_name_part, {})
             elif isinstance(component_or_field, dict):
-                if idx == len(property_name_parts) - 1:
-                    component_or_field[property_name_part] = property_value
-                    data_or_dict[property_name_part] = property_value
-                else:
-                    component_or_field = component_or_field[property_name_part]
-                    data_or_dict = data_or_dict.get(property_name_part, {})
-
-    component.updated(property_name, property_value)
-
-
-def _parse_call_method_name(call_method_name: str) -> Tuple[str, List[Any]]:
-    """
-    Parses the method name from the request payload into a set of parameters to pass to a method.
-
-    Args:
-        param call_method_name: String representation of a method name with parameters, e.g. "set_name('Bob')"
-
-    Returns:
-        Tuple of method_name and a list of arguments.
-    """
-
-    method_name = call_method_name
-    params: List[Any] = []
-
-    if "(" in call_method_name and call_method_name.endswith(")"):
-        param_idx = call_method_name.index("(")
-        params_str = call_method_name[param_idx:]
+                component_or_field = component_or_field[property_name_part]
+                data_or_dict = data_or_dict.get(property_name_part, {})
 
-        # Remove the arguments from the method name
-        method_name = call_method_name.replace(params_str, "")
+        property_name_part = property_path.name
 
-        # Remove parenthesis
-        params_str = params_str[1:-1]
-
-        if params_str == "":
-            return (method_name, params)
-
-        # Split up mutiple args
-        params = params_str.split(",")
-
-        for idx, arg in enumerate(params):
-            params[idx] = _handle_arg(arg)
-
-        # TODO: Handle kwargs
+        if hasattr(component_or_field, property_name_part):
+            if hasattr(component_or_field, "_set_property"):
+                # Can assume that `component_or_field` is a component
+                component_or_field._set_property(property_name_part, property_value)
+            else:
+                # Handle calling the updating/updated method for nested properties
+                if property_path.updating_function_name:
+                    getattr(component, property_path.updating_function_name)(
+                        property_value
+                    )
 
-    return (method_name, params)
+                setattr(component_or_field, property_name_part, property_value)
 
+                if property_path.updated_function_name:
+                    getattr(component, property_path.updated_function_name)(
+                        property_value
+                    )
 
-def _handle_arg(arg):
-    """
-    Clean up arguments. Mostly used to handle strings.
+            data_or_dict[property_name_part] = property_value
+        elif isinstance(component_or_field, dict):
+            component_or_field[property_name_part] = property_value
+            data_or_dict[property_name_part] = property_value
 
-    Returns:
-        Cleaned up argument.
-    """
-    if (arg.startswith("'") and arg.endswith("'")) or (
-        arg.startswith('"') and arg.endswith('"')
-    ):
-        return arg[1:-1]
+    component.updated(property_name, property_value)
 
 
 def _call_method_name(
-    component: UnicornView, method_name: str, params: List[Any]
+    component: UnicornView,
+    method_name: str,
+    args: List[Any],
+    kwargs: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     Calls the method name with parameters.
@@ -186,39 +187,63 @@ def _call_method_name(
     Args:
         param component: Component to call method on.
         param method_name: Method name to call.
-        param params: List of arguments for the method.
+        param args: List of arguments for the method.
+        param kwargs: Dictionary of keyword arguments for the method.
     """
 
     if method_name is not None and hasattr(component, method_name):
         func = getattr(component, method_name)
 
-        if params:
-            func(*params)
-        else:
-            func()
+        func(*args, **(kwargs or {}))
 
 
 class ComponentRequest:
     """
     Parses, validates, and stores all of the data from the message request.
+
+    Args:
+        param request: The message request.
+        param body: Already parsed body, e.g. one message of a batch, instead of the
+            request's body.
     """
 
-    def __init__(self, request):
-        self.body = {}
+    def __init__(self, request: HttpRequest = None, body: Dict = None):
+        self.body = body or {}
 
-        try:
-            self.body = orjson.loads(request.body)
-            assert self.body, "Invalid JSON body"
-        except orjson.JSONDecodeError as e:
-            raise UnicornViewError("Body could not be parsed") from e
+        if body is None:
+            try:
+                self.body = orjson.loads(request.body)
+            except orjson.JSONDecodeError as e:
+                raise UnicornViewError("Body could not be parsed") from e
+
+        assert self.body, "Invalid JSON body"
 
         self.data = self.body.get("data")
-        assert self.data is not None, "Missing data"  # data could theoretically be {}
+        self.checksum = self.body.get("checksum")
+        self.fingerprint = self.body.get("fingerprint")
+        self.is_full_data_required = bool(self.body.get("fullData"))
+        self.is_resync_required = False
+
+        if self.data is None and get_setting("SERVER_STATE", False):
+            # The client only sends the checksum of its data; the server has the data
+            self.id = self.body.get("id")
+            assert self.id, "Missing component id"
+
+            assert self.checksum, "Missing checksum"
+
+            self.data = get_frontend_data(self.id, self.checksum)
 
-        self.id = self.body.get("id")
-        assert self.id, "Missing component id"
+            if self.data is None:
+                # Missing or stale data on the server, so the client has to send it
+                self.is_resync_required = True
+                self.data = {}
+        else:
+            assert self.data is not None, "Missing data"  # data could theoretically be {}
+
+            self.id = self.body.get("id")
+            assert self.id, "Missing component id"
 
-        self.validate_checksum()
+            self.validate_checksum()
 
         self.action_queue = self.body.get("actionQueue", [])
 
@@ -229,16 +254,43 @@ class ComponentRequest:
         Returns:
             Raises `AssertionError` if the checksums don't match.
         """
-        checksum = self.body.get("checksum")
-        assert checksum, "Missing checksum"
+        assert self.checksum, "Missing checksum"
+
+        generated_checksum = generate_checksum(orjson.dumps(self.data))
+        assert self.checksum == generated_checksum, "Checksum does not match"
+
 
-        generated_checksum = hmac.new(
-            str.encode(settings.SECRET_KEY),
-            orjson.dumps(self.data),
-            digestmod="sha256",
-        ).hexdigest()
-        generated_checksum = shortuuid.uuid(generated_checksum)[:8]
-        assert checksum == generated_checksum, "Checksum does not match"
+def _diff_rendered_component(
+    component_request: ComponentRequest, data: Dict, rendered_component: str, res: Dict
+) -> None:
+    """
+    Replaces the rendered component in the response with patches for the keyed elements
+    that changed since the last render the client has. Keeps the whole rendered
+    component when the last render is unknown or more than keyed elements changed.
+    """
+    last_render = get_last_render(component_request.id, component_request.checksum)
+
+    checksum = generate_checksum(orjson.dumps(data))
+    keyed_elements = parse_keyed_elements(rendered_component)
+    set_last_render(component_request.id, checksum, rendered_component, keyed_elements)
+
+    if last_render is None or keyed_elements is None:
+        return
+
+    (last_rendered_component, last_keyed_elements) = last_render
+
+    if last_keyed_elements is None:
+        last_keyed_elements = parse_keyed_elements(last_rendered_component)
+
+        if last_keyed_elements is None:
+            return
+
+    dom_patches = get_dom_patches(last_keyed_elements, keyed_elements)
+
+    if dom_patches is not None:
+        del res["dom"]
+        res["domPatches"] = dom_patches
+        res["checksum"] = checksum
 
 
 @handle_error
@@ -259,98 +311,380 @@ def message(request: HttpRequest, component_name: str = None) -> JsonResponse:
             "id": component_id,
             "dom": html,  // re-rendered version of the component after actions in the payload are completed
             "data": {},  // updated data after actions in the payload are completed
+            "patch": [],  // JSON patch for the data the client sent, instead of `data` when smaller and `JSON_PATCH` is enabled
+            "baseChecksum": "",  // checksum of the data the patch applies to, sent with `patch`
+            "domPatches": [],  // changed keyed elements, instead of `dom` when `DOM_DIFF` is enabled
+            "checksum": "",  // checksum of the updated data, sent with `domPatches`
+            "fingerprint": "",  // hash of the render, sent back by the client with the next message
         }
+
+        When no method was called and neither the data nor the errors changed, the
+        component doesn't get rendered and the response is
+        `{"id": component_id, "unchanged": true}`. The response is the same when the
+        render has the same fingerprint as the one the client sent.
+
+        When the `SERVER_STATE` setting is enabled and the server doesn't have the
+        client's data, the response is `{"id": component_id, "resync": true}` and the
+        client has to send the message again with its data.
+
+        A patch only applies to the data with the `baseChecksum`; when the client's
+        data changed in the meantime, it can send `"fullData": true` with the next
+        message to get `data` instead of a patch.
+
+        Messages for multiple components can be sent in one request by posting a JSON
+        array of message bodies (each with the component's name in `name`) to the
+        `message` url. The response is an array with the result for each message, in
+        the same order; errors are returned per message as
+        `{"id": component_id, "error": ""}`. A batch can have at most
+        `MESSAGE_BATCH_MAX_SIZE` messages.
     """
 
-    assert component_name, "Missing component name in url"
+    if not component_name:
+        batch = _get_batch(request)
+        assert batch is not None, "Missing component name in url"
+        assert (
+            len(batch) <= MESSAGE_BATCH_MAX_SIZE
+        ), f"Too many messages in batch (maximum is {MESSAGE_BATCH_MAX_SIZE})"
+
+        return JsonResponse([_handle_batch_message(body) for body in batch], safe=False)
 
     component_request = ComponentRequest(request)
-    component = UnicornView.create(
-        component_id=component_request.id, component_name=component_name
-    )
-    validate_all_fields = False
 
-    # Get a copy of the data passed in to determine what fields are updated later
-    original_data = component_request.data.copy()
+    return JsonResponse(_handle_message(component_request, component_name))
+
 
-    # Set component properties based on request data
-    for (name, value) in component_request.data.items():
-        _set_property_from_data(component, name, value)
-    component.hydrate()
+def _get_batch(request: HttpRequest) -> Optional[List[Dict]]:
+    """
+    Gets the messages for multiple components that get sent in one request as a JSON
+    array to the `message` url. Each message has the component's name in a `name` key.
+
+    Returns:
+        List of message bodies or `None` if the body is not a batch.
+    """
+    try:
+        body = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return None
+
+    if not isinstance(body, list):
+        return None
+
+    return body
+
+
+def _handle_batch_message(body: Dict) -> Dict:
+    """
+    Handles one message of a batch. Errors get returned for the message, so they don't
+    affect the other messages in the batch.
+    """
+    component_id = body.get("id") if isinstance(body, dict) else None
+
+    try:
+        assert isinstance(body, dict), "Invalid JSON body"
+
+        component_name = body.get("name")
+        assert component_name, "Missing component name"
+
+        component_request = ComponentRequest(body=body)
+
+        return _handle_message(component_request, component_name)
+    except (UnicornViewError, AssertionError, ComponentNotFoundError) as e:
+        return {"id": component_id, "error": str(e)}
+
+
+def _handle_message(component_request: ComponentRequest, component_name: str) -> Dict:
+    """
+    Processes the message for a component and builds the response for the client.
+    """
+    if component_request.is_resync_required:
+        return {"id": component_request.id, "resync": True}
+
+    component_class = views_cache.get(component_name)
+    metadata = ComponentMetadata.get(component_class) if component_class else None
+    is_coalesced = (
+        metadata is not None
+        and metadata.coalesce_requests
+        and all(
+            action.get("type") == "callMethod"
+            for action in component_request.action_queue
+        )
+    )
+
+    if is_coalesced:
+        # Identical requests (e.g. polls of a public status board) share one computation
+        key = (
+            component_name,
+            component_request.checksum,
+            orjson.dumps(component_request.action_queue),
+        )
+        result = coalesced_requests.do(
+            key,
+            lambda: _process_component_request(component_request, component_name),
+            ttl=metadata.coalesce_ttl,
+        )
+    else:
+        result = _process_component_request(component_request, component_name)
+
+    return _get_response(component_request, result)
+
+
+def _collapse_action_queue(action_queue: List[Dict]) -> List[Dict]:
+    """
+    Removes the actions that don't change the outcome of the action queue, e.g. when
+    someone types quickly: a `syncInput` that gets overwritten by a later `syncInput`
+    for the same property before a method gets called, and repeated `refresh` calls.
+    Components that need every update can set `Meta.collapse_actions = False`.
+    """
+    collapsed_action_queue: List[Optional[Dict]] = []
+    previous_action = None
 
-    is_reset_called = False
+    # Index of the last `syncInput` per property since the last method call
+    sync_input_indexes = {}
 
-    for action in component_request.action_queue:
+    for action in action_queue:
         action_type = action.get("type")
         payload = action.get("payload", {})
 
         if action_type == "syncInput":
-            _set_property_from_payload(component, payload, component_request.data)
-        elif action_type == "callMethod":
-            call_method_name = payload.get("name", "")
-            assert call_method_name, "Missing 'name' key for callMethod"
-
-            if call_method_name == "reset" or call_method_name == "reset()":
-                # Handle the reset special action
-                component = UnicornView.create(
-                    component_id=component_request.id,
-                    component_name=component_name,
-                    use_cache=False,
-                )
-
-                #  Explicitly remove all errors and prevent validation from firing before render()
-                component.errors = {}
-                is_reset_called = True
-            elif call_method_name == "refresh" or call_method_name == "refresh()":
-                # Handle the refresh special action
-                component = UnicornView.create(
-                    component_id=component_request.id,
-                    component_name=component_name,
-                    use_cache=True,
-                )
-            elif call_method_name == "validate" or call_method_name == "validate()":
-                # Handle the validate special action
-                validate_all_fields = True
-            elif "=" in call_method_name:
-                call_method_name_split = call_method_name.split("=")
-                property_name = call_method_name_split[0]
-                property_value = _handle_arg(call_method_name_split[1])
-
-                if hasattr(component, property_name):
-                    component.calling(f"set_{property_name}", property_value)
-                    setattr(component, property_name, property_value)
-                    component.called(f"set_{property_name}", property_value)
-                    component_request.data[property_name] = property_value
-            else:
-                (method_name, params) = _parse_call_method_name(call_method_name)
-                component.calling(method_name, params)
-                _call_method_name(component, method_name, params)
-                component.called(method_name, params)
-        else:
-            raise UnicornViewError(f"Unknown action_type '{action_type}'")
+            property_name = payload.get("name")
 
-    # Re-load frontend context variables to deal with non-serializable properties
-    component_request.data = orjson.loads(component.get_frontend_context_variables())
+            # `None` values don't get set, so they can't overwrite an earlier value
+            if payload.get("value") is not None:
+                if property_name in sync_input_indexes:
+                    collapsed_action_queue[sync_input_indexes[property_name]] = None
 
-    if not is_reset_called:
-        if validate_all_fields:
-            component.validate()
+                sync_input_indexes[property_name] = len(collapsed_action_queue)
         else:
-            model_names_to_validate = []
+            sync_input_indexes = {}
+
+            if _is_refresh(action) and previous_action and _is_refresh(previous_action):
+                continue
+
+        collapsed_action_queue.append(action)
+        previous_action = action
+
+    return [action for action in collapsed_action_queue if action is not None]
+
+
+def _is_refresh(action: Dict) -> bool:
+    return action.get("type") == "callMethod" and action.get("payload", {}).get(
+        "name"
+    ) in ("refresh", "refresh()")
+
+
+def _process_component_request(
+    component_request: ComponentRequest, component_name: str
+) -> Dict:
+    """
+    Instantiates the component, applies the action queue and renders the component.
+    The result only depends on the component's name, data and action queue, so it can
+    be shared between requests for different component ids.
 
-            for key, value in original_data.items():
-                if value != component_request.data[key]:
-                    model_names_to_validate.append(key)
+    Returns:
+        Dictionary with the component, the original and updated data and errors, and
+        the rendered component and its fingerprint (`None` when the render was skipped).
+    """
+    component = UnicornView.create(
+        component_id=component_request.id, component_name=component_name
+    )
+
+    return _process_component(component, component_request, component_name)
+
+
+def _process_component(
+    component: UnicornView, component_request: ComponentRequest, component_name: str
+) -> Dict:
+    """
+    Applies the action queue to the component and renders it. The attributes get
+    evaluated once and shared with the rest of the request in a snapshot, which gets
+    stopped on the component that is processed last (`reset` and `refresh` replace the
+    component), so it doesn't get cached with the component.
+    """
+    component._start_attributes_snapshot()
+
+    try:
+        validate_all_fields = False
+
+        # Get a copy of the data and errors to determine what changed later
+        original_data = copy.deepcopy(component_request.data)
+        original_errors = copy.deepcopy(component.errors)
+
+        # Set component properties based on request data
+        component._hydrate_many(component_request.data)
+        component.hydrate()
+        component._mark_attributes_snapshot_stale()
+
+        is_reset_called = False
+        is_method_called = False
+        action_queue = component_request.action_queue
+
+        if component._get_metadata().collapse_actions:
+            action_queue = _collapse_action_queue(action_queue)
+
+        for action in action_queue:
+            action_type = action.get("type")
+            payload = action.get("payload", {})
+
+            if action_type == "syncInput":
+                _set_property_from_payload(component, payload, component_request.data)
+            elif action_type == "callMethod":
+                call_method_name = payload.get("name", "")
+                assert call_method_name, "Missing 'name' key for callMethod"
+
+                if call_method_name == "reset" or call_method_name == "reset()":
+                    # Handle the reset special action
+                    component._stop_attributes_snapshot()
+                    component = UnicornView.create(
+                        component_id=component_request.id,
+                        component_name=component_name,
+                        use_cache=False,
+                    )
+                    component._start_attributes_snapshot()
+
+                    #  Explicitly remove all errors and prevent validation from firing before render()
+                    component.errors = {}
+                    is_reset_called = True
+                    is_method_called = True
+                elif call_method_name == "refresh" or call_method_name == "refresh()":
+                    # Handle the refresh special action
+                    component._stop_attributes_snapshot()
+                    component = UnicornView.create(
+                        component_id=component_request.id,
+                        component_name=component_name,
+                        use_cache=True,
+                    )
+                    component._start_attributes_snapshot()
+                elif call_method_name == "validate" or call_method_name == "validate()":
+                    # Handle the validate special action
+                    validate_all_fields = True
+                elif "=" in call_method_name.split("(", 1)[0]:
+                    # Set a property, e.g. `name='World'`; an `=` after a `(` is part of
+                    # the arguments of a method call, e.g. `select(force=True)`
+                    call_method_name_split = call_method_name.split("=", 1)
+                    property_name = call_method_name_split[0]
+                    property_value = parse_arg(call_method_name_split[1])
+
+                    is_method_called = True
+
+                    if hasattr(component, property_name):
+                        component.calling(f"set_{property_name}", property_value)
+                        setattr(component, property_name, property_value)
+                        component.called(f"set_{property_name}", property_value)
+                        component_request.data[property_name] = property_value
+                else:
+                    is_method_called = True
+                    (method_name, args, kwargs) = parse_call_method_name(
+                        call_method_name
+                    )
+                    component.calling(method_name, args)
+                    _call_method_name(component, method_name, args, kwargs)
+                    component.called(method_name, args)
+            else:
+                raise UnicornViewError(f"Unknown action_type '{action_type}'")
+
+            # Actions can change the component without setting an attribute on it
+            component._mark_attributes_snapshot_stale()
+
+        # Re-load frontend context variables to deal with non-serializable properties
+        data = orjson.loads(component.get_frontend_context_variables())
+
+        if not is_reset_called:
+            if validate_all_fields:
+                component.validate()
+            else:
+                model_names_to_validate = []
+
+                for key, value in original_data.items():
+                    if value != data[key]:
+                        model_names_to_validate.append(key)
+
+                component.validate(model_names=model_names_to_validate)
+
+        # Share the state with other processes (if enabled) so they don't have to
+        # mount again
+        set_component_state(component)
+
+        result = {
+            "component": component,
+            "original_data": original_data,
+            "data": data,
+            "errors": component.errors,
+            "is_errors_changed": component.errors != original_errors,
+            "rendered_component": None,
+            "fingerprint": None,
+        }
+
+        # Attributes in `Meta.javascript_exclude` aren't in the data, so changes to
+        # them can only be found by rendering and comparing the fingerprint in
+        # `_get_response`
+        if (
+            is_method_called
+            or data != original_data
+            or result["is_errors_changed"]
+            or component._get_metadata().javascript_excludes
+        ):
+            result["rendered_component"] = component.render()
+            result["fingerprint"] = component._fingerprint
+
+        return result
+
+    finally:
+        component._stop_attributes_snapshot()
+
+
+def _get_response(component_request: ComponentRequest, result: Dict) -> Dict:
+    """
+    Builds the response for a client from the result of `_process_component_request`,
+    which might have been computed for a different component id.
+    """
+    rendered_component = result["rendered_component"]
 
-            component.validate(model_names=model_names_to_validate)
+    if rendered_component is None:
+        # Nothing changed (e.g. a poll's `refresh`), so the client can keep what it has
+        return {"id": component_request.id, "unchanged": True}
 
-    rendered_component = component.render()
+    if (
+        component_request.fingerprint
+        and component_request.fingerprint == result["fingerprint"]
+        and not result["is_errors_changed"]
+    ):
+        # The client already has this exact render, e.g. a poll that didn't change anything
+        return {"id": component_request.id, "unchanged": True}
+
+    data = result["data"]
+    component_id = result["component"].component_id
+
+    if component_id != component_request.id:
+        rendered_component = rendered_component.replace(
+            f'unicorn:id="{component_id}"', f'unicorn:id="{component_request.id}"', 1
+        )
+
+        if get_setting("SERVER_STATE", False):
+            set_frontend_data(
+                component_request.id,
+                orjson.dumps(data).decode("utf-8"),
+                generate_checksum(orjson.dumps(data)),
+            )
 
     res = {
         "id": component_request.id,
         "dom": rendered_component,
-        "data": component_request.data,
-        "errors": component.errors,
+        "errors": result["errors"],
+        "fingerprint": result["fingerprint"],
     }
 
-    return JsonResponse(res)
+    if get_setting("DOM_DIFF", False):
+        _diff_rendered_component(component_request, data, rendered_component, res)
+
+    res["data"] = data
+
+    if get_setting("JSON_PATCH", False) and not component_request.is_full_data_required:
+        # Only send the changes to the data when that is smaller than the data itself
+        patch = get_json_patch(result["original_data"], data)
+
+        if len(orjson.dumps(patch)) < len(orjson.dumps(data)):
+            del res["data"]
+            res["patch"] = patch
+            res["baseChecksum"] = component_request.checksum
+
+    return res
@@ -0,0 +1,110 @@
+"""
+Compares introspecting a component with ~200 members on every construction, like
+components used to, against the per-class metadata with its precompiled public-name
+filter.
+
+Run with `poetry run pytest tests/benchmarks -s` to see the timings.
+"""
+import inspect
+import timeit
+
+from django_unicorn.components import (
+    PROTECTED_NAMES,
+    ComponentMetadata,
+    UnicornView,
+    component_metadata_cache,
+)
+
+
+MEMBERS = 100
+
+
+def _method(self):
+    return None
+
+
+BigComponent = type(
+    "BigComponent",
+    (UnicornView,),
+    {
+        **{f"attribute_{i}": i for i in range(MEMBERS)},
+        **{f"method_{i}": _method for i in range(MEMBERS)},
+        **{f"updated_attribute_{i}": _method for i in range(5, MEMBERS, 10)},
+        "Meta": type("Meta", (), {"exclude": [f"attribute_{i}" for i in range(5)]}),
+    },
+)
+
+
+def _introspect_per_instance(component):
+    """
+    Mirrors the per-instance introspection with tuple and list scans.
+    """
+    protected_names = tuple(PROTECTED_NAMES)
+    hook_methods_cache = []
+
+    def is_public(name):
+        excludes = []
+
+        if hasattr(component, "Meta") and hasattr(component.Meta, "exclude"):
+            excludes = component.Meta.exclude
+
+        return not (
+            name.startswith("_")
+            or name in protected_names
+            or name in hook_methods_cache
+            or name in excludes
+        )
+
+    attribute_names = [
+        name
+        for (name, _) in inspect.getmembers(component, lambda x: not callable(x))
+        if is_public(name)
+    ]
+
+    for attribute_name in attribute_names:
+        for function_name in (f"updating_{attribute_name}", f"updated_{attribute_name}"):
+            if hasattr(component, function_name):
+                hook_methods_cache.append(function_name)
+
+    methods = {
+        name: value
+        for (name, value) in inspect.getmembers(component, inspect.ismethod)
+        if is_public(name)
+    }
+
+    return attribute_names, methods
+
+
+def _introspect_per_class(component):
+    component_metadata_cache.pop(BigComponent, None)
+    component._set_caches()
+
+    return component._attribute_names_cache, component._methods_cache
+
+
+def test_benchmark_component_introspection():
+    number = 20
+    component = BigComponent(component_name="big")
+
+    per_instance_time = timeit.timeit(
+        lambda: _introspect_per_instance(component), number=number
+    )
+    per_class_time = timeit.timeit(
+        lambda: _introspect_per_class(component), number=number
+    )
+    cached_time = timeit.timeit(lambda: component._set_caches(), number=number)
+
+    print(
+        f"\nintrospection for {MEMBERS * 2} members: per instance "
+        f"{per_instance_time / number * 1000:.2f}ms, per class "
+        f"{per_class_time / number * 1000:.2f}ms, cached "
+        f"{cached_time / number * 1000:.2f}ms"
+    )
+
+    (attribute_names, methods) = _introspect_per_instance(component)
+    metadata = ComponentMetadata.get(BigComponent)
+
+    assert metadata.attribute_names == attribute_names
+    assert sorted(metadata.method_names) == sorted(methods)
+    assert len(metadata.attribute_names) == MEMBERS - 5
+    assert len(metadata.hook_method_names) == MEMBERS // 10
@@ -0,0 +1,72 @@
+"""
+Compares serializing a QuerySet by getting the fields of every row, like components
+used to, against the cached per-model serialization plan.
+
+Run with `poetry run pytest tests/benchmarks -s` to see the timings.
+"""
+import timeit
+
+import orjson
+from django.db.models import Model, QuerySet
+
+from django_unicorn.serializer import queryset_to_list
+from tests.models import Publisher
+
+
+ROWS = 10_000
+
+
+def _get_queryset():
+    queryset = QuerySet(model=Publisher)
+    queryset._result_cache = [
+        Publisher(id=i, name=f"Publisher {i}", city="London", founded=1900 + i % 100)
+        for i in range(ROWS)
+    ]
+
+    return queryset
+
+
+def _get_model_json_per_instance(obj):
+    """
+    Mirrors serializing a model by getting the fields for every instance.
+    """
+    model_field_names = [field.name for field in obj._meta.get_fields()]
+
+    model_json = {}
+    for field_name in model_field_names:
+        model_json[field_name] = getattr(obj, field_name)
+
+    return model_json
+
+
+def _serialize_per_instance(queryset):
+    return orjson.dumps(
+        queryset,
+        default=lambda obj: [_get_model_json_per_instance(model) for model in obj]
+        if isinstance(obj, QuerySet)
+        else _get_model_json_per_instance(obj)
+        if isinstance(obj, Model)
+        else None,
+    )
+
+
+def _serialize_with_plan(queryset):
+    return orjson.dumps(queryset, default=queryset_to_list)
+
+
+def test_benchmark_model_serialization():
+    number = 3
+    queryset = _get_queryset()
+
+    per_instance_time = timeit.timeit(
+        lambda: _serialize_per_instance(queryset), number=number
+    )
+    plan_time = timeit.timeit(lambda: _serialize_with_plan(queryset), number=number)
+
+    print(
+        f"\nserialization of {ROWS} rows: per instance "
+        f"{per_instance_time / number * 1000:.2f}ms, plan "
+        f"{plan_time / number * 1000:.2f}ms"
+    )
+
+    assert _serialize_per_instance(queryset) == _serialize_with_plan(queryset)
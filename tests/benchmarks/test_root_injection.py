@@ -0,0 +1,47 @@
+"""
+Compares the root attribute injector against the BeautifulSoup fallback.
+
+Run with `poetry run pytest tests/benchmarks -s` to see the timings.
+"""
+import timeit
+
+from django_unicorn.components import UnicornTemplateResponse
+from django_unicorn.utils import inject_root_attributes
+
+
+ROWS = 2000
+CONTENT = (
+    '<div class="table">'
+    + "".join(
+        f'<div unicorn:key="row-{i}"><span class="cell">{i}</span><input value="{i}"/></div>'
+        for i in range(ROWS)
+    )
+    + "</div>"
+)
+ATTRIBUTES = {
+    "unicorn:id": "asdf1234",
+    "unicorn:name": "big-table",
+    "unicorn:checksum": "1234asdf",
+}
+INIT_SCRIPT = "<script>Unicorn.componentInit({});</script>"
+
+
+def test_benchmark_root_injection():
+    number = 3
+
+    injector_time = timeit.timeit(
+        lambda: inject_root_attributes(CONTENT, ATTRIBUTES, INIT_SCRIPT), number=number
+    )
+    soup_time = timeit.timeit(
+        lambda: UnicornTemplateResponse._soupify(CONTENT, ATTRIBUTES, INIT_SCRIPT),
+        number=number,
+    )
+
+    print(
+        f"\nroot injection for {ROWS} rows: injector {injector_time / number * 1000:.2f}ms, "
+        f"beautifulsoup {soup_time / number * 1000:.2f}ms"
+    )
+
+    assert inject_root_attributes(
+        CONTENT, ATTRIBUTES, INIT_SCRIPT
+    ) == UnicornTemplateResponse._soupify(CONTENT, ATTRIBUTES, INIT_SCRIPT)
@@ -0,0 +1,131 @@
+import pytest
+
+from django_unicorn.cacher import (
+    deserialize_state,
+    get_component_state,
+    get_layout_version,
+    serialize_state,
+    set_component_state,
+)
+from django_unicorn.components import UnicornView, constructed_views_cache, views_cache
+from tests.models import Author, Book
+
+
+class FakeStateView(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+    mount_count = 0
+
+    def mount(self):
+        self.mount_count += 1
+        self._private = "mounted"
+
+
+class OtherStateView(UnicornView):
+    name = "World"
+
+
+@pytest.fixture
+def state_cache(settings):
+    settings.UNICORN = {"STATE_CACHE": "default"}
+
+    yield
+
+    views_cache.pop("fake-state", None)
+    constructed_views_cache.clear()
+
+
+def _create_mounted_component():
+    component = FakeStateView(component_name="fake-state", component_id="asdf1234")
+    component.mount()
+    component.name = "Universe"
+
+    return component
+
+
+def test_serialize_state():
+    state = {"name": "World", "func": lambda: None}
+
+    assert deserialize_state(serialize_state(state)) == {"name": "World"}
+
+
+@pytest.mark.django_db
+def test_serialize_state_querysets(django_assert_num_queries):
+    author = Author.objects.create(name="Neil")
+    Book.objects.create(title="Neverwhere", author=author)
+    state = {
+        "books": Book.objects.filter(author=author).prefetch_related("author"),
+        "titles": Book.objects.values("title"),
+    }
+
+    # The querysets get stored without fetching their rows
+    with django_assert_num_queries(0):
+        state = deserialize_state(serialize_state(state))
+
+    assert state["books"]._result_cache is None
+    assert [book.author.name for book in state["books"]] == ["Neil"]
+    assert list(state["titles"]) == [{"title": "Neverwhere"}]
+
+
+@pytest.mark.django_db
+def test_serialize_state_evaluated_queryset(django_assert_num_queries):
+    Author.objects.create(name="Neil")
+    authors = Author.objects.all()
+    list(authors)
+
+    with django_assert_num_queries(0):
+        state = deserialize_state(serialize_state({"authors": authors}))
+        assert [author.name for author in state["authors"]] == ["Neil"]
+
+
+def test_set_component_state_disabled():
+    set_component_state(_create_mounted_component())
+
+    assert get_component_state(FakeStateView, "fake-state", "asdf1234") is None
+
+
+def test_set_component_state(state_cache):
+    set_component_state(_create_mounted_component())
+    state = get_component_state(FakeStateView, "fake-state", "asdf1234")
+
+    assert state["name"] == "Universe"
+    assert state["_private"] == "mounted"
+    assert state["mount_count"] == 1
+    assert "request" not in state
+    assert "_methods_cache" not in state
+
+
+def test_get_component_state_layout_changed(state_cache):
+    set_component_state(_create_mounted_component())
+
+    assert get_component_state(OtherStateView, "fake-state", "asdf1234") is None
+
+
+def test_get_layout_version():
+    assert get_layout_version(FakeStateView) != get_layout_version(OtherStateView)
+    assert get_layout_version(FakeStateView) == get_layout_version(FakeStateView)
+
+
+def test_create_restores_state_without_mounting(state_cache):
+    set_component_state(_create_mounted_component())
+    views_cache["fake-state"] = FakeStateView
+
+    component = UnicornView.create(component_name="fake-state", component_id="asdf1234")
+
+    assert component.name == "Universe"
+    assert component._private == "mounted"
+    assert component.mount_count == 1
+    assert component.component_id == "asdf1234"
+
+
+def test_render_init_js_sets_component_state(state_cache):
+    component = _create_mounted_component()
+    component.render(init_js=True)
+    constructed_views_cache.clear()
+    views_cache["fake-state"] = FakeStateView
+
+    component = UnicornView.create(component_name="fake-state", component_id="asdf1234")
+
+    assert component.name == "Universe"
+    assert component._private == "mounted"
+    assert component.mount_count == 1
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from django_unicorn.cacher import LRUCache, create_constructed_views_cache
+
+
+class FakeComponent:
+    def __init__(self, data):
+        self.data = data
+
+
+def test_get_set():
+    cache = LRUCache()
+    cache["a"] = 1
+
+    assert "a" in cache
+    assert cache["a"] == 1
+    assert cache.get("b") is None
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_getitem_missing():
+    cache = LRUCache()
+
+    with pytest.raises(KeyError):
+        cache["a"]
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+    assert cache.stats["evictions"]["max_entries"] == 1
+
+
+def test_ttl():
+    cache = LRUCache(ttl=0.01)
+    cache["a"] = 1
+    time.sleep(0.02)
+
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.stats["evictions"]["ttl"] == 1
+
+
+def test_ttl_is_idle_time():
+    cache = LRUCache(ttl=0.05)
+    cache["a"] = 1
+    time.sleep(0.03)
+    cache.get("a")
+    time.sleep(0.03)
+
+    assert cache.get("a") == 1
+
+
+def test_max_memory():
+    cache = LRUCache(max_memory=2000)
+    cache["a"] = FakeComponent("a" * 1000)
+    cache["b"] = FakeComponent("b" * 1000)
+
+    assert "a" not in cache
+    assert "b" in cache
+    assert cache.stats["evictions"]["max_memory"] == 1
+    assert 1000 < cache.stats["memory"] < 2000
+
+
+def test_pop():
+    cache = LRUCache()
+    cache["a"] = 1
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert len(cache) == 0
+
+
+def test_create_constructed_views_cache(settings):
+    settings.UNICORN = {"CONSTRUCTED_VIEWS_CACHE": {"MAX_ENTRIES": 5, "TTL": 10}}
+    cache = create_constructed_views_cache()
+
+    assert isinstance(cache, LRUCache)
+    assert cache.max_entries == 5
+    assert cache.ttl == 10
+    assert cache.max_memory is None
+
+
+def test_create_constructed_views_cache_default():
+    cache = create_constructed_views_cache()
+
+    assert cache.max_entries == 1000
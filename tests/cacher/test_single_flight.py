@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from django_unicorn.cacher import SingleFlight
+
+
+def test_do():
+    single_flight = SingleFlight()
+
+    assert single_flight.do("a", lambda: 1) == 1
+    assert single_flight.do("a", lambda: 2) == 2
+
+
+def test_do_ttl():
+    single_flight = SingleFlight()
+
+    assert single_flight.do("a", lambda: 1, ttl=10) == 1
+    assert single_flight.do("a", lambda: 2, ttl=10) == 1
+    assert single_flight.do("b", lambda: 3, ttl=10) == 3
+
+
+def test_do_ttl_expired():
+    single_flight = SingleFlight()
+
+    assert single_flight.do("a", lambda: 1, ttl=0.01) == 1
+    time.sleep(0.02)
+    assert single_flight.do("a", lambda: 2, ttl=0.01) == 2
+
+
+def test_do_concurrent_calls_share_result():
+    single_flight = SingleFlight()
+    calls = []
+    results = []
+
+    def func():
+        calls.append(1)
+        time.sleep(0.05)
+        return len(calls)
+
+    threads = [
+        threading.Thread(target=lambda: results.append(single_flight.do("a", func)))
+        for _ in range(5)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [1, 1, 1, 1, 1]
+
+
+def test_do_exception():
+    single_flight = SingleFlight()
+
+    def func():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        single_flight.do("a", func, ttl=10)
+
+    # Exceptions don't get cached
+    assert single_flight.do("a", lambda: 1, ttl=10) == 1
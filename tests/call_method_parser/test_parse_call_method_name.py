@@ -0,0 +1,66 @@
+import pytest
+
+from django_unicorn.call_method_parser import (
+    _parse_call_method_name,
+    parse_arg,
+    parse_call_method_name,
+)
+
+
+def test_parse_call_method_name_no_args():
+    assert parse_call_method_name("refresh") == ("refresh", [], {})
+    assert parse_call_method_name("refresh()") == ("refresh", [], {})
+
+
+@pytest.mark.parametrize(
+    "call_method_name,expected_args",
+    [
+        ("select(42)", [42]),
+        ("select(4.2)", [4.2]),
+        ("select('Bob')", ["Bob"]),
+        ('select("Bob, Jr.")', ["Bob, Jr."]),
+        ("select(True, None)", [True, None]),
+        ("select([1, 2], {'a': 1})", [[1, 2], {"a": 1}]),
+        ("select(-1)", [-1]),
+        ("select(name)", [None]),
+    ],
+)
+def test_parse_call_method_name_args(call_method_name, expected_args):
+    assert parse_call_method_name(call_method_name) == ("select", expected_args, {})
+
+
+def test_parse_call_method_name_kwargs():
+    assert parse_call_method_name("select(42, force=True)") == (
+        "select",
+        [42],
+        {"force": True},
+    )
+
+
+def test_parse_call_method_name_invalid():
+    assert parse_call_method_name("select(42") == ("select(42", [], {})
+    assert parse_call_method_name("select(,)") == ("select", [], {})
+
+
+def test_parse_call_method_name_cached():
+    _parse_call_method_name.cache_clear()
+
+    parse_call_method_name("select(42)")
+    parse_call_method_name("select(42)")
+
+    assert _parse_call_method_name.cache_info().hits == 1
+
+
+def test_parse_call_method_name_copies_mutable_args():
+    (_, args, _) = parse_call_method_name("select([1, 2])")
+    args[0].append(3)
+
+    assert parse_call_method_name("select([1, 2])") == ("select", [[1, 2]], {})
+
+
+@pytest.mark.parametrize(
+    "arg,expected",
+    [("'Bob'", "Bob"), ("42", 42), (" True ", True), ("Bob", None), ("", None)],
+)
+def test_parse_arg(arg, expected):
+    assert parse_arg(arg) == expected
@@ -3,7 +3,7 @@ import types
 import orjson
 import pytest
 
-from django_unicorn.components import UnicornView
+from django_unicorn.components import ComponentMetadata, UnicornView
 
 
 class ExampleComponent(UnicornView):
@@ -65,6 +65,52 @@ def test_init_properties():
     assert attributes["name"] == "World"
 
 
+def test_init_properties_not_evaluated():
+    class TestComponent(UnicornView):
+        evaluated = False
+
+        @property
+        def name(self):
+            TestComponent.evaluated = True
+            return "World"
+
+    component = TestComponent(component_name="hello-world")
+    assert component._attribute_names_cache == ["evaluated", "name"]
+    assert TestComponent.evaluated == False
+
+
+def test_init_instance_attributes():
+    component = ExampleComponent(component_name="example", color="blue")
+    assert component._attribute_names_cache == ["color", "name"]
+    assert component._attributes()["color"] == "blue"
+
+
+def test_init_metadata_cached_per_class():
+    first = ExampleComponent(component_name="example")
+    second = ExampleComponent(component_name="example")
+
+    assert first._get_metadata() is second._get_metadata()
+    assert first._get_metadata() is ComponentMetadata.get(ExampleComponent)
+
+
+def test_init_methods_static_and_class_methods():
+    class TestComponent(UnicornView):
+        def instance_method(self):
+            return "instance"
+
+        @classmethod
+        def class_method(cls):
+            return "class"
+
+        @staticmethod
+        def static_method():
+            return "static"
+
+    methods = TestComponent(component_name="hello-world")._methods()
+    assert sorted(methods) == ["class_method", "instance_method"]
+    assert methods["class_method"]() == "class"
+
+
 def test_init_methods_cache(component):
     assert len(component._methods_cache) == 1
 
@@ -101,3 +147,47 @@ def test_is_public_protected(component):
 
 def test_is_public_http_method_names(component):
     assert component._is_public("http_method_names") == False
+
+
+def test_attributes_snapshot():
+    class TestComponent(UnicornView):
+        name = "World"
+        evaluations = 0
+
+        @property
+        def greeting(self):
+            self.__class__.evaluations += 1
+            return f"Hello {self.name}"
+
+    component = TestComponent(component_name="hello-world")
+    component._start_attributes_snapshot()
+    component._attributes()
+    component.get_context_data()
+    component.get_frontend_context_variables()
+
+    assert TestComponent.evaluations == 1
+
+    component.name = "Universe"
+    assert component._attributes()["name"] == "Universe"
+    assert component._attributes()["greeting"] == "Hello Universe"
+    assert TestComponent.evaluations == 2
+
+    component._stop_attributes_snapshot()
+    assert component._attributes_snapshot is None
+
+
+def test_attributes_snapshot_stale():
+    class TestComponent(UnicornView):
+        items = []
+
+        @property
+        def count(self):
+            return len(self.items)
+
+    component = TestComponent(component_name="hello-world")
+    component._start_attributes_snapshot()
+    component.items.append(1)
+    assert component._attributes()["count"] == 0
+
+    component._mark_attributes_snapshot_stale()
+    assert component._attributes()["count"] == 1
@@ -0,0 +1,72 @@
+import logging
+
+import orjson
+import pytest
+
+from django_unicorn.components import PayloadSizeError, UnicornField, UnicornView
+from tests.models import Book
+
+
+class Shelf(UnicornField):
+    def __init__(self, shelf=None):
+        self.shelf = shelf
+
+
+class FakeComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+    rows = [f"row {i}" for i in range(100)]
+
+
+class BudgetComponent(FakeComponent):
+    class Meta:
+        payload_size_budget = 100
+
+
+class DepthComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    shelf = Shelf(Shelf(Book(id=1, title="Neverwhere", author_id=2)))
+
+    class Meta:
+        serialization_depth = 1
+
+
+def test_payload_size_under_budget(settings):
+    settings.UNICORN = {"PAYLOAD_SIZE_BUDGET": 10_000}
+    component = FakeComponent(component_id="asdf1234", component_name="hello-world")
+
+    assert orjson.loads(component.get_frontend_context_variables())["name"] == "World"
+
+
+def test_payload_size_over_budget_debug(settings):
+    settings.DEBUG = True
+    component = BudgetComponent(component_id="asdf1234", component_name="hello-world")
+
+    with pytest.raises(PayloadSizeError) as e:
+        component.get_frontend_context_variables()
+
+    message = str(e.value)
+    assert "'hello-world' component" in message
+    assert "over its budget of 100 bytes" in message
+    assert "Largest attributes: 'rows'" in message
+
+
+def test_payload_size_over_budget_logs_warning(settings, caplog):
+    settings.DEBUG = False
+    settings.UNICORN = {"PAYLOAD_SIZE_BUDGET": 100}
+    component = FakeComponent(component_id="asdf1234", component_name="hello-world")
+
+    frontend_context_variables = component.get_frontend_context_variables()
+
+    assert orjson.loads(frontend_context_variables)["rows"] == FakeComponent.rows
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelno == logging.WARNING
+    assert "Largest attributes: 'rows'" in caplog.records[0].getMessage()
+
+
+def test_serialization_depth_meta():
+    component = DepthComponent(component_id="asdf1234", component_name="hello-world")
+
+    assert orjson.loads(component.get_frontend_context_variables()) == {
+        "shelf": {"shelf": {"shelf": 1}}
+    }
@@ -0,0 +1,98 @@
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.testing import assert_render_queries
+from tests.models import Author, Book
+
+
+class BooksComponent(UnicornView):
+    template_name = "templates/test_books_component.html"
+    books = None
+    authors = None
+
+    def mount(self):
+        self.books = Book.objects.order_by("pk")
+        self.authors = Author.objects.order_by("pk")
+
+
+class RelatedLookupsBooksComponent(BooksComponent):
+    class Meta:
+        select_related = {"books": ["author"]}
+        prefetch_related = {"authors": ["books"]}
+
+
+@pytest.fixture
+def books(db):
+    for name in ("Neil", "Terry"):
+        author = Author.objects.create(name=name)
+        Book.objects.create(title=f"{name} 1", author=author)
+        Book.objects.create(title=f"{name} 2", author=author)
+
+
+def test_render_without_related_lookups(books):
+    component = BooksComponent(component_name="books")
+    component.mount()
+
+    # The books, an author per book, the authors and the books per author
+    assert_render_queries(component, 1 + 4 + 1 + 2)
+
+
+def test_render_with_related_lookups(books):
+    component = RelatedLookupsBooksComponent(component_name="books")
+    component.mount()
+
+    # The books with their authors, the authors and all of their books
+    rendered_component = assert_render_queries(component, 1 + 1 + 1)
+
+    assert "Neil 1 by Neil" in rendered_component
+    assert "Terry: Terry 1Terry 2" in rendered_component
+
+
+class PropertyBooksComponent(UnicornView):
+    template_name = "templates/test_books_component.html"
+
+    @property
+    def books(self):
+        return Book.objects.order_by("pk")
+
+    @property
+    def authors(self):
+        return Author.objects.order_by("pk")
+
+    class Meta:
+        select_related = {"books": ["author"]}
+        prefetch_related = {"authors": ["books"]}
+
+
+def test_render_with_related_lookups_for_properties(books, caplog):
+    component = PropertyBooksComponent(component_name="books")
+
+    rendered_component = assert_render_queries(component, 1 + 1 + 1)
+
+    assert "Neil 1 by Neil" in rendered_component
+    assert not caplog.records
+
+
+def test_related_lookups_applied_once(books):
+    component = RelatedLookupsBooksComponent(component_name="books")
+    component.mount()
+    attributes = component._attributes()
+    books = attributes["books"]
+
+    component._apply_related_lookups(attributes)
+
+    assert attributes["books"] is books
+    assert books.query.select_related == {"author": {}}
+
+    # The component itself doesn't change
+    assert component.books.query.select_related is False
+
+
+def test_assert_render_queries_fails(books):
+    component = BooksComponent(component_name="books")
+    component.mount()
+
+    with pytest.raises(AssertionError) as e:
+        assert_render_queries(component, 1)
+
+    assert "ran 8 queries instead of 1" in str(e.value)
@@ -0,0 +1,173 @@
+import pytest
+from django.template import engines
+
+from django_unicorn.components import UnicornTemplateResponse
+from django_unicorn.utils import add_root_placeholders, inject_root_attributes
+
+
+ATTRIBUTES = {"unicorn:id": "asdf", "unicorn:name": "hello", "unicorn:checksum": "1"}
+
+
+def _render(template_string, init_js=False):
+    template = engines["django"].from_string(template_string)
+    response = UnicornTemplateResponse(
+        template=template,
+        request=None,
+        context={"name": "World"},
+        component_name="hello",
+        component_id="asdf",
+        frontend_context_variables='{"name":"World"}',
+        init_js=init_js,
+    )
+    response.render()
+
+    return response.content.decode("utf-8")
+
+
+def test_inject_root_attributes():
+    actual = inject_root_attributes('<div class="a">\n<p>Hi</p>\n</div>', ATTRIBUTES)
+
+    assert (
+        actual
+        == '<div class="a" unicorn:id="asdf" unicorn:name="hello" unicorn:checksum="1">\n<p>Hi</p>\n</div>'
+    )
+
+
+def test_inject_root_attributes_leading_comment():
+    actual = inject_root_attributes("  <!-- hello -->\n<div>Hi</div>", ATTRIBUTES)
+
+    assert (
+        actual
+        == '  <!-- hello -->\n<div unicorn:id="asdf" unicorn:name="hello" unicorn:checksum="1">Hi</div>'
+    )
+
+
+def test_inject_root_attributes_quoted_greater_than():
+    actual = inject_root_attributes('<div data-x="a>b">Hi</div>', {"unicorn:id": "1"})
+
+    assert actual == '<div data-x="a>b" unicorn:id="1">Hi</div>'
+
+
+def test_inject_root_attributes_escapes_values():
+    actual = inject_root_attributes("<div>Hi</div>", {"unicorn:name": 'a"b'})
+
+    assert actual == '<div unicorn:name="a&quot;b">Hi</div>'
+
+
+def test_inject_root_attributes_after_root():
+    actual = inject_root_attributes(
+        "<div>Hi</div>\n", {"unicorn:id": "1"}, after_root="<script></script>"
+    )
+
+    assert actual == '<div unicorn:id="1">Hi</div><script></script>\n'
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "<p>Hi</p><div>Hi</div>",
+        "Hi<div>Hi</div>",
+        "<div unicorn:id='1'>Hi</div>",
+        "<divider>Hi</divider>",
+        "",
+    ],
+)
+def test_inject_root_attributes_unhandled(content):
+    assert inject_root_attributes(content, ATTRIBUTES) is None
+
+
+@pytest.mark.parametrize(
+    "content", ["<div>Hi</div><p>Hi</p>", "<div>a</div>\n<div>b</div>"],
+)
+def test_inject_root_attributes_after_root_unhandled(content):
+    assert inject_root_attributes(content, ATTRIBUTES, "<script></script>") is None
+
+
+def test_inject_root_attributes_after_root_nested():
+    actual = inject_root_attributes(
+        "<div><div>a</div><div/></div>", {"unicorn:id": "1"}, after_root="<script>"
+    )
+
+    assert actual == '<div unicorn:id="1"><div>a</div><div/></div><script>'
+
+
+def test_render():
+    actual = _render("<div>{{ name }}</div>")
+
+    assert actual.startswith(
+        '<div unicorn:id="asdf" unicorn:name="hello" unicorn:checksum="'
+    )
+    assert actual.endswith('">World</div>')
+
+
+def test_render_keeps_content_unchanged():
+    actual = _render("<div>&nbsp;<input disabled></div>")
+
+    assert actual.endswith(">&nbsp;<input disabled></div>")
+
+
+def test_render_init_js():
+    actual = _render("<div></div>", init_js=True)
+
+    assert "></div><script>" in actual
+    assert "Unicorn.componentInit(" in actual
+    assert actual.endswith("</script>")
+
+
+def test_render_falls_back_to_soup():
+    actual = _render("<p>Hi</p><div>Hi</div>", init_js=True)
+
+    assert actual.startswith("<p>Hi</p><div unicorn:id=")
+    assert ">Hi</div><script>" in actual
+
+
+def test_render_no_root_element():
+    with pytest.raises(Exception) as e:
+        _render("<p>Hi</p>")
+
+    assert e.exconly() == "Exception: No root element found"
+
+
+def test_add_root_placeholders():
+    actual = add_root_placeholders(
+        '{% load static %}\n<div class="{% if a > b %}a{% endif %}">{{ name }}</div>\n'
+    )
+
+    assert (
+        actual
+        == '{% load static %}\n<div class="{% if a > b %}a{% endif %}" data-unicorn-root-attributes-placeholder>{{ name }}</div><!--unicorn-init-script-placeholder-->\n'
+    )
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "{% extends 'base.html' %}",
+        "{% if a %}<div>Hi</div>{% endif %}",
+        "<p>Hi</p><div>Hi</div>",
+        "<div>Hi</div><p>Hi</p>",
+        "<div>a</div>\n<div>b</div>",
+    ],
+)
+def test_add_root_placeholders_not_static(source):
+    assert add_root_placeholders(source) is None
+
+
+def test_add_root_placeholders_no_root_element():
+    with pytest.raises(Exception) as e:
+        add_root_placeholders("{# comment #}<p>Hi</p>")
+
+    assert e.exconly() == "Exception: No root element found"
+
+
+def test_render_compiles_template_once():
+    source = "<div>{{ name }}!</div>"
+    _render(source)
+    _render(source)
+
+    template = engines["django"].from_string(source)
+    compiled_template = UnicornTemplateResponse._compile_template(template)
+
+    assert compiled_template is UnicornTemplateResponse._compile_template(template)
+    assert "placeholder" in compiled_template.template.source
+    assert "placeholder" not in _render(source, init_js=True)
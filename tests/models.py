@@ -0,0 +1,22 @@
+from django.db.models import CASCADE, ForeignKey, Model, OneToOneField
+from django.db.models.fields import CharField, IntegerField
+
+
+class Author(Model):
+    name = CharField(max_length=255)
+
+
+class Book(Model):
+    title = CharField(max_length=255)
+    pages = IntegerField(default=0)
+    author = ForeignKey(Author, on_delete=CASCADE, related_name="books")
+
+
+class Profile(Model):
+    author = OneToOneField(Author, on_delete=CASCADE)
+
+
+class Publisher(Model):
+    name = CharField(max_length=255)
+    city = CharField(max_length=255)
+    founded = IntegerField(default=0)
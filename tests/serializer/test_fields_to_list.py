@@ -0,0 +1,117 @@
+import logging
+
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.serializer import (
+    get_attnames,
+    model_fields_to_dict,
+    queryset_fields_to_list,
+)
+from tests.models import Author, Book
+
+
+@pytest.fixture
+def books(db):
+    author = Author.objects.create(name="Neil")
+    Book.objects.create(title="Neverwhere", pages=370, author=author)
+    Book.objects.create(title="Stardust", pages=250, author=author)
+
+    return Book.objects.order_by("pk")
+
+
+def test_get_attnames():
+    assert get_attnames(Book, ["id", "author"]) == ("id", "author_id")
+    assert get_attnames(Book, ["author__name"]) is None
+    assert get_attnames(Author, ["books"]) is None
+
+
+def test_queryset_fields_to_list(books, django_assert_num_queries):
+    with django_assert_num_queries(1) as captured:
+        actual = queryset_fields_to_list(books, ["title", "author__name"])
+
+    assert actual == [
+        {"title": "Neverwhere", "author__name": "Neil"},
+        {"title": "Stardust", "author__name": "Neil"},
+    ]
+    assert "pages" not in captured.captured_queries[0]["sql"]
+
+
+def test_queryset_fields_to_list_evaluated(books, django_assert_num_queries):
+    list(books)
+
+    with django_assert_num_queries(0):
+        actual = queryset_fields_to_list(books, ["title", "author"])
+
+    assert actual == [
+        {"title": "Neverwhere", "author": books[0].author_id},
+        {"title": "Stardust", "author": books[1].author_id},
+    ]
+
+
+def test_queryset_fields_to_list_chunk_size(books, settings):
+    settings.UNICORN = {"QUERYSET_CHUNK_SIZE": 1}
+
+    assert queryset_fields_to_list(books, ["pages"]) == [
+        {"pages": 370},
+        {"pages": 250},
+    ]
+
+
+def test_model_fields_to_dict():
+    book = Book(id=1, title="Neverwhere", pages=370, author_id=2)
+
+    assert model_fields_to_dict(book, ["title", "author"]) == {
+        "title": "Neverwhere",
+        "author": 2,
+    }
+
+
+class FieldsComponent(UnicornView):
+    books = None
+
+    class Meta:
+        fields = {"books": ["id", "title"]}
+
+
+class AllFieldsComponent(UnicornView):
+    books = None
+
+
+class RelatedComponent(UnicornView):
+    authors = None
+
+    class Meta:
+        serialize_related = True
+
+
+def test_get_frontend_context_variables_fields(books):
+    component = FieldsComponent(component_name="test", books=books)
+
+    assert orjson.loads(component.get_frontend_context_variables()) == {
+        "books": [
+            {"id": books[0].pk, "title": "Neverwhere"},
+            {"id": books[1].pk, "title": "Stardust"},
+        ]
+    }
+
+
+def test_get_frontend_context_variables_reports_queries(books, settings, caplog):
+    caplog.set_level(logging.DEBUG, logger="django_unicorn.components")
+    settings.DEBUG = True
+    component = AllFieldsComponent(component_name="test", books=books)
+    component.get_frontend_context_variables()
+
+    assert "ran 1 queries" in caplog.records[0].message
+    assert caplog.records[0].levelname == "DEBUG"
+
+
+def test_get_frontend_context_variables_reports_query_per_row(books, settings, caplog):
+    settings.DEBUG = True
+    component = RelatedComponent(component_name="test", authors=Author.objects.all())
+    component.get_frontend_context_variables()
+
+    # One for the authors, then the books and the profile of the author
+    assert "ran 3 queries for 1 querysets" in caplog.records[0].message
+    assert caplog.records[0].levelname == "WARNING"
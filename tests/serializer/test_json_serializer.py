@@ -0,0 +1,73 @@
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornField
+from django_unicorn.serializer import JsonSerializer
+from tests.models import Author, Book
+
+
+class Shelf(UnicornField):
+    def __init__(self, book, shelf=None):
+        self.book = book
+        self.shelf = shelf
+
+
+def _dumps(value, **kwargs):
+    return orjson.loads(orjson.dumps(value, default=JsonSerializer(**kwargs)))
+
+
+def test_json_serializer_model():
+    book = Book(id=1, title="Neverwhere", pages=370, author_id=2)
+
+    assert _dumps(book, max_depth=0) == {
+        "id": 1,
+        "title": "Neverwhere",
+        "pages": 370,
+        "author_id": 2,
+    }
+
+
+def test_json_serializer_unlimited_depth():
+    book = Book(id=1, title="Neverwhere", pages=370, author_id=2)
+    shelf = Shelf(Book(id=3, title="Stardust", author_id=2), Shelf(book))
+
+    assert _dumps(shelf) == {
+        "book": {"id": 3, "title": "Stardust", "pages": 0, "author_id": 2},
+        "shelf": {
+            "book": {"id": 1, "title": "Neverwhere", "pages": 370, "author_id": 2},
+            "shelf": None,
+        },
+    }
+
+
+def test_json_serializer_max_depth():
+    book = Book(id=1, title="Neverwhere", pages=370, author_id=2)
+    shelf = Shelf(Book(id=3, title="Stardust", author_id=2), Shelf(book))
+
+    assert _dumps(shelf, max_depth=1) == {
+        "book": {"id": 3, "title": "Stardust", "pages": 0, "author_id": 2},
+        "shelf": {"book": 1, "shelf": None},
+    }
+
+
+def test_json_serializer_max_depth_in_containers():
+    shelf = Shelf([Book(id=1, author_id=2), Book(id=3, author_id=2)])
+
+    assert _dumps({"shelf": shelf}, max_depth=0) == {"shelf": {"book": [1, 3], "shelf": None}}
+
+
+@pytest.mark.django_db
+def test_json_serializer_max_depth_queryset(django_assert_num_queries):
+    author = Author.objects.create(name="Neil")
+    book = Book.objects.create(title="Neverwhere", author=author)
+
+    with django_assert_num_queries(1):
+        assert _dumps(Shelf(Book.objects.all()), max_depth=0) == {
+            "book": [book.pk],
+            "shelf": None,
+        }
+
+
+def test_json_serializer_unknown_type():
+    with pytest.raises(TypeError):
+        _dumps(object())
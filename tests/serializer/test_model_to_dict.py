@@ -0,0 +1,72 @@
+import pytest
+from django.db.models import QuerySet
+
+from django_unicorn.serializer import (
+    get_model_plan,
+    model_to_dict,
+    queryset_to_list,
+)
+from tests.models import Author, Book, Profile
+
+
+def test_model_to_dict():
+    book = Book(id=1, title="Neverwhere", pages=370, author_id=2)
+
+    assert model_to_dict(book) == {
+        "id": 1,
+        "title": "Neverwhere",
+        "pages": 370,
+        "author_id": 2,
+    }
+
+
+def test_model_to_dict_skips_reverse_relations():
+    author = Author(id=2, name="Neil")
+
+    assert model_to_dict(author) == {"id": 2, "name": "Neil"}
+
+
+@pytest.mark.django_db
+def test_model_to_dict_include_related():
+    author = Author.objects.create(name="Neil")
+    book = Book.objects.create(title="Neverwhere", author=author)
+    Profile.objects.create(author=author)
+
+    author = Author.objects.prefetch_related("books").get(pk=author.pk)
+
+    assert model_to_dict(author, include_related=True) == {
+        "id": author.pk,
+        "name": "Neil",
+        "books": [book.pk],
+        "profile": author.profile.pk,
+    }
+
+
+@pytest.mark.django_db
+def test_model_to_dict_include_related_missing_one_to_one():
+    author = Author.objects.create(name="Neil")
+
+    assert model_to_dict(author, include_related=True) == {
+        "id": author.pk,
+        "name": "Neil",
+        "books": [],
+        "profile": None,
+    }
+
+
+def test_get_model_plan_cached():
+    assert get_model_plan(Book) is get_model_plan(Book)
+    assert get_model_plan(Book) is not get_model_plan(Book, include_related=True)
+
+
+def test_queryset_to_list():
+    queryset = QuerySet(model=Book)
+    queryset._result_cache = [
+        Book(id=1, title="Neverwhere", author_id=2),
+        Book(id=2, title="Stardust", author_id=2),
+    ]
+
+    assert queryset_to_list(queryset) == [
+        {"id": 1, "title": "Neverwhere", "pages": 0, "author_id": 2},
+        {"id": 2, "title": "Stardust", "pages": 0, "author_id": 2},
+    ]
@@ -0,0 +1,80 @@
+from django_unicorn.utils import get_dom_patches, parse_keyed_elements
+
+
+HTML = """<div unicorn:id="asdf" unicorn:checksum="1234">
+  <p>Hello</p>
+  <ul>
+    <li unicorn:key="a">A<br></li>
+    <li id="b"><span id="nested">B</span></li>
+  </ul>
+  <input id="c"/>
+</div><script>Unicorn.componentInit({});</script>"""
+
+
+def test_parse_keyed_elements():
+    (skeleton, keyed_elements) = parse_keyed_elements(HTML)
+
+    assert keyed_elements == [
+        ("a", '<li unicorn:key="a">A<br></li>'),
+        ("b", '<li id="b"><span id="nested">B</span></li>'),
+        ("c", '<input id="c"/>'),
+    ]
+    assert "unicorn:checksum" not in skeleton
+    assert "<script>" not in skeleton
+    assert "<p>Hello</p>" in skeleton
+
+
+def test_parse_keyed_elements_duplicate_keys():
+    assert parse_keyed_elements('<div><p id="a"></p><p id="a"></p></div>') is None
+
+
+def test_parse_keyed_elements_unmatched_end_tag():
+    assert parse_keyed_elements("<div></p></div>") is None
+
+
+def test_get_dom_patches():
+    new_html = HTML.replace("A<br>", "AA<br>").replace("1234", "5678")
+
+    dom_patches = get_dom_patches(
+        parse_keyed_elements(HTML), parse_keyed_elements(new_html)
+    )
+
+    assert dom_patches == [{"key": "a", "dom": '<li unicorn:key="a">AA<br></li>'}]
+
+
+def test_get_dom_patches_other_line_breaks():
+    html = (
+        "<div>\n<p>x\u2028y\r\nz\x0c</p>\n"
+        '<li id="r1">one</li>\n<li id="r2">two</li>\n</div>'
+    )
+    new_html = html.replace("two", "TWO")
+
+    dom_patches = get_dom_patches(
+        parse_keyed_elements(html), parse_keyed_elements(new_html)
+    )
+
+    assert dom_patches == [{"key": "r2", "dom": '<li id="r2">TWO</li>'}]
+
+
+def test_get_dom_patches_unchanged():
+    assert (
+        get_dom_patches(parse_keyed_elements(HTML), parse_keyed_elements(HTML)) == []
+    )
+
+
+def test_get_dom_patches_skeleton_changed():
+    new_html = HTML.replace("Hello", "Goodbye")
+
+    assert (
+        get_dom_patches(parse_keyed_elements(HTML), parse_keyed_elements(new_html))
+        is None
+    )
+
+
+def test_get_dom_patches_keys_changed():
+    new_html = HTML.replace('id="c"', 'id="d"')
+
+    assert (
+        get_dom_patches(parse_keyed_elements(HTML), parse_keyed_elements(new_html))
+        is None
+    )
@@ -0,0 +1,76 @@
+import pytest
+
+from django_unicorn.utils import get_json_patch
+
+
+def test_get_json_patch_unchanged():
+    data = {"name": "World", "items": [1, 2], "nested": {"a": 1}}
+
+    new_data = {"name": "World", "items": [1, 2], "nested": {"a": 1}}
+
+    assert get_json_patch(data, new_data) == []
+
+
+def test_get_json_patch_replace():
+    patch = get_json_patch(
+        {"name": "World", "count": 1}, {"name": "Universe", "count": 1}
+    )
+
+    assert patch == [{"op": "replace", "path": "/name", "value": "Universe"}]
+
+
+def test_get_json_patch_nested():
+    patch = get_json_patch(
+        {"author": {"name": "Neil", "books": [{"title": "A"}, {"title": "B"}]}},
+        {"author": {"name": "Neil", "books": [{"title": "A"}, {"title": "C"}]}},
+    )
+
+    assert patch == [
+        {"op": "replace", "path": "/author/books/1/title", "value": "C"},
+    ]
+
+
+def test_get_json_patch_list_append():
+    patch = get_json_patch({"items": [1, 2]}, {"items": [1, 2, 3, 4]})
+
+    assert patch == [
+        {"op": "add", "path": "/items/-", "value": 3},
+        {"op": "add", "path": "/items/-", "value": 4},
+    ]
+
+
+def test_get_json_patch_list_remove():
+    patch = get_json_patch({"items": [1, 2, 3]}, {"items": [9]})
+
+    assert patch == [
+        {"op": "replace", "path": "/items/0", "value": 9},
+        {"op": "remove", "path": "/items/2"},
+        {"op": "remove", "path": "/items/1"},
+    ]
+
+
+def test_get_json_patch_dict_remove_key():
+    patch = get_json_patch({"a": 1, "b": 2}, {"a": 1})
+
+    assert patch == [{"op": "remove", "path": "/b"}]
+
+
+@pytest.mark.parametrize(
+    "new", [{"a": 1, "b": 2, "c": 3}, {"b": 2, "a": 1}],
+)
+def test_get_json_patch_dict_keys_changed_replaces_dict(new):
+    patch = get_json_patch({"a": 1, "b": 2}, new)
+
+    assert patch == [{"op": "replace", "path": "", "value": new}]
+
+
+def test_get_json_patch_type_changed():
+    patch = get_json_patch({"a": 1}, {"a": [1]})
+
+    assert patch == [{"op": "replace", "path": "/a", "value": [1]}]
+
+
+def test_get_json_patch_escapes_keys():
+    patch = get_json_patch({"a/b~c": 1}, {"a/b~c": 2})
+
+    assert patch == [{"op": "replace", "path": "/a~1b~0c", "value": 2}]
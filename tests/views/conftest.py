@@ -0,0 +1,53 @@
+import orjson
+import pytest
+
+from django_unicorn.components import constructed_views_cache, views_cache
+from django_unicorn.utils import generate_checksum
+
+
+@pytest.fixture
+def register_component():
+    """
+    Registers component classes under a name for the message view. The names get
+    unregistered and the constructed components get cleared after the test.
+    """
+    component_names = []
+
+    def _register_component(component_name, component_class):
+        views_cache[component_name] = component_class
+        component_names.append(component_name)
+
+    yield _register_component
+
+    for component_name in component_names:
+        views_cache.pop(component_name, None)
+
+    constructed_views_cache.clear()
+
+
+@pytest.fixture
+def post_message(client):
+    """
+    Posts a message to the message view of a component. The checksum gets generated
+    from the data; any other keys of the body can be passed as keyword arguments.
+    """
+
+    def _post_message(
+        component_name, data=None, action_queue=None, component_id="asdf1234", **body
+    ):
+        message = {"id": component_id}
+
+        if data is not None:
+            message["data"] = data
+            message["checksum"] = generate_checksum(orjson.dumps(data))
+
+        if action_queue is not None:
+            message["actionQueue"] = action_queue
+
+        message.update(body)
+
+        return client.post(
+            f"/message/{component_name}", message, content_type="application/json"
+        )
+
+    return _post_message
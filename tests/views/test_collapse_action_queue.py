@@ -0,0 +1,109 @@
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.views import _collapse_action_queue
+
+
+def _sync_input(name, value):
+    return {"type": "syncInput", "payload": {"name": name, "value": value}}
+
+
+def _call_method(name):
+    return {"type": "callMethod", "payload": {"name": name}}
+
+
+def test_collapse_action_queue_sync_inputs():
+    action_queue = [
+        _sync_input("name", "W"),
+        _sync_input("city", "P"),
+        _sync_input("name", "Wo"),
+        _sync_input("name", "Wor"),
+    ]
+
+    assert _collapse_action_queue(action_queue) == [
+        _sync_input("city", "P"),
+        _sync_input("name", "Wor"),
+    ]
+
+
+def test_collapse_action_queue_keeps_sync_inputs_around_methods():
+    action_queue = [
+        _sync_input("name", "W"),
+        _call_method("save"),
+        _sync_input("name", "Wo"),
+        _sync_input("name", "Wor"),
+    ]
+
+    assert _collapse_action_queue(action_queue) == [
+        _sync_input("name", "W"),
+        _call_method("save"),
+        _sync_input("name", "Wor"),
+    ]
+
+
+def test_collapse_action_queue_none_values():
+    action_queue = [_sync_input("name", "W"), _sync_input("name", None)]
+
+    assert _collapse_action_queue(action_queue) == action_queue
+
+
+def test_collapse_action_queue_refreshes():
+    action_queue = [
+        _call_method("refresh"),
+        _call_method("refresh()"),
+        _call_method("refresh"),
+        _sync_input("name", "W"),
+        _call_method("refresh"),
+    ]
+
+    assert _collapse_action_queue(action_queue) == [
+        _call_method("refresh"),
+        _sync_input("name", "W"),
+        _call_method("refresh"),
+    ]
+
+
+class FakeCollapseComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+    updates = []
+
+    def updated_name(self, value):
+        self.updates.append(value)
+
+
+class FakeEveryUpdateComponent(FakeCollapseComponent):
+    class Meta:
+        collapse_actions = False
+
+
+@pytest.fixture
+def post(register_component, post_message):
+    register_component("fake-collapse", FakeCollapseComponent)
+    register_component("fake-every-update", FakeEveryUpdateComponent)
+    FakeCollapseComponent.updates = []
+
+    def _post(component_name):
+        action_queue = [
+            _sync_input("name", "U"),
+            _sync_input("name", "Un"),
+            _sync_input("name", "Uni"),
+        ]
+
+        return post_message(component_name, {"name": "World"}, action_queue).json()
+
+    return _post
+
+
+def test_message_collapses_actions(post):
+    body = post("fake-collapse")
+
+    assert "Uni" in body["dom"]
+    assert FakeCollapseComponent.updates == ["Uni"]
+
+
+def test_message_collapse_actions_opt_out(post):
+    body = post("fake-every-update")
+
+    assert "Uni" in body["dom"]
+    assert FakeCollapseComponent.updates == ["U", "Un", "Uni"]
@@ -0,0 +1,81 @@
+import pytest
+
+from django_unicorn.components import UnicornView, constructed_views_cache
+
+
+class FakeSnapshotComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+    first = ""
+    second = ""
+    items = []
+    _evaluations = 0
+
+    @property
+    def items_count(self):
+        FakeSnapshotComponent._evaluations += 1
+        return len(self.items)
+
+    def add_item(self):
+        self.items.append(self.name)
+
+
+DATA = {"first": "", "items": [], "items_count": 0, "name": "World", "second": ""}
+
+
+@pytest.fixture
+def snapshot_component(register_component):
+    register_component("fake-snapshot", FakeSnapshotComponent)
+    FakeSnapshotComponent._evaluations = 0
+
+    yield
+
+    FakeSnapshotComponent.items = []
+
+
+def test_message_evaluates_properties_once_per_change(
+    post_message, snapshot_component
+):
+    data = {"first": "", "items": [], "name": "World", "second": ""}
+    post_message("fake-snapshot", data, [])
+    FakeSnapshotComponent._evaluations = 0
+
+    post_message("fake-snapshot", data, [])
+
+    # Once for the snapshot and once after the data is set, but not once per
+    # serialization, validation and render
+    assert FakeSnapshotComponent._evaluations == 2
+
+
+def test_message_updates_snapshot_after_method(post_message, snapshot_component):
+    action_queue = [{"type": "callMethod", "payload": {"name": "add_item"}}]
+
+    body = post_message("fake-snapshot", DATA, action_queue).json()
+
+    assert body["data"]["items"] == ["World"]
+    assert body["data"]["items_count"] == 1
+
+
+def test_message_updates_snapshot_after_setter(post_message, snapshot_component):
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "name", "value": "Universe"}}
+    ]
+
+    body = post_message("fake-snapshot", DATA, action_queue).json()
+
+    assert body["data"]["name"] == "Universe"
+    assert "Universe" in body["dom"]
+
+
+
+@pytest.mark.parametrize("method_name", ["reset", "refresh"])
+def test_message_stops_snapshot_of_replaced_component(
+    post_message, snapshot_component, method_name
+):
+    action_queue = [{"type": "callMethod", "payload": {"name": method_name}}]
+
+    post_message("fake-snapshot", DATA, action_queue)
+
+    component = constructed_views_cache["fake-snapshot-asdf1234"]
+    assert component._attributes_snapshot is None
+    assert component._form_cache is None
@@ -0,0 +1,94 @@
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.utils import generate_checksum
+from django_unicorn.views import MESSAGE_BATCH_MAX_SIZE
+
+
+class FakeBatchComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+
+    def set_name(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def batch_component(register_component):
+    register_component("fake-batch", FakeBatchComponent)
+
+
+def _message(component_id, name, action_queue):
+    data = {"name": "World"}
+
+    return {
+        "name": name,
+        "id": component_id,
+        "data": data,
+        "checksum": generate_checksum(orjson.dumps(data)),
+        "actionQueue": action_queue,
+    }
+
+
+def test_message_batch(client, batch_component):
+    body = [
+        _message(
+            "asdf1234",
+            "fake-batch",
+            [{"type": "callMethod", "payload": {"name": "set_name('Universe')"}}],
+        ),
+        _message(
+            "qwer1234",
+            "fake-batch",
+            [{"type": "callMethod", "payload": {"name": "refresh"}}],
+        ),
+    ]
+
+    response = client.post("/message", body, content_type="application/json").json()
+
+    assert len(response) == 2
+    assert response[0]["id"] == "asdf1234"
+    assert "Universe" in response[0]["dom"]
+    assert response[1] == {"id": "qwer1234", "unchanged": True}
+
+
+def test_message_batch_errors(client, batch_component):
+    message = _message("asdf1234", "fake-batch", [])
+    message["checksum"] = "asdf"
+    body = [
+        message,
+        _message("qwer1234", "", []),
+        _message("zxcv1234", "fake-batch", []),
+    ]
+
+    body.append(_message("uiop1234", "fake-missing", []))
+
+    response = client.post("/message", body, content_type="application/json").json()
+
+    assert response[0] == {"id": "asdf1234", "error": "Checksum does not match"}
+    assert response[1] == {"id": "qwer1234", "error": "Missing component name"}
+    assert response[2] == {"id": "zxcv1234", "unchanged": True}
+    assert response[3]["id"] == "uiop1234"
+    assert "fake-missing" in response[3]["error"]
+
+
+def test_message_batch_too_many_messages(client, batch_component):
+    body = [
+        _message(f"asdf{i:04}", "fake-batch", [])
+        for i in range(MESSAGE_BATCH_MAX_SIZE + 1)
+    ]
+
+    response = client.post("/message", body, content_type="application/json").json()
+
+    assert response == {
+        "error": f"Too many messages in batch (maximum is {MESSAGE_BATCH_MAX_SIZE})"
+    }
+
+
+def test_message_batch_not_a_list(client):
+    response = client.post(
+        "/message", {"id": "asdf1234"}, content_type="application/json"
+    ).json()
+
+    assert response == {"error": "Missing component name in url"}
@@ -0,0 +1,47 @@
+import pytest
+
+from django_unicorn.components import UnicornView
+
+
+class FakeCallMethodComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+
+    def select(self, name, force=False):
+        if force:
+            self.name = name
+
+    def set_name(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def post(register_component, post_message):
+    register_component("fake-call-method", FakeCallMethodComponent)
+
+    def _post(call_method_name):
+        return post_message(
+            "fake-call-method",
+            {"name": "World"},
+            [{"type": "callMethod", "payload": {"name": call_method_name}}],
+        ).json()
+
+    return _post
+
+
+def test_message_call_method_kwarg(post):
+    body = post("select('Universe', force=True)")
+
+    assert "Universe" in body["dom"]
+
+
+def test_message_call_method_equals_in_arg(post):
+    body = post("set_name('a=b')")
+
+    assert "a=b" in body["dom"]
+
+
+def test_message_call_method_set_property(post):
+    body = post("name='a=b'")
+
+    assert "a=b" in body["dom"]
@@ -0,0 +1,57 @@
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.views import coalesced_requests
+
+
+class FakeStatusComponent(UnicornView):
+    template_name = "templates/test_poll_component.html"
+    status = "ok"
+    check_count = 0
+
+    def check(self):
+        FakeStatusComponent.check_count += 1
+
+    class Meta:
+        coalesce_requests = True
+        coalesce_ttl = 10
+
+
+@pytest.fixture
+def post(register_component, post_message):
+    register_component("fake-status", FakeStatusComponent)
+    FakeStatusComponent.check_count = 0
+
+    def _post(component_id, action_queue):
+        return post_message(
+            "fake-status", {"status": "ok"}, action_queue, component_id=component_id
+        ).json()
+
+    yield _post
+
+    coalesced_requests._calls.clear()
+
+
+def test_message_coalesce_requests(post):
+    action_queue = [{"type": "callMethod", "payload": {"name": "check"}}]
+
+    first_body = post("asdf1234", action_queue)
+    second_body = post("qwer1234", action_queue)
+
+    assert FakeStatusComponent.check_count == 1
+    assert first_body["id"] == "asdf1234"
+    assert 'unicorn:id="asdf1234"' in first_body["dom"]
+    assert second_body["id"] == "qwer1234"
+    assert 'unicorn:id="qwer1234"' in second_body["dom"]
+
+
+def test_message_coalesce_requests_sync_input(post):
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "status", "value": "ok"}},
+        {"type": "callMethod", "payload": {"name": "check"}},
+    ]
+
+    post("asdf1234", action_queue)
+    post("qwer1234", action_queue)
+
+    assert FakeStatusComponent.check_count == 2
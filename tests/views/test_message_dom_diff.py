@@ -0,0 +1,71 @@
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.utils import generate_checksum
+
+
+class FakeKeyedComponent(UnicornView):
+    template_name = "templates/test_keyed_component.html"
+    title = "Items"
+    items = ["a", "b", "c"]
+
+    def update_last(self):
+        self.items = ["a", "b", "z"]
+
+    def set_title(self):
+        self.title = "Other items"
+
+
+@pytest.fixture
+def post(settings, register_component, post_message):
+    settings.UNICORN = {"DOM_DIFF": True}
+    register_component("fake-keyed", FakeKeyedComponent)
+
+    def _post(data, method_name):
+        return post_message(
+            "fake-keyed",
+            data,
+            [{"type": "callMethod", "payload": {"name": method_name}}],
+        ).json()
+
+    return _post
+
+
+def _render_component():
+    component = FakeKeyedComponent(component_name="fake-keyed", component_id="asdf1234")
+    component.render(init_js=True)
+
+    return orjson.loads(component.get_frontend_context_variables())
+
+
+def test_message_dom_patches(post):
+    data = _render_component()
+
+    body = post(data, "update_last")
+
+    assert "dom" not in body
+    assert body["domPatches"] == [
+        {"key": "item-3", "dom": '<li unicorn:key="item-3">z</li>'}
+    ]
+    assert body["checksum"] == generate_checksum(
+        orjson.dumps({"items": ["a", "b", "z"], "title": "Items"})
+    )
+
+
+def test_message_dom_patches_unknown_last_render(post):
+    data = {"items": ["a", "b", "c"], "title": "Items"}
+
+    body = post(data, "update_last")
+
+    assert "domPatches" not in body
+    assert "<li unicorn:key=\"item-3\">z</li>" in body["dom"]
+
+
+def test_message_dom_patches_skeleton_changed(post):
+    data = _render_component()
+
+    body = post(data, "set_title")
+
+    assert "domPatches" not in body
+    assert "<h1>Other items</h1>" in body["dom"]
@@ -0,0 +1,69 @@
+import pytest
+
+from django_unicorn.components import UnicornView
+
+
+class FakePollComponent(UnicornView):
+    template_name = "templates/test_poll_component.html"
+    status = "ok"
+
+    def check(self):
+        pass
+
+    def fail(self):
+        self.status = "failed"
+
+
+@pytest.fixture
+def post(register_component, post_message):
+    register_component("fake-poll", FakePollComponent)
+
+    def _post(method_name, fingerprint=None):
+        return post_message(
+            "fake-poll",
+            {"status": "ok"},
+            [{"type": "callMethod", "payload": {"name": method_name}}],
+            fingerprint=fingerprint,
+        ).json()
+
+    return _post
+
+
+def test_message_fingerprint(post):
+    body = post("check")
+
+    assert body["fingerprint"]
+    assert "dom" in body
+
+    body = post("check", fingerprint=body["fingerprint"])
+
+    assert body == {"id": "asdf1234", "unchanged": True}
+
+
+def test_message_fingerprint_changed(post):
+    fingerprint = post("check")["fingerprint"]
+
+    body = post("fail", fingerprint=fingerprint)
+
+    assert "failed" in body["dom"]
+    assert body["fingerprint"] != fingerprint
+
+
+def test_render_fingerprint_is_stable():
+    component = FakePollComponent(component_name="fake-poll", component_id="asdf1234")
+    component.render()
+    fingerprint = component._fingerprint
+
+    component.render()
+    assert component._fingerprint == fingerprint
+
+    component.status = "failed"
+    component.render()
+    assert component._fingerprint != fingerprint
+
+
+def test_render_init_js_includes_fingerprint():
+    component = FakePollComponent(component_name="fake-poll", component_id="asdf1234")
+    rendered_component = component.render(init_js=True)
+
+    assert f'"fingerprint":"{component._fingerprint}"' in rendered_component
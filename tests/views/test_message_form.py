@@ -0,0 +1,146 @@
+import pytest
+from django import forms
+
+from django_unicorn.components import UnicornView
+
+
+CLEANED = []
+
+
+class FakeForm(forms.Form):
+    name = forms.CharField(max_length=10)
+    city = forms.CharField(required=False)
+    age = forms.IntegerField(required=False)
+
+    def clean_name(self):
+        CLEANED.append("name")
+        return self.cleaned_data["name"]
+
+
+class FakeFormComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    form_class = FakeForm
+    name = "World"
+    city = ""
+    age = 3
+
+
+DATA = {"age": 3, "city": "", "name": "World"}
+
+
+@pytest.fixture
+def form_component(register_component):
+    register_component("fake-form", FakeFormComponent)
+    CLEANED.clear()
+
+
+def test_message_form_validated_once_per_change(post_message, form_component):
+    post_message("fake-form", DATA, [])
+    CLEANED.clear()
+
+    body = post_message(
+        "fake-form",
+        DATA,
+        [{"type": "syncInput", "payload": {"name": "name", "value": "Universe"}}],
+    ).json()
+
+    assert body["errors"] == {}
+    # Only for the new name, but not for every property, serialization, validation
+    # and render
+    assert len(CLEANED) == 1
+
+
+def test_message_form_errors(post_message, form_component):
+    body = post_message(
+        "fake-form",
+        DATA,
+        [
+            {
+                "type": "syncInput",
+                "payload": {"name": "name", "value": "Much too long"},
+            }
+        ],
+    ).json()
+
+    assert body["errors"]["name"][0]["code"] == "max_length"
+
+
+def test_message_form_errors_after_mutation(form_component):
+    component = FakeFormComponent(component_name="fake-form")
+    component._start_attributes_snapshot()
+    assert not component.validate()
+
+    component.name = "Much too long"
+    assert component.validate()["name"][0]["code"] == "max_length"
+
+    component._stop_attributes_snapshot()
+    assert component._form_cache is None
+
+
+class FakeIncrementalForm(FakeForm):
+    def clean_city(self):
+        CLEANED.append("city")
+        return self.cleaned_data["city"]
+
+    def clean(self):
+        CLEANED.append("clean")
+        cleaned_data = super().clean()
+
+        if cleaned_data.get("city") == cleaned_data.get("name"):
+            raise forms.ValidationError("Name and city must differ", code="same")
+
+        return cleaned_data
+
+
+class FakeIncrementalComponent(FakeFormComponent):
+    form_class = FakeIncrementalForm
+
+    class Meta:
+        incremental_validation = True
+        clean_dependencies = ["name", "city"]
+
+
+def test_validate_incrementally(form_component):
+    component = FakeIncrementalComponent(component_name="fake-incremental")
+    assert component.validate() == {}
+    assert sorted(CLEANED) == ["city", "clean", "name"]
+    CLEANED.clear()
+
+    component.age = 4
+    assert component.validate() == {}
+    assert CLEANED == []
+
+    component.city = "Paris"
+    assert component.validate() == {}
+    assert CLEANED == ["city", "clean"]
+    CLEANED.clear()
+
+    component.name = "Much too long"
+    errors = component.validate()
+    assert CLEANED == ["clean"]
+    assert errors["name"][0]["code"] == "max_length"
+
+
+def test_validate_incrementally_non_field_errors(form_component):
+    component = FakeIncrementalComponent(component_name="fake-incremental")
+    component.city = "World"
+    errors = component.validate()
+
+    assert errors["__all__"][0]["code"] == "same"
+
+    # The cached errors are used when nothing changed
+    component.errors = {}
+    CLEANED.clear()
+    assert component.validate()["__all__"][0]["code"] == "same"
+    assert CLEANED == []
+
+
+def test_validate_incrementally_field_errors_cached(form_component):
+    component = FakeIncrementalComponent(component_name="fake-incremental")
+    component.name = "Much too long"
+    assert component.validate()["name"][0]["code"] == "max_length"
+
+    component.errors = {}
+    component.age = 5
+    assert component.validate()["name"][0]["code"] == "max_length"
+    assert CLEANED.count("name") == 0
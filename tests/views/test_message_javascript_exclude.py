@@ -0,0 +1,114 @@
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.utils import generate_checksum
+
+
+class FakeJavascriptExcludeComponent(UnicornView):
+    template_name = "templates/test_javascript_exclude_component.html"
+    country = "nl"
+    countries = {"be": "Belgium", "nl": "Netherlands"}
+
+    class Meta:
+        javascript_exclude = ("countries",)
+
+
+class FakeMountedJavascriptExcludeComponent(UnicornView):
+    template_name = "templates/test_javascript_exclude_component.html"
+    country = "nl"
+    countries = {}
+
+    def mount(self):
+        self.countries = {"be": "Belgium", "nl": "Netherlands"}
+
+    class Meta:
+        javascript_exclude = ("countries",)
+
+
+class FakeCounterComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    reads = 0
+
+    @property
+    def name(self):
+        FakeCounterComponent.reads += 1
+
+        return f"read {FakeCounterComponent.reads}"
+
+    class Meta:
+        javascript_exclude = ("name", "reads")
+
+
+@pytest.fixture
+def javascript_exclude_component(register_component):
+    register_component("fake-javascript-exclude", FakeJavascriptExcludeComponent)
+
+
+def test_javascript_exclude_frontend_context_variables():
+    component = FakeJavascriptExcludeComponent(
+        component_id="asdf1234", component_name="fake-javascript-exclude"
+    )
+
+    assert orjson.loads(component.get_frontend_context_variables()) == {
+        "country": "nl"
+    }
+    assert component.get_context_data()["countries"] == {
+        "be": "Belgium",
+        "nl": "Netherlands",
+    }
+
+
+def test_javascript_exclude_render():
+    component = FakeJavascriptExcludeComponent(
+        component_id="asdf1234", component_name="fake-javascript-exclude"
+    )
+
+    html = component.render()
+
+    assert '<span id="country-name">Netherlands</span>' in html
+    assert "Belgium" not in html
+    assert generate_checksum(orjson.dumps({"country": "nl"})) in html
+
+
+def test_message_javascript_exclude(post_message, javascript_exclude_component):
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "country", "value": "be"}}
+    ]
+
+    response = post_message(
+        "fake-javascript-exclude", {"country": "nl"}, action_queue
+    ).json()
+
+    assert response["data"] == {"country": "be"}
+    assert '<span id="country-name">Belgium</span>' in response["dom"]
+
+
+def test_message_javascript_exclude_refresh(post_message, register_component):
+    register_component("fake-counter", FakeCounterComponent)
+    action_queue = [{"type": "callMethod", "payload": {"name": "refresh"}}]
+
+    body = post_message("fake-counter", {}, action_queue).json()
+    assert "unchanged" not in body
+    assert "read " in body["dom"]
+
+    body = post_message(
+        "fake-counter", {}, action_queue, fingerprint=body["fingerprint"]
+    ).json()
+    assert "unchanged" not in body
+
+
+def test_message_javascript_exclude_mount(post_message, register_component):
+    register_component(
+        "fake-mounted-javascript-exclude", FakeMountedJavascriptExcludeComponent
+    )
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "country", "value": "be"}}
+    ]
+
+    response = post_message(
+        "fake-mounted-javascript-exclude", {"country": "nl"}, action_queue
+    ).json()
+
+    assert response["data"] == {"country": "be"}
+    assert '<span id="country-name">Belgium</span>' in response["dom"]
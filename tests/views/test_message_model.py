@@ -0,0 +1,94 @@
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornView
+from tests.models import Author, Book, Profile
+
+
+class FakeAuthorComponent(UnicornView):
+    template_name = "templates/test_author_component.html"
+    author = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.author = Author.objects.prefetch_related("books").first()
+
+    class Meta:
+        serialize_related = True
+
+
+@pytest.fixture
+def author_component(db, register_component):
+    author = Author.objects.create(name="Neil")
+    Book.objects.create(title="Neverwhere", author=author)
+    Profile.objects.create(author=author)
+    register_component("fake-author", FakeAuthorComponent)
+
+    return author
+
+
+def _render_data():
+    component = FakeAuthorComponent(component_name="fake-author")
+
+    return orjson.loads(component.get_frontend_context_variables())
+
+
+def test_message_model_serialize_related(post_message, author_component):
+    data = _render_data()
+    assert data["author"]["books"] == [author_component.books.get().pk]
+
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "author.name", "value": "Terry"}}
+    ]
+
+    response = post_message("fake-author", data, action_queue)
+    body = response.json()
+
+    assert response.status_code == 200
+    assert "Terry" in body["dom"]
+    assert body["data"]["author"]["name"] == "Terry"
+
+
+class FakeBookComponent(UnicornView):
+    template_name = "templates/test_book_component.html"
+    book = None
+    secret = "secret"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.book = Book.objects.select_related("author").first()
+
+    class Meta:
+        exclude = ("secret",)
+        fields = {"book": ["id", "title", "author"], "secret": ["id"], "typo": ["id"]}
+
+
+@pytest.fixture
+def book_component(author_component, register_component):
+    register_component("fake-book", FakeBookComponent)
+
+    return author_component.books.get()
+
+
+def test_message_model_fields(post_message, book_component):
+    component = FakeBookComponent(component_name="fake-book")
+    data = orjson.loads(component.get_frontend_context_variables())
+
+    # Names in `Meta.fields` that aren't serialized don't get added
+    assert data == {
+        "book": {
+            "id": book_component.pk,
+            "title": "Neverwhere",
+            "author": book_component.author_id,
+        }
+    }
+
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "book.title", "value": "Stardust"}}
+    ]
+
+    response = post_message("fake-book", data, action_queue)
+    body = response.json()
+
+    assert response.status_code == 200
+    assert "Stardust by Neil" in body["dom"]
@@ -0,0 +1,65 @@
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.utils import generate_checksum
+
+
+class FakeListComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+    items = [f"item-{i}" for i in range(100)]
+
+    def set_name(self, name):
+        self.name = name
+
+    def clear_items(self):
+        self.items = []
+
+
+DATA = {"items": FakeListComponent.items, "name": "World"}
+
+
+@pytest.fixture
+def list_component(settings, register_component):
+    settings.UNICORN = {"JSON_PATCH": True}
+    register_component("fake-list", FakeListComponent)
+
+
+def test_message_patch(post_message, list_component):
+    action_queue = [{"type": "callMethod", "payload": {"name": "set_name('Neil')"}}]
+
+    body = post_message("fake-list", DATA, action_queue).json()
+
+    assert "data" not in body
+    assert body["patch"] == [{"op": "replace", "path": "/name", "value": "Neil"}]
+    assert body["baseChecksum"] == generate_checksum(orjson.dumps(DATA))
+
+
+def test_message_patch_larger_than_data(post_message, list_component):
+    action_queue = [{"type": "callMethod", "payload": {"name": "clear_items"}}]
+
+    body = post_message("fake-list", DATA, action_queue).json()
+
+    assert "patch" not in body
+    assert "baseChecksum" not in body
+    assert body["data"] == {"items": [], "name": "World"}
+
+
+def test_message_patch_full_data(post_message, list_component):
+    action_queue = [{"type": "callMethod", "payload": {"name": "set_name('Neil')"}}]
+
+    body = post_message("fake-list", DATA, action_queue, fullData=True).json()
+
+    assert "patch" not in body
+    assert body["data"] == {"items": FakeListComponent.items, "name": "Neil"}
+
+
+def test_message_patch_disabled(post_message, register_component):
+    register_component("fake-list", FakeListComponent)
+    action_queue = [{"type": "callMethod", "payload": {"name": "set_name('Neil')"}}]
+
+    body = post_message("fake-list", DATA, action_queue).json()
+
+    assert "patch" not in body
+    assert body["data"] == {"items": FakeListComponent.items, "name": "Neil"}
@@ -0,0 +1,72 @@
+import orjson
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.utils import generate_checksum
+
+
+class FakeComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+
+    def set_name(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def server_state(settings, register_component):
+    settings.UNICORN = {"SERVER_STATE": True}
+    register_component("fake-server-state", FakeComponent)
+
+
+def _render_component():
+    component = FakeComponent(
+        component_name="fake-server-state", component_id="asdf1234"
+    )
+    component.render()
+
+    return generate_checksum(str.encode(component.get_frontend_context_variables()))
+
+
+def test_message_server_state(post_message, server_state):
+    checksum = _render_component()
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "name", "value": "Universe"}}
+    ]
+
+    response = post_message(
+        "fake-server-state", action_queue=action_queue, checksum=checksum
+    )
+    body = response.json()
+
+    assert not body.get("error")
+    assert not body.get("resync")
+    assert body["data"] == {"name": "Universe"}
+
+    # The next message only needs the new checksum
+    checksum = generate_checksum(orjson.dumps(body["data"]))
+    response = post_message("fake-server-state", checksum=checksum)
+
+    assert not response.json().get("resync")
+
+
+def test_message_server_state_resync(post_message, server_state):
+    _render_component()
+
+    response = post_message("fake-server-state", checksum="stale123")
+
+    assert response.json() == {"id": "asdf1234", "resync": True}
+
+
+def test_message_server_state_with_data(post_message, server_state):
+    response = post_message(
+        "fake-server-state", {"name": "World"}, component_id="qwer1234"
+    )
+
+    assert response.json() == {"id": "qwer1234", "unchanged": True}
+
+
+def test_message_server_state_disabled(post_message):
+    response = post_message("fake-server-state", checksum="asdf1234")
+
+    assert response.json() == {"error": "Missing data"}
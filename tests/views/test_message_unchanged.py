@@ -0,0 +1,57 @@
+import pytest
+
+from django_unicorn.components import UnicornView
+
+
+class FakeUnchangedComponent(UnicornView):
+    template_name = "templates/test_component.html"
+    name = "World"
+
+    def set_name(self, name):
+        self.name = name
+
+
+DATA = {"name": "World"}
+
+
+@pytest.fixture
+def unchanged_component(register_component):
+    register_component("fake-unchanged", FakeUnchangedComponent)
+
+
+def test_message_unchanged_sync_input_same_value(post_message, unchanged_component):
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "name", "value": "World"}}
+    ]
+
+    body = post_message("fake-unchanged", DATA, action_queue).json()
+
+    assert body == {"id": "asdf1234", "unchanged": True}
+
+
+def test_message_unchanged_refresh(post_message, unchanged_component):
+    action_queue = [{"type": "callMethod", "payload": {"name": "refresh"}}]
+
+    body = post_message("fake-unchanged", DATA, action_queue).json()
+
+    assert body == {"id": "asdf1234", "unchanged": True}
+
+
+def test_message_changed_sync_input(post_message, unchanged_component):
+    action_queue = [
+        {"type": "syncInput", "payload": {"name": "name", "value": "Universe"}}
+    ]
+
+    body = post_message("fake-unchanged", DATA, action_queue).json()
+
+    assert "unchanged" not in body
+    assert "Universe" in body["dom"]
+
+
+def test_message_method_called(post_message, unchanged_component):
+    action_queue = [{"type": "callMethod", "payload": {"name": "set_name('World')"}}]
+
+    body = post_message("fake-unchanged", DATA, action_queue).json()
+
+    assert "unchanged" not in body
+    assert "dom" in body
@@ -0,0 +1,60 @@
+from django_unicorn.components import (
+    PROPERTY_PATHS_MAX_ENTRIES,
+    UnicornField,
+    UnicornView,
+)
+from django_unicorn.views import PropertyPath, _set_property_from_payload
+
+
+class Author(UnicornField):
+    name = "Neil"
+
+
+class PropertyPathView(UnicornView):
+    author = Author()
+    calls = []
+
+    def updated_author_name(self, value):
+        self.calls.append(value)
+
+
+def test_property_path():
+    component = PropertyPathView(component_name="test", component_id="12345678")
+    property_path = PropertyPath.get(component, "author.name")
+
+    assert property_path.parent_names == ["author"]
+    assert property_path.name == "name"
+    assert property_path.updating_function_name is None
+    assert property_path.updated_function_name == "updated_author_name"
+
+
+def test_property_path_cached_per_class():
+    component = PropertyPathView(component_name="test", component_id="12345678")
+    other_component = PropertyPathView(component_name="test", component_id="87654321")
+
+    assert PropertyPath.get(component, "author.name") is PropertyPath.get(
+        other_component, "author.name"
+    )
+
+
+def test_property_path_cache_bounded():
+    component = PropertyPathView(component_name="test", component_id="12345678")
+
+    for i in range(PROPERTY_PATHS_MAX_ENTRIES + 10):
+        PropertyPath.get(component, f"author.name{i}")
+
+    assert len(component._get_metadata().property_paths) == PROPERTY_PATHS_MAX_ENTRIES
+
+
+def test_set_property_from_payload_calls_hooks():
+    component = PropertyPathView(component_name="test", component_id="12345678")
+    component.calls = []
+    data = {"author": {"name": "Neil"}}
+
+    _set_property_from_payload(
+        component, {"name": "author.name", "value": "Neil Gaiman"}, data
+    )
+
+    assert component.author.name == "Neil Gaiman"
+    assert component.calls == ["Neil Gaiman"]
+    assert data == {"author": {"name": "Neil Gaiman"}}
@@ -1,10 +1,7 @@
 from datetime import datetime
 
 from django_unicorn.components import UnicornField, UnicornView
-from django_unicorn.views import (
-    _set_property_from_data,
-    _set_property_from_payload,
-)
+from django_unicorn.views import _set_property_from_payload
 
 
 class NestedPropertyView(UnicornView):
@@ -13,11 +10,11 @@ class NestedPropertyView(UnicornView):
     datetime = datetime(2020, 1, 1)
 
 
-def test_set_property_from_data_str():
+def test_hydrate_many_str():
     component = NestedPropertyView(component_name="test", component_id="12345678")
     assert "property_view" == component.string
 
-    _set_property_from_data(component, "string", "property_view_updated")
+    component._hydrate_many({"string": "property_view_updated"})
 
     assert "property_view_updated" == component.string
 
@@ -32,11 +29,11 @@ def test_set_property_from_payload_str():
     assert "property_view_updated" == component.string
 
 
-def test_set_property_from_data_int():
+def test_hydrate_many_int():
     component = NestedPropertyView(component_name="test", component_id="12345678")
     assert 99 == component.integer
 
-    _set_property_from_data(component, "integer", 100)
+    component._hydrate_many({"integer": 100})
 
     assert 100 == component.integer
 
@@ -51,11 +48,11 @@ def test_set_property_from_payload_int():
     assert 100 == component.integer
 
 
-def test_set_property_from_data_datetime():
+def test_hydrate_many_datetime():
     component = NestedPropertyView(component_name="test", component_id="12345678")
     assert datetime(2020, 1, 1) == component.datetime
 
-    _set_property_from_data(component, "datetime", datetime(2020, 1, 2))
+    component._hydrate_many({"datetime": datetime(2020, 1, 2)})
 
     assert datetime(2020, 1, 2) == component.datetime
 
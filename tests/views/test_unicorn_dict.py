@@ -1,5 +1,5 @@
 from django_unicorn.components import UnicornView
-from django_unicorn.views import _set_property_from_data, _set_property_from_payload
+from django_unicorn.views import _set_property_from_payload
 
 
 class DictPropertyView(UnicornView):
@@ -7,23 +7,21 @@ class DictPropertyView(UnicornView):
     nested_dictionary = {"nested": {"name": "nested_dictionary"}}
 
 
-def test_set_property_from_data_dict():
+def test_hydrate_many_dict():
     component = DictPropertyView(component_name="test", component_id="12345678")
     assert "dictionary" == component.dictionary.get("name")
 
-    _set_property_from_data(component, "dictionary", {"name": "dictionary_updated"})
+    component._hydrate_many({"dictionary": {"name": "dictionary_updated"}})
 
     assert "dictionary_updated" == component.dictionary.get("name")
 
 
-def test_set_property_from_data_nested_dict():
+def test_hydrate_many_nested_dict():
     component = DictPropertyView(component_name="test", component_id="12345678")
     assert "nested_dictionary" == component.nested_dictionary.get("nested").get("name")
 
-    _set_property_from_data(
-        component,
-        "nested_dictionary",
-        {"nested": {"name": "nested_dictionary_updated"}},
+    component._hydrate_many(
+        {"nested_dictionary": {"nested": {"name": "nested_dictionary_updated"}}}
     )
 
     assert "nested_dictionary_updated" == component.nested_dictionary.get("nested").get(
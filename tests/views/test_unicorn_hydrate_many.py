@@ -0,0 +1,64 @@
+from django import forms
+
+from django_unicorn.components import UnicornField, UnicornView
+
+
+class NestedProperty(UnicornField):
+    name = "nested"
+
+
+class HydrateForm(forms.Form):
+    count = forms.IntegerField()
+
+
+class HydrateView(UnicornView):
+    form_class = HydrateForm
+    name = "World"
+    count = 1
+    nested = NestedProperty()
+    calls = []
+
+    def updated_name(self, value):
+        self.calls.append(("name", value))
+
+    @property
+    def computed(self):
+        return "computed"
+
+
+def test_hydrate_many():
+    component = HydrateView(component_name="test", component_id="12345678")
+    component.calls = []
+
+    component._hydrate_many(
+        {
+            "name": "Universe",
+            "count": "2",
+            "nested": {"name": "nested_updated"},
+            "computed": "computed",
+        }
+    )
+
+    assert component.name == "Universe"
+    assert component.count == 2
+    assert component.nested.name == "nested_updated"
+    assert component.calls == [("name", "Universe")]
+
+
+def test_hydrate_many_skips_unchanged(caplog):
+    component = HydrateView(component_name="test", component_id="12345678")
+    component.calls = []
+
+    component._hydrate_many({"name": "World", "count": 1, "computed": "computed"})
+
+    assert component.calls == []
+    assert not caplog.records
+
+
+def test_hydrate_many_property_without_setter(caplog):
+    component = HydrateView(component_name="test", component_id="12345678")
+
+    component._hydrate_many({"computed": "changed"})
+
+    assert component.computed == "computed"
+    assert "could not be set" in caplog.records[0].message
@@ -2,7 +2,6 @@ from django.db.models import Model
 from django.db.models.fields import CharField
 
 from django_unicorn.components import UnicornView
-from django_unicorn.views import _set_property_from_data
 
 
 class FakeModel(Model):
@@ -16,10 +15,10 @@ class ModelPropertyView(UnicornView):
     model = FakeModel(name="fake_model")
 
 
-def test_set_property_from_data_model():
+def test_hydrate_many_model():
     component = ModelPropertyView(component_name="test", component_id="12345678")
     assert "fake_model" == component.model.name
 
-    _set_property_from_data(component, "model", {"name": "fake_model_updated"})
+    component._hydrate_many({"model": {"name": "fake_model_updated"}})
 
     assert "fake_model_updated" == component.model.name